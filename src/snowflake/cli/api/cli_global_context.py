@@ -1,17 +1,30 @@
+import os
 import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from snowflake.cli.api.exceptions import InvalidSchemaError
 from snowflake.cli.api.output.formats import OutputFormat
+from snowflake.cli.api.query_trace import QueryTraceFormat, QueryTracer
+from snowflake.cli.api.session_state import SessionState
+from snowflake.cli.api.utils.file_index import FileIndex
 from snowflake.connector import SnowflakeConnection
+from snowflake.connector.errors import Error
 
 schema_pattern = re.compile(r".+\..+")
 
 
 class _ConnectionContext:
+    # Connections kept open between commands executed by the same process, with
+    # role, warehouse, database and schema they started with, keyed by connection
+    # attributes. Enabled only by long-running server mode.
+    _persistent_connections: Optional[
+        Dict[tuple, Tuple[SnowflakeConnection, Dict[str, Optional[str]]]]
+    ] = None
+
     def __init__(self):
         self._cached_connection: Optional[SnowflakeConnection] = None
+        self._session_state = SessionState()
 
         self._connection_name: Optional[str] = None
         self._account: Optional[str] = None
@@ -32,10 +45,17 @@ class _ConnectionContext:
     def __setattr__(self, key, value):
         """
         We invalidate connection cache every time connection attributes change.
+        State of the previous connection does not describe the new one.
         """
         super().__setattr__(key, value)
-        if key != "_cached_connection":
+        if key not in ("_cached_connection", "_session_state"):
             self._cached_connection = None
+        if key != "_session_state":
+            self._session_state = SessionState()
+
+    @property
+    def session_state(self) -> SessionState:
+        return self._session_state
 
     @property
     def connection_name(self) -> Optional[str]:
@@ -152,9 +172,62 @@ class _ConnectionContext:
     @property
     def connection(self) -> SnowflakeConnection:
         if not self._cached_connection:
-            self._cached_connection = self._build_connection()
+            self._cached_connection = self._get_persistent_or_build_connection()
         return self._cached_connection
 
+    @classmethod
+    def enable_persistent_connections(cls):
+        if cls._persistent_connections is None:
+            cls._persistent_connections = {}
+
+    @classmethod
+    def close_persistent_connections(cls):
+        for connection, _ in (cls._persistent_connections or {}).values():
+            connection.close()
+        cls._persistent_connections = None
+
+    def _persistent_connection_key(self) -> tuple:
+        return (
+            self.connection_name,
+            self.temporary_connection,
+            self._mfa_passcode,
+            self._enable_diag,
+            self._diag_log_path,
+            self._diag_allowlist_path,
+            *self._collect_not_empty_connection_attributes().items(),
+            *sorted(
+                (key, value)
+                for key, value in os.environ.items()
+                if key.startswith("SNOWFLAKE_")
+            ),
+        )
+
+    def _get_persistent_or_build_connection(self) -> SnowflakeConnection:
+        if self._persistent_connections is None:
+            return self._build_connection()
+
+        from snowflake.cli.app.session_cache import restore_context, session_context
+
+        key = self._persistent_connection_key()
+        pooled = self._persistent_connections.pop(key, None)
+        if pooled is not None:
+            connection, context = pooled
+            # previous commands may have switched the session to other objects
+            try:
+                restored = not connection.is_closed() and restore_context(
+                    connection, context
+                )
+            except Error:
+                restored = False
+            if restored:
+                self._persistent_connections[key] = pooled
+                return connection
+            connection.close()
+
+        connection = self._build_connection()
+        self._persistent_connections[key] = (connection, session_context(connection))
+        return connection
+
     def _collect_not_empty_connection_attributes(self):
         return {
             "account": self.account,
@@ -192,6 +265,9 @@ class _CliGlobalContextManager:
         self._project_definition = None
         self._project_root = None
         self._silent: bool = False
+        self._query_tracer: Optional[QueryTracer] = None
+        self._trace_queries_file: Optional[Path] = None
+        self._file_indexes: Dict[str, FileIndex] = {}
 
     def reset(self):
         self.__init__()
@@ -253,6 +329,34 @@ class _CliGlobalContextManager:
     def set_silent(self, value: bool):
         self._silent = value
 
+    @property
+    def query_tracer(self) -> Optional[QueryTracer]:
+        return self._query_tracer
+
+    def set_trace_queries(self, value: Optional[QueryTraceFormat]):
+        self._query_tracer = QueryTracer(value) if value else None
+
+    @property
+    def trace_queries_file(self) -> Optional[Path]:
+        return self._trace_queries_file
+
+    def set_trace_queries_file(self, value: Optional[Path]):
+        self._trace_queries_file = value
+
+    def file_index(self, root: Path) -> FileIndex:
+        """
+        Returns the index of files under the root, shared by everything looking up
+        files there during the command.
+        """
+        key = os.path.abspath(root)
+        if key not in self._file_indexes:
+            self._file_indexes[key] = FileIndex(root)
+        return self._file_indexes[key]
+
+    def invalidate_file_indexes(self):
+        """Forgets indexed files, to be called after files are modified."""
+        self._file_indexes = {}
+
 
 class _CliGlobalContextAccess:
     def __init__(self, manager: _CliGlobalContextManager):
@@ -262,6 +366,10 @@ class _CliGlobalContextAccess:
     def connection(self) -> SnowflakeConnection:
         return self._manager.connection
 
+    @property
+    def session_state(self) -> SessionState:
+        return self._manager.connection_context.session_state
+
     @property
     def enable_tracebacks(self) -> bool:
         return self._manager.enable_tracebacks
@@ -286,6 +394,20 @@ class _CliGlobalContextAccess:
     def project_root(self):
         return self._manager.project_root
 
+    @property
+    def query_tracer(self) -> Optional[QueryTracer]:
+        return self._manager.query_tracer
+
+    @property
+    def trace_queries_file(self) -> Optional[Path]:
+        return self._manager.trace_queries_file
+
+    def file_index(self, root: Path) -> FileIndex:
+        return self._manager.file_index(root)
+
+    def invalidate_file_indexes(self):
+        self._manager.invalidate_file_indexes()
+
     @property
     def silent(self) -> bool:
         if self._should_force_mute_intermediate_output:
@@ -295,7 +417,7 @@ class _CliGlobalContextAccess:
     @property
     def _should_force_mute_intermediate_output(self) -> bool:
         """Computes whether cli_console output should be muted."""
-        return self._manager.output_format == OutputFormat.JSON
+        return self._manager.output_format != OutputFormat.TABLE
 
 
 cli_context_manager: _CliGlobalContextManager = _CliGlobalContextManager()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 from functools import wraps
 from inspect import Signature
+from pathlib import Path
 from typing import Callable, Dict, List, Optional, get_type_hints
 
 from snowflake.cli.api.cli_global_context import cli_context
@@ -23,6 +24,8 @@ from snowflake.cli.api.commands.flags import (
     SchemaOption,
     SilentOption,
     TemporaryConnectionOption,
+    TraceQueriesFileOption,
+    TraceQueriesOption,
     UserOption,
     VerboseOption,
     WarehouseOption,
@@ -32,6 +35,7 @@ from snowflake.cli.api.commands.flags import (
 from snowflake.cli.api.exceptions import CommandReturnTypeError
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import CommandResult
+from snowflake.cli.api.query_trace import QueryTraceFormat
 
 
 def global_options(func: Callable):
@@ -290,6 +294,18 @@ GLOBAL_OPTIONS = [
         annotation=Optional[bool],
         default=SilentOption,
     ),
+    inspect.Parameter(
+        "trace_queries",
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=Optional[QueryTraceFormat],
+        default=TraceQueriesOption,
+    ),
+    inspect.Parameter(
+        "trace_queries_file",
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=Optional[Path],
+        default=TraceQueriesFileOption,
+    ),
 ]
 
 
@@ -322,6 +322,26 @@ SilentOption = typer.Option(
     is_eager=True,
 )
 
+TraceQueriesOption = typer.Option(
+    None,
+    "--trace-queries",
+    help="Reports executed queries with their timings after the command finishes, in the given format.",
+    case_sensitive=False,
+    callback=_callback(lambda: cli_context_manager.set_trace_queries),
+    show_default=False,
+    rich_help_panel=_CLI_BEHAVIOUR,
+)
+
+TraceQueriesFileOption = typer.Option(
+    None,
+    "--trace-queries-file",
+    help="Writes the report of executed queries to the given file instead of standard error.",
+    callback=_callback(lambda: cli_context_manager.set_trace_queries_file),
+    dir_okay=False,
+    show_default=False,
+    rich_help_panel=_CLI_BEHAVIOUR,
+)
+
 VerboseOption = typer.Option(
     False,
     "--verbose",
@@ -105,7 +105,9 @@ class SnowTyper(typer.Typer):
         Callback executed after running any command callable. Pay attention to make this method safe to
         use if performed operations are not necessary for executing the command in proper way.
         """
+        from snowflake.cli.app.query_trace_report import report_traced_queries
         from snowflake.cli.app.telemetry import flush_telemetry
 
         log.debug("Executing command post execution callback")
+        report_traced_queries()
         flush_telemetry()
@@ -5,7 +5,7 @@ import os
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Set, Tuple, Union
 
 import tomlkit
 from click import ClickException
@@ -104,7 +104,9 @@ def config_init(config_file: Optional[Path]):
         _check_default_config_files_permissions()
     if not CONFIG_MANAGER.file_path.exists():
         _initialise_config(CONFIG_MANAGER.file_path)
-    CONFIG_MANAGER.read_config()
+    _read_config_file()
+    # environment may differ between invocations served by the same process
+    _invalidate_config_snapshot()
 
 
 def add_connection(name: str, connection_config: ConnectionConfig):
@@ -124,12 +126,113 @@ _DEFAULT_LOGS_CONFIG = {
 _DEFAULT_CLI_CONFIG = {LOGS_SECTION: _DEFAULT_LOGS_CONFIG}
 
 
+@dataclass
+class _ConfigSnapshot:
+    """
+    Plain python copy of the parsed config with an index of SNOWFLAKE_* environment
+    variables. Top level sections are unwrapped from tomlkit on first access.
+    """
+
+    source: Optional[TOMLDocument]
+    sections: Dict[str, Any] = field(default_factory=dict)
+    # paths of toml tables (not inline ones) which values can be overridden by env
+    tables: Set[Tuple[str, ...]] = field(default_factory=set)
+    # paths of top level sections read from config file
+    containers: Set[Tuple[str, ...]] = field(default_factory=set)
+    env: Dict[str, str] = field(default_factory=dict)
+    env_by_prefix: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def section(self, name: str) -> Any:
+        if name not in self.sections:
+            value = CONFIG_MANAGER[name]
+            if isinstance(value, Container):
+                self.containers.add((name,))
+            self.sections[name] = _unwrap_section(value, (name,), self.tables)
+        return self.sections[name]
+
+    def envs_with_prefix(self, prefix: str) -> Dict[str, str]:
+        if prefix not in self.env_by_prefix:
+            self.env_by_prefix[prefix] = {
+                k[len(prefix) :].lower(): v
+                for k, v in self.env.items()
+                if k.startswith(prefix)
+            }
+        return self.env_by_prefix[prefix]
+
+
+_config_snapshot: Optional[_ConfigSnapshot] = None
+# (path, mtime, size) of config files at the moment they were parsed
+_config_files_stats: Optional[Tuple] = None
+_pending_config_writes = 0
+
+
+def _get_config_snapshot() -> _ConfigSnapshot:
+    global _config_snapshot
+    if (
+        _config_snapshot is None
+        or _config_snapshot.source is not CONFIG_MANAGER.conf_file_cache
+    ):
+        _config_snapshot = _ConfigSnapshot(
+            source=CONFIG_MANAGER.conf_file_cache,
+            env={k: v for k, v in os.environ.items() if k.startswith("SNOWFLAKE_")},
+        )
+    return _config_snapshot
+
+
+def _invalidate_config_snapshot():
+    global _config_snapshot
+    _config_snapshot = None
+
+
+def _unwrap_section(value: Any, path: Tuple[str, ...], tables: Set) -> Any:
+    if isinstance(value, Table):
+        tables.add(path)
+    if isinstance(value, dict):
+        return {k: _unwrap_section(v, (*path, k), tables) for k, v in value.items()}
+    if hasattr(value, "unwrap"):
+        return value.unwrap()
+    return value
+
+
+def _get_config_files_stats() -> Tuple:
+    stats = []
+    for path in (CONFIG_MANAGER.file_path, CONNECTIONS_FILE):
+        try:
+            stat = os.stat(path)
+            stats.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stats.append((str(path), None, None))
+    return tuple(stats)
+
+
+def _read_config_file():
+    """Parses config files unless they are unchanged since the last read."""
+    global _config_files_stats
+    stats = _get_config_files_stats()
+    if CONFIG_MANAGER.conf_file_cache is None or stats != _config_files_stats:
+        CONFIG_MANAGER.read_config()
+        _config_files_stats = stats
+
+
 @contextmanager
 def _config_file():
-    CONFIG_MANAGER.read_config()
+    """
+    Yields parsed config for modification. Nested usages are batched
+    and the file is written once, when the outermost block exits.
+    """
+    global _pending_config_writes, _config_files_stats
+    if _pending_config_writes == 0:
+        _read_config_file()
     conf_file_cache = CONFIG_MANAGER.conf_file_cache
-    yield conf_file_cache
-    _dump_config(conf_file_cache)
+    _pending_config_writes += 1
+    try:
+        yield conf_file_cache
+    finally:
+        _pending_config_writes -= 1
+    if _pending_config_writes == 0:
+        _dump_config(conf_file_cache)
+        _config_files_stats = _get_config_files_stats()
+        _invalidate_config_snapshot()
 
 
 def _initialise_logs_section():
@@ -197,7 +300,7 @@ def get_default_connection_dict() -> dict:
 
 def get_config_section(*path) -> dict:
     section = _find_section(*path)
-    if isinstance(section, Container):
+    if path in _get_config_snapshot().containers:
         return {s: _merge_section_with_env(section[s], *path, s) for s in section}
     if isinstance(section, dict):
         return _merge_section_with_env(section, *path)
@@ -210,7 +313,13 @@ def get_config_value(*path, key: str, default: Optional[Any] = Empty) -> Any:
     if env_variable:
         return env_variable
     try:
-        return get_config_section(*path)[key]
+        section = _find_section(*path)
+        if path in _get_config_snapshot().containers:
+            return _merge_section_with_env(section[key], *path, key)
+        if not isinstance(section, dict):
+            raise UnsupportedConfigSectionTypeError(type(section))
+        # environment variables overriding the key were already checked
+        return section[key]
     except (KeyError, NonExistentKey, MissingConfigOptionError):
         if default is not Empty:
             return default
@@ -252,32 +361,23 @@ def get_env_value(*path, key: str) -> str | None:
     return os.environ.get(get_env_variable_name(*path, key=key))
 
 
-def _find_section(*path) -> TOMLDocument:
-    section = CONFIG_MANAGER
-    idx = 0
-    while idx < len(path):
-        section = section[path[idx]]
-        idx += 1
+def _find_section(*path) -> Any:
+    section = _get_config_snapshot().section(path[0])
+    for name in path[1:]:
+        section = section[name]
     return section
 
 
-def _merge_section_with_env(section: Union[Table, Any], *path) -> Dict[str, str]:
-    if isinstance(section, Table):
-        env_variables = _get_envs_for_path(*path)
-        section_copy = section.copy()
-        section_copy.update(env_variables)
-        return section_copy.unwrap()
+def _merge_section_with_env(section: Union[dict, Any], *path) -> Dict[str, str]:
+    if path in _get_config_snapshot().tables:
+        return {**section, **_get_envs_for_path(*path)}
     # It's a atomic value
     return section
 
 
 def _get_envs_for_path(*path) -> dict:
     env_variables_prefix = "_".join(["SNOWFLAKE"] + [p.upper() for p in path]) + "_"
-    return {
-        k.replace(env_variables_prefix, "").lower(): os.environ[k]
-        for k in os.environ.keys()
-        if k.startswith(env_variables_prefix)
-    }
+    return _get_config_snapshot().envs_with_prefix(env_variables_prefix)
 
 
 def _dump_config(conf_file_cache: Dict):
@@ -35,3 +35,4 @@ class FeatureFlag(FeatureFlagMixin):
         "ENABLE_STREAMLIT_EMBEDDED_STAGE", False
     )
     ENABLE_SNOWGIT = BooleanFlag("ENABLE_SNOWGIT", False)
+    ENABLE_SESSION_CACHE = BooleanFlag("ENABLE_SESSION_CACHE", False)
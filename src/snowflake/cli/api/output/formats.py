@@ -4,3 +4,7 @@ from enum import Enum
 class OutputFormat(Enum):
     TABLE = "TABLE"
     JSON = "JSON"
+    CSV = "CSV"
+    NDJSON = "NDJSON"
+    ARROW = "ARROW"
+    PARQUET = "PARQUET"
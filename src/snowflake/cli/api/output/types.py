@@ -45,6 +45,7 @@ class MultipleResults(CommandResult):
 class QueryResult(CollectionResult):
     def __init__(self, cursor: SnowflakeCursor):
         self.column_names = [col.name for col in cursor.description]
+        self._cursor = cursor
         super().__init__(elements=self._prepare_payload(cursor))
         self._query = cursor.query
 
@@ -55,6 +56,15 @@ class QueryResult(CollectionResult):
     def query(self):
         return self._query
 
+    @property
+    def cursor(self) -> SnowflakeCursor:
+        return self._cursor
+
+    @property
+    def rows(self) -> t.Iterator[t.Tuple]:
+        """Rows as returned by the connector, without conversion to dictionaries."""
+        return iter(self._cursor)
+
 
 class SingleQueryResult(ObjectResult):
     def __init__(self, cursor: SnowflakeCursor):
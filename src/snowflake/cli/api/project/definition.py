@@ -1,7 +1,6 @@
 from pathlib import Path
 from typing import Dict, List
 
-import yaml.loader
 from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
 from snowflake.cli.api.project.schemas.project_definition import ProjectDefinition
@@ -12,7 +11,9 @@ from snowflake.cli.api.project.util import (
     to_identifier,
 )
 from snowflake.cli.api.secure_path import SecurePath
-from yaml import load
+from snowflake.cli.api.utils.lazy_import import lazy_import
+
+yaml = lazy_import("yaml")
 
 DEFAULT_USERNAME = "unknown_user"
 
@@ -40,13 +41,13 @@ def load_project_definition(paths: List[Path]) -> ProjectDefinition:
         raise ValueError("Need at least one definition file.")
 
     with spaths[0].open("r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB) as base_yml:
-        definition = load(base_yml.read(), Loader=yaml.loader.BaseLoader)
+        definition = yaml.load(base_yml.read(), Loader=yaml.loader.BaseLoader)
 
     for override_path in spaths[1:]:
         with override_path.open(
             "r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB
         ) as override_yml:
-            overrides = load(override_yml.read(), Loader=yaml.loader.BaseLoader)
+            overrides = yaml.load(override_yml.read(), Loader=yaml.loader.BaseLoader)
             merge_left(definition, overrides)
 
         # TODO: how to show good error messages here?
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Optional
+
+
+class QueryTraceFormat(Enum):
+    TABLE = "TABLE"
+    JSON = "JSON"
+    OTEL = "OTEL"
+
+
+def statement_hash(statement: Optional[str]) -> Optional[str]:
+    """
+    Returns a short hash identifying the statement without revealing its text.
+    """
+    if statement is None:
+        return None
+    normalized = " ".join(statement.split()).rstrip(";").strip()
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+
+@dataclass
+class TracedQuery:
+    statement_hash: Optional[str]
+    query_id: Optional[str]
+    started_at_ns: int
+    "Wall clock time at which the statement was sent"
+    client_latency_ns: int
+    "Time between sending the statement and receiving its result"
+    rows: Optional[int]
+    server_elapsed_ms: Optional[int] = None
+    "Elapsed time reported by the server, if it could be looked up"
+
+
+class QueryTracer:
+    """
+    Collects round trips of statements executed during a command. Statements can
+    be recorded from multiple threads.
+    """
+
+    def __init__(self, output_format: QueryTraceFormat):
+        self.output_format = output_format
+        self.started_at_ns = time.time_ns()
+        self._queries: List[TracedQuery] = []
+        self._lock = threading.Lock()
+
+    @property
+    def queries(self) -> List[TracedQuery]:
+        with self._lock:
+            return list(self._queries)
+
+    def record(
+        self,
+        statement: Optional[str],
+        query_id: Optional[str],
+        started_at_ns: int,
+        client_latency_ns: int,
+        rows: Optional[int],
+    ) -> None:
+        query = TracedQuery(
+            statement_hash=statement_hash(statement),
+            query_id=query_id,
+            started_at_ns=started_at_ns,
+            client_latency_ns=client_latency_ns,
+            rows=rows,
+        )
+        with self._lock:
+            self._queries.append(query)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_USE_STATEMENT = re.compile(
+    r"^\s*use\s+(role|warehouse|database|schema)\s+([^\s;\"]+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+# statements which may change session state in a way we do not track
+_UNTRACKED_STATEMENT = re.compile(
+    r"^\s*(use|call|execute\s+immediate|begin|declare)\b", re.IGNORECASE
+)
+# creating an object makes it current, dropping the current one unsets it
+_CREATE_OR_DROP_STATEMENT = re.compile(
+    r"^\s*(?:create(?:\s+or\s+replace)?(?:\s+transient)?|drop)\s+"
+    r"(warehouse|database|schema)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class SessionState:
+    """
+    Last known role, warehouse, database and schema of a connection, updated from
+    executed statements. None means that the value is unknown.
+    """
+
+    role: Optional[str] = None
+    warehouse: Optional[str] = None
+    database: Optional[str] = None
+    schema: Optional[str] = None
+    executed_queries: int = 0
+    "Number of statements executed on the connection"
+
+    def update(self, query: str) -> None:
+        """
+        Updates the state after [query] was successfully executed.
+        """
+        created_or_dropped = _CREATE_OR_DROP_STATEMENT.match(query)
+        if created_or_dropped:
+            kind = created_or_dropped.group(1).lower()
+            if kind == "warehouse":
+                self.warehouse = None
+            else:
+                # a qualified schema name may change the database too
+                self.database = self.schema = None
+            return
+
+        match = _USE_STATEMENT.match(query)
+        if not match:
+            if _UNTRACKED_STATEMENT.match(query):
+                self.forget()
+            return
+
+        kind, name = match.group(1).lower(), match.group(2)
+        if kind == "role":
+            self.role = name
+        elif kind == "warehouse":
+            self.warehouse = name
+        elif kind == "database":
+            self.database, self.schema = name, None
+        elif "." in name:
+            self.database, self.schema = name.split(".", 1)
+        else:
+            self.schema = name
+
+    def forget(self) -> None:
+        self.role = self.warehouse = self.database = self.schema = None
+
+    @staticmethod
+    def is_same_object(known: Optional[str], requested: str) -> bool:
+        return known is not None and known.lower() == requested.lower()
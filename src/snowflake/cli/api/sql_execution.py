@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import cached_property
 from io import StringIO
 from textwrap import dedent
-from typing import Iterable, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.exceptions import (
@@ -17,10 +19,95 @@ from snowflake.cli.api.project.util import (
     identifier_to_show_like_pattern,
     unquote_identifier,
 )
+from snowflake.cli.api.session_state import SessionState
 from snowflake.cli.api.utils.cursor import find_first_row
 from snowflake.cli.api.utils.naming_utils import from_qualified_name
 from snowflake.connector.cursor import DictCursor, SnowflakeCursor
-from snowflake.connector.errors import ProgrammingError
+from snowflake.connector.errors import Error, ProgrammingError
+
+
+class _TrackedCursors:
+    """
+    Iterator over cursors of executed statements, which reports each statement
+    with its round trip time when its cursor is returned, or when it fails.
+    """
+
+    def __init__(
+        self,
+        cursors: Iterable[SnowflakeCursor],
+        on_executed: Callable[[SnowflakeCursor, int, int], None],
+        on_failed: Callable[[Error, int, int], None],
+    ):
+        self._cursors: Iterator[SnowflakeCursor] = (
+            cursors if isinstance(cursors, Iterator) else iter(cursors)
+        )
+        self._on_executed = on_executed
+        self._on_failed = on_failed
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> SnowflakeCursor:
+        started_at_ns, started = time.time_ns(), time.perf_counter_ns()
+        try:
+            cursor = next(self._cursors)
+        except Error as err:
+            self._on_failed(err, started_at_ns, time.perf_counter_ns() - started)
+            raise
+        self._on_executed(cursor, started_at_ns, time.perf_counter_ns() - started)
+        return cursor
+
+
+class AsyncQuery:
+    """
+    Statement submitted for execution without waiting for its results, so that
+    independent statements can run concurrently. Results are fetched by [wait]
+    and read like results of a cursor.
+    """
+
+    def __init__(
+        self,
+        cursor: SnowflakeCursor,
+        statement: str,
+        on_executed: Callable[[SnowflakeCursor, int, int], None],
+        on_failed: Callable[[Error, int, int], None],
+    ):
+        self.statement = statement
+        self._cursor = cursor
+        self._on_executed = on_executed
+        self._on_failed = on_failed
+        self._rows: Optional[list] = None
+        self._error: Optional[Error] = None
+        self._started_at_ns, self._started = time.time_ns(), time.perf_counter_ns()
+        cursor.execute_async(statement)
+
+    def wait(self) -> None:
+        """Waits for the statement to finish and fetches its results."""
+        if self._rows is not None or self._error is not None:
+            return
+        try:
+            self._cursor.get_results_from_sfqid(self._cursor.sfqid)
+            self._rows = self._cursor.fetchall()
+        except Error as err:
+            self._error = err
+            self._on_failed(
+                err, self._started_at_ns, time.perf_counter_ns() - self._started
+            )
+            return
+        self._on_executed(
+            self._cursor, self._started_at_ns, time.perf_counter_ns() - self._started
+        )
+
+    def fetchall(self) -> list:
+        """Returns all rows of the result, or raises the error of the statement."""
+        self.wait()
+        if self._error is not None:
+            raise self._error
+        return self._rows  # type: ignore[return-value]
+
+    @property
+    def rowcount(self) -> int:
+        return len(self.fetchall())
 
 
 class SqlExecutionMixin:
@@ -53,7 +140,58 @@ class SqlExecutionMixin:
         stream_generator = self._conn.execute_stream(
             stream, remove_comments=remove_comments, cursor_class=cursor_class, **kwargs
         )
-        return stream_generator if return_cursors else list()
+        return self._track_cursors(stream_generator) if return_cursors else list()
+
+    @property
+    def _session_state(self) -> SessionState:
+        return cli_context.session_state
+
+    def _update_session_state(self, query: Optional[str]) -> None:
+        state = self._session_state
+        state.executed_queries += 1
+        if isinstance(query, str):
+            state.update(query)
+
+    def _on_statement_executed(
+        self, cursor: SnowflakeCursor, started_at_ns: int, client_latency_ns: int
+    ) -> None:
+        statement = getattr(cursor, "query", None)
+        self._update_session_state(statement)
+        self._trace_query(cursor, statement, started_at_ns, client_latency_ns)
+
+    def _on_statement_failed(
+        self, error: Error, started_at_ns: int, client_latency_ns: int
+    ) -> None:
+        # failed statements are traced too, as traces of failed commands matter most
+        self._trace_query(error, error.query, started_at_ns, client_latency_ns)
+
+    def _trace_query(
+        self,
+        cursor: SnowflakeCursor | Error,
+        statement: Optional[str],
+        started_at_ns: int,
+        client_latency_ns: int,
+    ) -> None:
+        """
+        Records the round trip of an executed statement if queries are traced.
+        """
+        tracer = cli_context.query_tracer
+        if tracer is None:
+            return
+        tracer.record(
+            statement=statement if isinstance(statement, str) else None,
+            query_id=_attribute_or_none(cursor, "sfqid", str),
+            started_at_ns=started_at_ns,
+            client_latency_ns=client_latency_ns,
+            rows=_attribute_or_none(cursor, "rowcount", int),
+        )
+
+    def _track_cursors(
+        self, cursors: Iterable[SnowflakeCursor]
+    ) -> Iterable[SnowflakeCursor]:
+        return _TrackedCursors(
+            cursors, self._on_statement_executed, self._on_statement_failed
+        )
 
     def _execute_query(self, query: str, **kwargs):
         *_, last_result = self._execute_queries(query, **kwargs)
@@ -62,25 +200,64 @@ class SqlExecutionMixin:
     def _execute_queries(self, queries: str, **kwargs):
         return list(self._execute_string(dedent(queries), **kwargs))
 
+    def _execute_query_async(
+        self, query: str, cursor_class: SnowflakeCursor = SnowflakeCursor
+    ) -> AsyncQuery:
+        """
+        Submits the query for execution, which continues while other queries are
+        submitted. The query runs with the role and warehouse in use at submission.
+        """
+        self._log.debug("Executing asynchronously %s", query)
+        return AsyncQuery(
+            self._conn.cursor(cursor_class),
+            query,
+            self._on_statement_executed,
+            self._on_statement_failed,
+        )
+
+    @staticmethod
+    def _wait_for_queries(queries: List[AsyncQuery]) -> None:
+        """Fetches results of all submitted queries concurrently."""
+        if len(queries) > 1:
+            with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+                list(executor.map(AsyncQuery.wait, queries))
+        for query in queries:
+            query.wait()
+
     @contextmanager
     def use_role(self, new_role: str):
         """
         Switches to a different role for a while, then switches back.
         This is a no-op if the requested role is already active.
         """
-        role_result = self._execute_query(
-            f"select current_role()", cursor_class=DictCursor
-        ).fetchone()
-        prev_role = role_result["CURRENT_ROLE()"]
-        is_different_role = new_role.lower() != prev_role.lower()
+        prev_role = self._session_state.role
+        if prev_role is None:
+            role_result = self._execute_query(
+                f"select current_role()", cursor_class=DictCursor
+            ).fetchone()
+            prev_role = role_result["CURRENT_ROLE()"]
+            self._session_state.role = prev_role
+        is_different_role = not SessionState.is_same_object(prev_role, new_role)
         if is_different_role:
             self._log.debug("Assuming different role: %s", new_role)
             self._execute_query(f"use role {new_role}")
+            self._session_state.role = new_role
         try:
             yield
         finally:
             if is_different_role:
                 self._execute_query(f"use role {prev_role}")
+                self._session_state.role = prev_role
+
+    def use_warehouse(self, new_warehouse: str):
+        """
+        Switches to a different warehouse. This is a no-op if the requested
+        warehouse is known to be already in use.
+        """
+        if SessionState.is_same_object(self._session_state.warehouse, new_warehouse):
+            return
+        self._execute_query(f"use warehouse {new_warehouse}")
+        self._session_state.warehouse = new_warehouse
 
     def create_password_secret(
         self, name: str, username: str, password: str
@@ -192,12 +369,9 @@ class SqlExecutionMixin:
         the connection or a qualified name, before executing the query.
         """
 
-        unqualified_name, name_in_clause = self._qualified_name_to_in_clause(name)
-        if in_clause and name_in_clause:
-            raise self.InClauseWithQualifiedNameError()
-        elif name_in_clause:
-            in_clause = name_in_clause
-        show_obj_query = f"show {object_type_plural} like {identifier_to_show_like_pattern(unqualified_name)} {in_clause}".strip()
+        show_obj_query, unqualified_name = self._show_specific_object_query(
+            object_type_plural, name, in_clause
+        )
 
         if check_schema:
             show_obj_cursor = self._execute_schema_query(  # type: ignore
@@ -208,6 +382,36 @@ class SqlExecutionMixin:
                 show_obj_query, cursor_class=DictCursor
             )
 
+        return self._specific_object_row(
+            show_obj_query, show_obj_cursor, unqualified_name, name_col
+        )
+
+    def _show_specific_object_query(
+        self, object_type_plural: str, name: str, in_clause: str = ""
+    ) -> Tuple[str, str]:
+        """
+        Returns a "show <objects> like" query for the entity with a given
+        (optionally qualified) name, together with its unqualified name.
+        """
+        unqualified_name, name_in_clause = self._qualified_name_to_in_clause(name)
+        if in_clause and name_in_clause:
+            raise self.InClauseWithQualifiedNameError()
+        elif name_in_clause:
+            in_clause = name_in_clause
+        show_obj_query = f"show {object_type_plural} like {identifier_to_show_like_pattern(unqualified_name)} {in_clause}".strip()
+        return show_obj_query, unqualified_name
+
+    @staticmethod
+    def _specific_object_row(
+        show_obj_query: str,
+        show_obj_cursor: SnowflakeCursor | AsyncQuery,
+        unqualified_name: str,
+        name_col: str = "name",
+    ) -> Optional[dict]:
+        """
+        Returns the row of the entity from the result of a "show <objects> like"
+        query, or None if the entity does not exist.
+        """
         if show_obj_cursor.rowcount is None:
             raise SnowflakeSQLExecutionError(show_obj_query)
         elif show_obj_cursor.rowcount > 1:
@@ -220,3 +424,8 @@ class SqlExecutionMixin:
             lambda row: row[name_col] == unquote_identifier(unqualified_name),
         )
         return show_obj_row
+
+
+def _attribute_or_none(cursor: SnowflakeCursor | Error, name: str, expected_type: type):
+    value = getattr(cursor, name, None)
+    return value if isinstance(value, expected_type) else None
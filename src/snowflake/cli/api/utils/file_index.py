@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Dict, Iterator, List, Tuple
+
+
+@dataclass(frozen=True)
+class _Entry:
+    name: str
+    is_dir: bool
+    "Whether the entry is a directory or a symlink to one"
+    is_symlink: bool
+
+
+class FileIndex:
+    """
+    Listings of directories under a root, each scanned at most once and shared by
+    all lookups, such as glob patterns of many artifact mappings. Directories are
+    scanned only when a lookup reaches them.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._listings: Dict[Path, List[_Entry]] = {}
+
+    def _list(self, directory: Path) -> List[_Entry]:
+        listing = self._listings.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = sorted(
+                        (
+                            _Entry(entry.name, _is_dir(entry), entry.is_symlink())
+                            for entry in entries
+                        ),
+                        key=lambda entry: os.path.normcase(entry.name),
+                    )
+            except OSError:
+                listing = []
+            self._listings[directory] = listing
+        return listing
+
+    def glob(self, pattern: str) -> List[Path]:
+        """
+        Returns paths under the root matching the pattern, with the semantics of
+        Path.glob: `**` matches the directory and all its subdirectories, without
+        following symlinks, and patterns ending with a separator match only
+        directories.
+        """
+        parts = PurePath(pattern).parts
+        if not parts:
+            raise ValueError(f"Unacceptable pattern: {pattern!r}")
+        if PurePath(pattern).anchor:
+            raise NotImplementedError("Non-relative patterns are unsupported")
+
+        selected: List[Tuple[Path, bool]] = [(self.root, True)]
+        last = len(parts) - 1
+        for index, part in enumerate(parts):
+            dir_only = index < last
+            if part == "**":
+                selected = [
+                    (directory, True)
+                    for parent, _ in selected
+                    for directory in self._directories(parent)
+                ]
+            elif "**" in part:
+                raise ValueError(
+                    "Invalid pattern: '**' can only be an entire path component"
+                )
+            elif _is_wildcard(part):
+                regex = _compile_component(part)
+                selected = [
+                    (parent / entry.name, entry.is_dir)
+                    for parent, _ in selected
+                    for entry in self._list(parent)
+                    if regex.match(entry.name) and (entry.is_dir or not dir_only)
+                ]
+            else:
+                selected = [
+                    (path, path.is_dir())
+                    for parent, _ in selected
+                    if (path := parent / part).exists()
+                    and (not dir_only or path.is_dir())
+                ]
+        if pattern.endswith(("/", os.sep)):
+            selected = [(path, is_dir) for path, is_dir in selected if is_dir]
+        return list(dict.fromkeys(path for path, _ in selected))
+
+    def _directories(self, directory: Path) -> Iterator[Path]:
+        yield directory
+        for entry in self._list(directory):
+            if entry.is_dir and not entry.is_symlink:
+                yield from self._directories(directory / entry.name)
+
+    def files(self, directory: Path | None = None) -> List[Path]:
+        """
+        Returns all files in the directory (the root by default), recursively and
+        following symlinks, sorted by path at each level.
+        """
+        directory = self.root if directory is None else directory
+        files: List[Path] = []
+        for entry in self._list(directory):
+            path = directory / entry.name
+            if entry.is_dir:
+                files += self.files(path)
+            else:
+                files.append(path)
+        return files
+
+    def walk(
+        self, directory: Path | None = None
+    ) -> Iterator[Tuple[Path, List[str], List[str]]]:
+        """
+        Yields directories like os.walk, top-down and without following symlinks,
+        with names sorted.
+        """
+        directory = self.root if directory is None else directory
+        listing = self._list(directory)
+        yield (
+            directory,
+            [entry.name for entry in listing if entry.is_dir],
+            [entry.name for entry in listing if not entry.is_dir],
+        )
+        for entry in listing:
+            if entry.is_dir and not entry.is_symlink:
+                yield from self.walk(directory / entry.name)
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_wildcard(part: str) -> bool:
+    return "*" in part or "?" in part or "[" in part
+
+
+@lru_cache(maxsize=None)
+def _compile_component(part: str) -> re.Pattern:
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(part), flags)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any, List, Optional
+
+
+class LazyModule(ModuleType):
+    """
+    Proxy of a module which is imported on first attribute access.
+
+    Allows heavy third-party dependencies to be declared at the top of a file
+    without importing them during command registration.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._load(), item)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> Any:
+    """
+    Returns proxy of module [name] which is imported on first attribute access.
+    """
+    return LazyModule(name)
@@ -5,15 +5,16 @@ from pathlib import Path
 from textwrap import dedent
 from typing import Optional
 
-import jinja2
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+from snowflake.cli.api.utils.lazy_import import lazy_import
+
+jinja2 = lazy_import("jinja2")
 
 
 def read_file_content(file_name: str):
     return SecurePath(file_name).read_text(file_size_limit_mb=UNLIMITED)
 
 
-@jinja2.pass_environment  # type: ignore
 def procedure_from_js_file(env: jinja2.Environment, file_name: str):
     template = env.from_string(
         dedent(
@@ -72,7 +73,6 @@ PROCEDURE_TEMPLATE = dedent(
 )
 
 
-@jinja2.pass_environment  # type: ignore
 def render_metadata(env: jinja2.Environment, file_name: str):
     metadata = json.loads(
         SecurePath(file_name).absolute().read_text(file_size_limit_mb=UNLIMITED)
@@ -110,7 +110,11 @@ def generic_render_template(
         keep_trailing_newline=True,
         undefined=jinja2.StrictUndefined,
     )
-    filters = [render_metadata, read_file_content, procedure_from_js_file]
+    filters = [
+        jinja2.pass_environment(render_metadata),
+        read_file_content,
+        jinja2.pass_environment(procedure_from_js_file),
+    ]
     for custom_filter in filters:
         env.filters[custom_filter.__name__] = custom_filter
     loaded_template = env.get_template(template_path.name)
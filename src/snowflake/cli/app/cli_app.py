@@ -23,7 +23,6 @@ from snowflake.cli.app.commands_registration.commands_registration_with_callback
     CommandsRegistrationWithCallbacks,
 )
 from snowflake.cli.app.dev.commands_structure import generate_commands_structure
-from snowflake.cli.app.dev.docs.generator import generate_docs
 from snowflake.cli.app.dev.pycharm_remote_debug import (
     setup_pycharm_remote_debugger_if_provided,
 )
@@ -86,6 +85,8 @@ def _disable_external_command_plugins_callback(value: bool):
 @_commands_registration.after
 def _docs_callback(value: bool):
     if value:
+        from snowflake.cli.app.dev.docs.generator import generate_docs
+
         ctx = click.get_current_context()
         generate_docs(SecurePath("gen_docs"), ctx.command)
         _exit_with_cleanup()
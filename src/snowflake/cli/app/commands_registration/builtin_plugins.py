@@ -1,28 +1,41 @@
+import importlib
+from typing import Dict, List
+
 from snowflake.cli.api.feature_flags import FeatureFlag
-from snowflake.cli.plugins.connection import plugin_spec as connection_plugin_spec
-from snowflake.cli.plugins.git import plugin_spec as git_plugin_spec
-from snowflake.cli.plugins.nativeapp import plugin_spec as nativeapp_plugin_spec
-from snowflake.cli.plugins.object import plugin_spec as object_plugin_spec
-from snowflake.cli.plugins.render import plugin_spec as render_plugin_spec
-from snowflake.cli.plugins.snowpark import plugin_spec as snowpark_plugin_spec
-from snowflake.cli.plugins.spcs import plugin_spec as spcs_plugin_spec
-from snowflake.cli.plugins.sql import plugin_spec as sql_plugin_spec
-from snowflake.cli.plugins.streamlit import plugin_spec as streamlit_plugin_spec
+
+# plugin name to plugin spec module
+BUILTIN_PLUGIN_MODULES: Dict[str, str] = {
+    "connection": "snowflake.cli.plugins.connection.plugin_spec",
+    "spcs": "snowflake.cli.plugins.spcs.plugin_spec",
+    "nativeapp": "snowflake.cli.plugins.nativeapp.plugin_spec",
+    "object": "snowflake.cli.plugins.object.plugin_spec",
+    "render": "snowflake.cli.plugins.render.plugin_spec",
+    "server": "snowflake.cli.plugins.server.plugin_spec",
+    "snowpark": "snowflake.cli.plugins.snowpark.plugin_spec",
+    "sql": "snowflake.cli.plugins.sql.plugin_spec",
+    "streamlit": "snowflake.cli.plugins.streamlit.plugin_spec",
+    "git": "snowflake.cli.plugins.git.plugin_spec",
+}
+
+
+def get_builtin_plugin_names() -> List[str]:
+    plugin_names = [name for name in BUILTIN_PLUGIN_MODULES if name != "git"]
+    if FeatureFlag.ENABLE_SNOWGIT.is_enabled():
+        plugin_names.append("git")
+    return plugin_names
+
+
+def get_builtin_plugin_spec(plugin_name: str):
+    """
+    Imports plugin spec module of a single builtin plugin
+    (and so its commands) without touching the other builtin plugins.
+    """
+    return importlib.import_module(BUILTIN_PLUGIN_MODULES[plugin_name])
 
 
 # plugin name to plugin spec
 def get_builtin_plugin_name_to_plugin_spec():
-    plugin_specs = {
-        "connection": connection_plugin_spec,
-        "spcs": spcs_plugin_spec,
-        "nativeapp": nativeapp_plugin_spec,
-        "object": object_plugin_spec,
-        "render": render_plugin_spec,
-        "snowpark": snowpark_plugin_spec,
-        "sql": sql_plugin_spec,
-        "streamlit": streamlit_plugin_spec,
+    return {
+        plugin_name: get_builtin_plugin_spec(plugin_name)
+        for plugin_name in get_builtin_plugin_names()
     }
-    if FeatureFlag.ENABLE_SNOWGIT.is_enabled():
-        plugin_specs["git"] = git_plugin_spec
-
-    return plugin_specs
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 import pluggy
 from snowflake.cli.api.plugins.command import (
@@ -15,6 +15,12 @@ from snowflake.cli.app.commands_registration import (
 )
 from snowflake.cli.app.commands_registration.builtin_plugins import (
     get_builtin_plugin_name_to_plugin_spec,
+    get_builtin_plugin_names,
+    get_builtin_plugin_spec,
+)
+from snowflake.cli.app.commands_registration.commands_manifest import (
+    find_builtin_plugins_providing_command,
+    get_builtin_top_level_command_names,
 )
 from snowflake.cli.app.commands_registration.exception_logging import exception_logging
 
@@ -23,22 +29,42 @@ log_exception = exception_logging(log)
 
 
 class CommandPluginsLoader:
-    def __init__(self):
+    def __init__(self, invoked_command_name: Optional[str] = None):
         plugin_manager = pluggy.PluginManager(SNOWCLI_COMMAND_PLUGIN_NAMESPACE)
         plugin_manager.add_hookspecs(plugin_hook_specs)
         self._plugin_manager = plugin_manager
         self._loaded_plugins: Dict[str, LoadedCommandPlugin] = {}
         self._loaded_command_paths: Dict[CommandPath, LoadedCommandPlugin] = {}
+        self._builtin_plugin_names: Set[str] = set()
+        # Name of the top-level command being invoked. When it is known
+        # and the manifest points to the builtin plugins providing it,
+        # only those plugins are imported and loaded.
+        self._invoked_command_name = invoked_command_name
+        self._lazy_loading = False
 
     def register_builtin_plugins(self) -> None:
-        for plugin_name, plugin in get_builtin_plugin_name_to_plugin_spec().items():
+        for plugin_name, plugin in self._get_builtin_plugins_to_register().items():
             try:
                 self._plugin_manager.register(plugin=plugin, name=plugin_name)
+                self._builtin_plugin_names.add(plugin_name)
             except Exception as ex:
                 log_exception(
                     f"Cannot register plugin [{plugin_name}]: {ex.__str__()}", ex
                 )
 
+    def _get_builtin_plugins_to_register(self) -> Dict[str, object]:
+        if self._invoked_command_name:
+            plugin_names = find_builtin_plugins_providing_command(
+                self._invoked_command_name, get_builtin_plugin_names()
+            )
+            if plugin_names:
+                self._lazy_loading = True
+                return {
+                    plugin_name: get_builtin_plugin_spec(plugin_name)
+                    for plugin_name in plugin_names
+                }
+        return get_builtin_plugin_name_to_plugin_spec()
+
     def register_external_plugins(self, plugin_names: List[str]) -> None:
         for plugin_name in plugin_names:
             try:
@@ -67,6 +93,15 @@ class CommandPluginsLoader:
         loaded_plugin = self._load_plugin_spec(plugin_name, plugin)
         if not loaded_plugin:
             return None
+        if self._lazy_loading and self._extends_not_loaded_builtin_command(
+            loaded_plugin
+        ):
+            log.debug(
+                "Skipping plugin [%s] extending builtin command not related to invoked command [%s].",
+                plugin_name,
+                self._invoked_command_name,
+            )
+            return None
         other_plugin_with_the_same_command_path = self._loaded_command_paths.get(
             loaded_plugin.command_spec.full_command_path
         )
@@ -89,11 +124,22 @@ class CommandPluginsLoader:
     def _load_plugin_spec(
         self, plugin_name: str, plugin
     ) -> Optional[LoadedCommandPlugin]:
-        if plugin_name in get_builtin_plugin_name_to_plugin_spec().keys():
+        if plugin_name in self._builtin_plugin_names:
             return self._load_builtin_plugin_spec(plugin_name, plugin)
         else:
             return self._load_external_plugin_spec(plugin_name, plugin)
 
+    def _extends_not_loaded_builtin_command(
+        self, loaded_plugin: LoadedCommandPlugin
+    ) -> bool:
+        top_level_command_name = (
+            loaded_plugin.command_spec.full_command_path.path_segments[0]
+        )
+        return (
+            top_level_command_name != self._invoked_command_name
+            and top_level_command_name in get_builtin_top_level_command_names()
+        )
+
     def _load_builtin_plugin_spec(
         self, plugin_name: str, plugin
     ) -> Optional[LoadedCommandPlugin]:
@@ -130,16 +176,19 @@ class CommandPluginsLoader:
             return None
 
 
-def load_only_builtin_command_plugins() -> List[LoadedCommandPlugin]:
-    loader = CommandPluginsLoader()
+def load_only_builtin_command_plugins(
+    invoked_command_name: Optional[str] = None,
+) -> List[LoadedCommandPlugin]:
+    loader = CommandPluginsLoader(invoked_command_name)
     loader.register_builtin_plugins()
     return loader.load_all_registered_plugins()
 
 
 def load_builtin_and_external_command_plugins(
     external_plugin_names: List[str],
+    invoked_command_name: Optional[str] = None,
 ) -> List[LoadedCommandPlugin]:
-    loader = CommandPluginsLoader()
+    loader = CommandPluginsLoader(invoked_command_name)
     loader.register_builtin_plugins()
     loader.register_external_plugins(external_plugin_names)
     return loader.load_all_registered_plugins()
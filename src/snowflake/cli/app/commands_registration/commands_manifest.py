@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import click
+
+log = logging.getLogger(__name__)
+
+BUILTIN_COMMANDS_MANIFEST_PATH = (
+    Path(__file__).parent / "builtin_commands_manifest.json"
+)
+RAW_ARGS_CONTEXT_META_KEY = "snowcli.raw_args"
+
+
+@lru_cache
+def load_builtin_commands_manifest() -> Dict[str, str]:
+    """
+    Returns prebuilt manifest of builtin commands: full command path
+    mapped to the name of the plugin providing it.
+    Manifest is generated by "python -m snowflake.cli.app.dev.commands_manifest".
+    """
+    try:
+        return json.loads(BUILTIN_COMMANDS_MANIFEST_PATH.read_text())
+    except (OSError, ValueError) as err:
+        log.debug("Cannot read builtin commands manifest: %s", err)
+        return {}
+
+
+def get_builtin_top_level_command_names() -> Set[str]:
+    return {
+        command_path.split(" ")[0]
+        for command_path in load_builtin_commands_manifest().keys()
+    }
+
+
+def find_builtin_plugins_providing_command(
+    command_name: str, enabled_plugin_names: List[str]
+) -> List[str]:
+    return [
+        plugin_name
+        for command_path, plugin_name in load_builtin_commands_manifest().items()
+        if command_path.split(" ")[0] == command_name
+        and plugin_name in enabled_plugin_names
+    ]
+
+
+def find_invoked_top_level_command_name(ctx: click.Context) -> Optional[str]:
+    """
+    Finds name of the top-level command being invoked using raw arguments
+    stored in the main command context, before they are fully parsed by click.
+    Returns None if no command is invoked (e.g. "snow --help").
+    """
+    args = ctx.meta.get(RAW_ARGS_CONTEXT_META_KEY)
+    if not args:
+        return None
+
+    options_with_values = {
+        option
+        for param in ctx.command.params
+        if isinstance(param, click.Option) and not param.is_flag and not param.count
+        for option in param.opts
+    }
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+        elif arg == "--":
+            return None
+        elif arg.startswith("-"):
+            skip_value = arg in options_with_values
+        else:
+            return arg
+    return None
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable, List, Optional
 
+import click
 from snowflake.cli.api.plugins.plugin_config import PluginConfigProvider
 from snowflake.cli.app.commands_registration.command_plugins_loader import (
     load_builtin_and_external_command_plugins,
     load_only_builtin_command_plugins,
 )
+from snowflake.cli.app.commands_registration.commands_manifest import (
+    find_invoked_top_level_command_name,
+)
 from snowflake.cli.app.commands_registration.threadsafe import ThreadsafeCounter
 from snowflake.cli.app.commands_registration.typer_registration import (
     register_commands_from_plugins,
@@ -51,8 +55,13 @@ class CommandsRegistrationWithCallbacks:
             callback()
 
     @staticmethod
-    def _register_only_builtin_plugin_commands() -> None:
-        loaded_command_plugins = load_only_builtin_command_plugins()
+    def _get_invoked_command_name() -> Optional[str]:
+        return find_invoked_top_level_command_name(click.get_current_context())
+
+    def _register_only_builtin_plugin_commands(self) -> None:
+        loaded_command_plugins = load_only_builtin_command_plugins(
+            self._get_invoked_command_name()
+        )
         register_commands_from_plugins(loaded_command_plugins)
 
     def _register_builtin_and_enabled_external_plugin_commands(self):
@@ -60,7 +69,7 @@ class CommandsRegistrationWithCallbacks:
             self._plugin_config_provider.get_enabled_plugin_names()
         )
         loaded_command_plugins = load_builtin_and_external_command_plugins(
-            enabled_external_plugins
+            enabled_external_plugins, self._get_invoked_command_name()
         )
         register_commands_from_plugins(loaded_command_plugins)
 
@@ -63,20 +63,7 @@ class TyperCommandsRegistration:
     def _add_empty_callback_to_command_spec_if_required(
         command_spec: CommandSpec,
     ) -> CommandSpec:
-        new_command_spec = command_spec
-        is_specified_as_command_group = (
-            command_spec.command_type == CommandType.COMMAND_GROUP
-        )
-        is_typer_group = isinstance(command_spec.command, TyperGroup)
-        if is_specified_as_command_group and not is_typer_group:
-            typer_instance = command_spec.typer_instance
-            typer_instance.callback()(lambda: None)
-            new_command_spec = CommandSpec(
-                parent_command_path=command_spec.parent_command_path,
-                command_type=command_spec.command_type,
-                typer_instance=typer_instance,
-            )
-        return new_command_spec
+        return add_empty_callback_to_command_spec_if_required(command_spec)
 
     @staticmethod
     def _validate_command_spec(
@@ -133,5 +120,24 @@ class TyperCommandsRegistration:
             return current_level_group
 
 
+def add_empty_callback_to_command_spec_if_required(
+    command_spec: CommandSpec,
+) -> CommandSpec:
+    new_command_spec = command_spec
+    is_specified_as_command_group = (
+        command_spec.command_type == CommandType.COMMAND_GROUP
+    )
+    is_typer_group = isinstance(command_spec.command, TyperGroup)
+    if is_specified_as_command_group and not is_typer_group:
+        typer_instance = command_spec.typer_instance
+        typer_instance.callback()(lambda: None)
+        new_command_spec = CommandSpec(
+            parent_command_path=command_spec.parent_command_path,
+            command_type=command_spec.command_type,
+            typer_instance=typer_instance,
+        )
+    return new_command_spec
+
+
 def register_commands_from_plugins(plugins: List[LoadedCommandPlugin]) -> None:
     return TyperCommandsRegistration(plugins).register_commands()
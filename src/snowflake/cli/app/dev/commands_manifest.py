@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from typing import Dict
+
+from snowflake.cli.app.commands_registration.builtin_plugins import (
+    BUILTIN_PLUGIN_MODULES,
+    get_builtin_plugin_spec,
+)
+from snowflake.cli.app.commands_registration.commands_manifest import (
+    BUILTIN_COMMANDS_MANIFEST_PATH,
+)
+from snowflake.cli.app.commands_registration.typer_registration import (
+    add_empty_callback_to_command_spec_if_required,
+)
+
+
+def generate_builtin_commands_manifest() -> Dict[str, str]:
+    """
+    Imports all builtin plugins and maps paths of commands provided by them
+    to plugin names. The result is stored as a prebuilt manifest, so regular
+    invocations can find the plugin providing a command without importing
+    the others.
+    """
+    manifest = {}
+    for plugin_name in BUILTIN_PLUGIN_MODULES:
+        # groups with a single command are registered as groups, not as the command
+        command_spec = add_empty_callback_to_command_spec_if_required(
+            get_builtin_plugin_spec(plugin_name).command_spec()
+        )
+        command_path = " ".join(command_spec.full_command_path.path_segments)
+        manifest[command_path] = plugin_name
+    return dict(sorted(manifest.items()))
+
+
+def dump_builtin_commands_manifest(manifest: Dict[str, str]) -> str:
+    return json.dumps(manifest, indent=2) + "\n"
+
+
+if __name__ == "__main__":
+    BUILTIN_COMMANDS_MANIFEST_PATH.write_text(
+        dump_builtin_commands_manifest(generate_builtin_commands_manifest())
+    )
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import sys
 
+import click
 import typer
 from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.commands.flags import DEFAULT_CONTEXT_SETTINGS, DebugOption
 from snowflake.cli.api.console import cli_console
+from snowflake.cli.app.commands_registration.commands_manifest import (
+    RAW_ARGS_CONTEXT_META_KEY,
+)
+from typer.core import TyperGroup
 
 
 def _handle_exception(exception: Exception):
@@ -19,6 +24,18 @@ def _handle_exception(exception: Exception):
         raise SystemExit(1)
 
 
+class SnowCliMainTyperGroup(TyperGroup):
+    """
+    Top-level SnowCLI command group.
+    It keeps raw arguments, so commands registration can find out
+    which command is invoked and load only the plugins providing it.
+    """
+
+    def parse_args(self, ctx: click.Context, args):
+        ctx.meta[RAW_ARGS_CONTEXT_META_KEY] = list(args)
+        return super().parse_args(ctx, args)
+
+
 class SnowCliMainTyper(typer.Typer):
     """
     Top-level SnowCLI Typer.
@@ -27,6 +44,7 @@ class SnowCliMainTyper(typer.Typer):
 
     def __init__(self):
         super().__init__(
+            cls=SnowCliMainTyperGroup,
             context_settings=DEFAULT_CONTEXT_SETTINGS,
             pretty_exceptions_show_locals=False,
             add_completion=False,
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
+import csv
 import json
 import sys
 from datetime import datetime
+from itertools import chain, islice
 from json import JSONEncoder
 from pathlib import Path
-from textwrap import indent
-from typing import TextIO
+from typing import Any, Iterable, Iterator, List, Tuple
 
+from click import ClickException
 from rich import box, get_console
 from rich import print as rich_print
-from rich.live import Live
-from rich.table import Table
 from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
@@ -20,10 +20,18 @@ from snowflake.cli.api.output.types import (
     MessageResult,
     MultipleResults,
     ObjectResult,
+    QueryJsonValueResult,
     QueryResult,
 )
+from snowflake.connector import Error
+
+BINARY_OUTPUT_FORMATS = (OutputFormat.ARROW, OutputFormat.PARQUET)
 
 NO_ITEMS_FOUND: str = "No data"
+# tables are printed in pages, so memory used does not grow with the amount of rows
+TABLE_PAGE_SIZE = 1000
+# rows which are not available as Arrow batches are converted in chunks of this size
+ARROW_CHUNK_SIZE = 10000
 
 # ensure we do not break URLs that wrap lines
 get_console().soft_wrap = True
@@ -52,9 +60,17 @@ def _get_format_type() -> OutputFormat:
 
 
 def _get_table():
+    from rich.table import Table
+
     return Table(show_header=True, box=box.ASCII)
 
 
+def _pages(items: Iterable[Any], page_size: int) -> Iterator[List[Any]]:
+    items = iter(items)
+    while page := list(islice(items, page_size)):
+        yield page
+
+
 def _print_multiple_table_results(obj: CollectionResult):
     if isinstance(obj, QueryResult):
         rich_print(obj.query)
@@ -64,15 +80,14 @@ def _print_multiple_table_results(obj: CollectionResult):
     except StopIteration:
         rich_print(NO_ITEMS_FOUND, end="\n\n")
         return
-    table = _get_table()
-    for column in first_item.keys():
-        table.add_column(column, overflow="fold")
-    with Live(table, refresh_per_second=4):
-        table.add_row(*[str(i) for i in first_item.values()])
-        for item in items:
+    columns = list(first_item.keys())
+    for page in _pages(chain([first_item], items), TABLE_PAGE_SIZE):
+        table = _get_table()
+        for column in columns:
+            table.add_column(column, overflow="fold")
+        for item in page:
             table.add_row(*[str(i) for i in item.values()])
-    # Add separator between tables
-    rich_print()
+        rich_print(table)
 
 
 def is_structured_format(output_format):
@@ -84,28 +99,173 @@ def print_structured(result: CommandResult):
     if isinstance(result, MultipleResults):
         _stream_json(result)
     else:
-        return json.dump(result, sys.stdout, cls=CustomJSONEncoder, indent=4)
+        _stream_json_value(result, indent_size=4, level=0)
 
 
-def _stream_json(result):
+_NO_MORE_ELEMENTS = object()
+
+
+def _stream_json(result: MultipleResults):
     """Simple helper for streaming multiple results as a JSON."""
     indent_size = 2
+    sys.stdout.write("[\n")
+    results = result.result
+    res = next(results, _NO_MORE_ELEMENTS)
+    while res is not _NO_MORE_ELEMENTS:
+        sys.stdout.write(" " * indent_size)
+        _stream_json_value(res, indent_size=indent_size, level=1)
+        if (res := next(results, _NO_MORE_ELEMENTS)) is not _NO_MORE_ELEMENTS:
+            sys.stdout.write(",\n")
+    sys.stdout.write("\n]\n")
 
-    class _Indented:
-        def __init__(self, stream: TextIO):
-            self._stream = stream
 
-        def write(self, text: str):
-            return self._stream.write(indent(text, " " * indent_size))
+def _stream_json_value(value: Any, indent_size: int, level: int):
+    """
+    Writes value formatted as json.dump(value, indent=indent_size) nested [level] times.
+    Collections are written element by element, without loading them into memory.
+    """
+    if not isinstance(value, CollectionResult):
+        text = json.dumps(value, cls=CustomJSONEncoder, indent=indent_size)
+        sys.stdout.write(text.replace("\n", "\n" + " " * indent_size * level))
+        return
+
+    elements = value.result
+    element = next(elements, _NO_MORE_ELEMENTS)
+    if element is _NO_MORE_ELEMENTS:
+        sys.stdout.write("[]")
+        return
+    sys.stdout.write("[\n")
+    while element is not _NO_MORE_ELEMENTS:
+        sys.stdout.write(" " * indent_size * (level + 1))
+        _stream_json_value(element, indent_size=indent_size, level=level + 1)
+        if (element := next(elements, _NO_MORE_ELEMENTS)) is not _NO_MORE_ELEMENTS:
+            sys.stdout.write(",\n")
+    sys.stdout.write("\n" + " " * indent_size * level + "]")
+
+
+def _flatten_results(result: CommandResult | None) -> Iterator[CommandResult]:
+    if isinstance(result, MultipleResults):
+        yield from result.result
+    elif result is not None:
+        yield result
+
+
+def _columns_and_rows(obj: CommandResult) -> Tuple[List[str], Iterator[Tuple]]:
+    """Returns column names and rows of a result, reading query results directly from cursor."""
+    if isinstance(obj, QueryResult) and not isinstance(obj, QueryJsonValueResult):
+        return obj.column_names, obj.rows
+    if isinstance(obj, CollectionResult):
+        items = obj.result
+        first_item = next(items, None)
+        if first_item is None:
+            return [], iter([])
+        return list(first_item.keys()), (
+            tuple(item.values()) for item in chain([first_item], items)
+        )
+    if not obj.result:
+        return [], iter([])
+    return list(obj.result.keys()), iter([tuple(obj.result.values())])
+
+
+def print_csv(result: CommandResult | None):
+    """Prints results as CSV. Results of multiple queries are separated by an empty line."""
+    writer = csv.writer(sys.stdout, lineterminator="\n")
+    for i, res in enumerate(_flatten_results(result)):
+        if i:
+            sys.stdout.write("\n")
+        columns, rows = _columns_and_rows(res)
+        if columns:
+            writer.writerow(columns)
+            writer.writerows(tuple(_csv_value(value) for value in row) for row in rows)
 
-    print("[")
-    results = result.result
-    res = next(results, None)
-    while res:
-        json.dump(res, _Indented(sys.stdout), cls=CustomJSONEncoder, indent=indent_size)  # type: ignore
-        if res := next(results, None):
-            print(",")
-    print("\n]")
+
+def _csv_value(value: Any) -> Any:
+    """Serializes structured values like arrays and objects as in JSON output."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=CustomJSONEncoder)
+    return value
+
+
+def print_ndjson(result: CommandResult | None):
+    """Prints rows of all results as JSON objects, one per line."""
+    encoder = CustomJSONEncoder()
+    for res in _flatten_results(result):
+        columns, rows = _columns_and_rows(res)
+        for row in rows:
+            sys.stdout.write(encoder.encode(dict(zip(columns, row))))
+            sys.stdout.write("\n")
+
+
+def _arrow_tables(obj: CommandResult) -> Iterator:
+    """
+    Yields result as pyarrow tables. Query results are read from Arrow batches
+    returned by the connector when available.
+    """
+    import pyarrow
+
+    if isinstance(obj, QueryResult) and not isinstance(obj, QueryJsonValueResult):
+        try:
+            batches = obj.cursor.fetch_arrow_batches()
+            first_batch = next(batches, None)
+        except Error:
+            # result is not in Arrow format or connector is missing pandas extra
+            pass
+        else:
+            if first_batch is not None:
+                yield first_batch
+                yield from batches
+                return
+
+    columns, rows = _columns_and_rows(obj)
+    schema = None
+    for chunk in _pages(rows, ARROW_CHUNK_SIZE):
+        table = pyarrow.Table.from_pylist(
+            [dict(zip(columns, row)) for row in chunk], schema=schema
+        )
+        schema = table.schema
+        yield table
+    if schema is None:
+        yield pyarrow.table({column: pyarrow.array([]) for column in columns})
+
+
+def print_arrow(result: CommandResult | None, output_format: OutputFormat):
+    """Writes result to stdout as Arrow IPC stream or Parquet file."""
+    try:
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ClickException(
+            f"Output format {output_format.value} requires pyarrow. "
+            "Install it with `pip install snowflake-cli-labs[arrow]`."
+        )
+
+    results = _flatten_results(result)
+    obj = next(results, None)
+    if next(results, None) is not None:
+        raise ClickException(
+            f"Output format {output_format.value} supports only a single result."
+        )
+    if obj is None:
+        return
+    if sys.stdout.isatty():
+        raise ClickException(
+            f"Output format {output_format.value} is binary and cannot be written to a terminal. "
+            "Redirect the output to a file or another program."
+        )
+
+    sys.stdout.flush()
+    sink = sys.stdout.buffer
+    writer = None
+    for table in _arrow_tables(obj):
+        if writer is None:
+            if output_format == OutputFormat.ARROW:
+                writer = pyarrow.ipc.new_stream(sink, table.schema)
+            else:
+                writer = pyarrow.parquet.ParquetWriter(sink, table.schema)
+        writer.write_table(table)
+    if writer is not None:
+        writer.close()
+    sink.flush()
 
 
 def print_unstructured(obj: CommandResult | None):
@@ -134,10 +294,29 @@ def _print_single_table(obj):
     rich_print(table)
 
 
+def render_text(*renderables: Any, width: int = 120) -> str:
+    """Renders objects the way they would be printed, as plain text without colors."""
+    from io import StringIO
+
+    from rich.console import Console
+
+    output = StringIO()
+    console = Console(file=output, width=width, no_color=True)
+    for renderable in renderables:
+        console.print(renderable)
+    return output.getvalue().rstrip("\n")
+
+
 def print_result(cmd_result: CommandResult, output_format: OutputFormat | None = None):
     output_format = output_format or _get_format_type()
     if is_structured_format(output_format):
         print_structured(cmd_result)
+    elif output_format == OutputFormat.CSV:
+        print_csv(cmd_result)
+    elif output_format == OutputFormat.NDJSON:
+        print_ndjson(cmd_result)
+    elif output_format in BINARY_OUTPUT_FORMATS:
+        print_arrow(cmd_result, output_format)
     elif isinstance(cmd_result, MultipleResults):
         for res in cmd_result.result:
             print_result(res)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import click
+from rich.table import Table
+from snowflake.cli.__about__ import VERSION
+from snowflake.cli.api.cli_global_context import cli_context
+from snowflake.cli.api.query_trace import QueryTraceFormat, QueryTracer, TracedQuery
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.app.printing import render_text
+from snowflake.connector.errors import Error
+
+log = logging.getLogger(__name__)
+
+# query history of a session is looked up in one round trip, up to this many queries
+QUERY_HISTORY_LIMIT = 10000
+_NS_PER_MS = 1_000_000
+
+
+def report_traced_queries() -> None:
+    """
+    Writes the report of statements executed by the command, if queries are traced,
+    to standard error or to the file given with --trace-queries-file.
+    """
+    tracer = cli_context.query_tracer
+    if tracer is None:
+        return
+    queries = tracer.queries
+    _fill_server_elapsed_times(queries)
+
+    if tracer.output_format == QueryTraceFormat.TABLE:
+        report = _render_table(queries)
+    elif tracer.output_format == QueryTraceFormat.JSON:
+        report = json.dumps([_query_to_dict(query) for query in queries], indent=4)
+    else:
+        report = json.dumps(_render_otel(tracer, queries, _command_name()), indent=4)
+
+    output_file = cli_context.trace_queries_file
+    if output_file is not None:
+        SecurePath(output_file).write_text(report + "\n")
+    else:
+        sys.stderr.write(report + "\n")
+        sys.stderr.flush()
+
+
+def _fill_server_elapsed_times(queries: List[TracedQuery]) -> None:
+    """
+    Looks up elapsed times of traced queries in the query history of the session.
+    Queries which cannot be found keep no server elapsed time.
+    """
+    query_ids = [query.query_id for query in queries if query.query_id]
+    if not query_ids:
+        return
+    placeholders = ", ".join(["%s"] * len(query_ids))
+    try:
+        # executed directly on the connection, so the lookup itself is not traced
+        cursor = cli_context.connection.cursor()
+        cursor.execute(
+            "select query_id, total_elapsed_time from table("
+            "information_schema.query_history_by_session("
+            f"result_limit => {QUERY_HISTORY_LIMIT})) "
+            f"where query_id in ({placeholders})",
+            query_ids,
+        )
+        elapsed = {query_id: time for query_id, time in cursor.fetchall()}
+    except Error as err:
+        log.debug("Could not look up server elapsed times: %s", err)
+        return
+    for query in queries:
+        if query.query_id in elapsed:
+            query.server_elapsed_ms = elapsed[query.query_id]
+
+
+def _query_to_dict(query: TracedQuery) -> Dict[str, Any]:
+    return {
+        "statement_hash": query.statement_hash,
+        "query_id": query.query_id,
+        "client_latency_ms": round(query.client_latency_ns / _NS_PER_MS, 3),
+        "server_elapsed_ms": query.server_elapsed_ms,
+        "rows": query.rows,
+    }
+
+
+def _render_table(queries: List[TracedQuery]) -> str:
+    table = Table(title="Executed queries")
+    for column in ("#", "statement hash", "query id", "client ms", "server ms"):
+        table.add_column(column)
+    table.add_column("rows", justify="right")
+    for number, query in enumerate(queries, start=1):
+        values = _query_to_dict(query)
+        table.add_row(
+            str(number),
+            *(
+                "" if values[key] is None else str(values[key])
+                for key in (
+                    "statement_hash",
+                    "query_id",
+                    "client_latency_ms",
+                    "server_elapsed_ms",
+                    "rows",
+                )
+            ),
+        )
+    total_ms = sum(query.client_latency_ns for query in queries) / _NS_PER_MS
+    return render_text(
+        table, f"{len(queries)} queries, {total_ms:.3f} ms total client latency"
+    )
+
+
+def _render_otel(
+    tracer: QueryTracer, queries: List[TracedQuery], command_name: str
+) -> Dict[str, Any]:
+    """
+    Returns spans in OpenTelemetry protocol JSON encoding: a span covering the
+    command, with a child span for every executed statement.
+    """
+    trace_id = os.urandom(16).hex()
+    command_span_id = os.urandom(8).hex()
+    ended_at_ns = max(
+        [tracer.started_at_ns]
+        + [query.started_at_ns + query.client_latency_ns for query in queries]
+    )
+    spans = [
+        {
+            "traceId": trace_id,
+            "spanId": command_span_id,
+            "name": command_name,
+            "kind": 1,
+            "startTimeUnixNano": str(tracer.started_at_ns),
+            "endTimeUnixNano": str(ended_at_ns),
+            "attributes": [],
+        }
+    ]
+    for query in queries:
+        attributes = {
+            "db.system": "snowflake",
+            "db.statement.hash": query.statement_hash,
+            "snowflake.query_id": query.query_id,
+            "snowflake.server_elapsed_ms": query.server_elapsed_ms,
+            "db.response.returned_rows": query.rows,
+        }
+        spans.append(
+            {
+                "traceId": trace_id,
+                "spanId": os.urandom(8).hex(),
+                "parentSpanId": command_span_id,
+                "name": query.statement_hash or "query",
+                "kind": 3,
+                "startTimeUnixNano": str(query.started_at_ns),
+                "endTimeUnixNano": str(query.started_at_ns + query.client_latency_ns),
+                "attributes": [
+                    _otel_attribute(key, value)
+                    for key, value in attributes.items()
+                    if value is not None
+                ],
+            }
+        )
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        _otel_attribute("service.name", "snowflake-cli"),
+                        _otel_attribute("service.version", VERSION),
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": "snowflake.cli"}, "spans": spans}],
+            }
+        ]
+    }
+
+
+def _otel_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _command_name() -> str:
+    context: Optional[click.Context] = click.get_current_context(silent=True)
+    return context.command_path if context else "snow"
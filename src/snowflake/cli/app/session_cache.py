@@ -0,0 +1,240 @@
+"""
+Opt-in on-disk cache of Snowflake sessions.
+
+Session and master tokens of a connection are stored in a file readable only by
+the owner, keyed by a hash of resolved connection parameters. Later invocations
+using the same parameters resume the session instead of logging in again.
+Parameters include secrets like passwords, so they are hashed with HMAC using a
+random key of the installation, which prevents guessing them from file names.
+
+Resuming a session keeps whatever role, warehouse, database and schema previous
+invocations switched to, so the ones the session started with are stored too
+and restored when it is resumed.
+"""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.connector import SnowflakeConnection
+from snowflake.connector.config_manager import CONFIG_MANAGER
+from snowflake.connector.errors import Error
+
+log = logging.getLogger(__name__)
+
+SESSION_CACHE_DIRECTORY_NAME = "session_cache"
+SESSION_CACHE_KEY_FILE_NAME = "cache.key"
+_CACHE_KEY_SIZE = 32
+
+# parameters which do not identify the session
+_IGNORED_CONNECTION_PARAMETERS = {"passcode", "application"}
+# objects in use by a session, in the order they are restored
+_SESSION_CONTEXT = ("role", "warehouse", "database", "schema")
+
+
+@dataclass
+class CachedSession:
+    session_token: str
+    master_token: str
+    master_validity_in_seconds: int
+    expires_at: float
+    context: Dict[str, Optional[str]] = field(default_factory=dict)
+    "Role, warehouse, database and schema in use right after logging in"
+
+    def is_expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+    def as_connection_parameters(self) -> Dict:
+        return {
+            "session_token": self.session_token,
+            "master_token": self.master_token,
+            "master_validity_in_seconds": self.master_validity_in_seconds,
+        }
+
+
+def session_cache_directory() -> SecurePath:
+    return SecurePath(CONFIG_MANAGER.file_path.parent) / SESSION_CACHE_DIRECTORY_NAME
+
+
+def session_cache_key(connection_parameters: Dict) -> str:
+    identifying_parameters = {
+        k: v.hex() if isinstance(v, bytes) else v
+        for k, v in connection_parameters.items()
+        if k not in _IGNORED_CONNECTION_PARAMETERS
+    }
+    serialized = json.dumps(identifying_parameters, sort_keys=True, default=str)
+    return hmac.new(
+        _installation_key(), serialized.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def _installation_key() -> bytes:
+    """
+    Returns the random key of the session cache, created on first use in a file
+    readable only by the owner.
+    """
+    cache_directory = session_cache_directory()
+    key_file = cache_directory / SESSION_CACHE_KEY_FILE_NAME
+    if not key_file.exists():
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        # written under a temporary name and linked, so concurrent invocations
+        # never read a partial key and all of them use the first one created
+        temporary_file = cache_directory / f".{key_file.path.name}.{os.getpid()}"
+        with temporary_file.open("wb") as f:
+            f.write(os.urandom(_CACHE_KEY_SIZE))
+        try:
+            os.link(temporary_file.path, key_file.path)
+        except FileExistsError:
+            pass
+        except OSError:
+            # file systems without hard links
+            os.replace(temporary_file.path, key_file.path)
+        finally:
+            temporary_file.unlink(missing_ok=True)
+    with key_file.open("rb", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB) as f:
+        return f.read()
+
+
+def _session_file(key: str) -> SecurePath:
+    return session_cache_directory() / f"{key}.json"
+
+
+def load_session(key: str) -> Optional[CachedSession]:
+    session_file = _session_file(key)
+    if not session_file.exists():
+        return None
+    try:
+        session = CachedSession(
+            **json.loads(
+                session_file.read_text(file_size_limit_mb=DEFAULT_SIZE_LIMIT_MB)
+            )
+        )
+    except (ValueError, TypeError):
+        log.debug("Removing malformed cached session %s", key)
+        remove_session(key)
+        return None
+    if session.is_expired():
+        # the session expired on the server together with its master token
+        log.debug("Cached session %s expired", key)
+        remove_session(key)
+        return None
+    return session
+
+
+def save_session(key: str, connection: SnowflakeConnection) -> None:
+    rest = connection.rest
+    if not rest or not rest.token or not rest.master_token:
+        return
+    session = CachedSession(
+        session_token=rest.token,
+        master_token=rest.master_token,
+        master_validity_in_seconds=rest.master_validity_in_seconds,
+        expires_at=time.time() + rest.master_validity_in_seconds,
+        context=session_context(connection),
+    )
+    cache_directory = session_cache_directory()
+    cache_directory.mkdir(parents=True, exist_ok=True)
+    _session_file(key).write_text(json.dumps(asdict(session)))
+
+
+def remove_session(key: str) -> None:
+    _session_file(key).unlink(missing_ok=True)
+
+
+def end_session(connection: SnowflakeConnection) -> None:
+    """
+    Closes the connection and ends its session, which is kept alive on the server
+    after closing the connection otherwise.
+    """
+    if connection.rest:
+        try:
+            connection.rest.delete_session()
+        except Error as err:
+            log.debug("Could not end session: %s", err)
+    connection.close()
+
+
+def session_context(connection: SnowflakeConnection) -> Dict[str, Optional[str]]:
+    """Returns the role, warehouse, database and schema used by the session."""
+    row = (
+        connection.cursor()
+        .execute(
+            "select current_role(), current_warehouse(), current_database(), current_schema()"
+        )
+        .fetchone()
+    )
+    return dict(zip(_SESSION_CONTEXT, row))
+
+
+def restore_session_context(
+    connection: SnowflakeConnection,
+    session: CachedSession,
+    session_parameters: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Switches a resumed session back to the objects it used right after logging
+    in, and sets configured session parameters again. Returns False if the state
+    of the session cannot be restored, e.g. because a database was selected
+    in a session which started without one.
+    """
+    return restore_context(connection, session.context, session_parameters)
+
+
+def restore_context(
+    connection: SnowflakeConnection,
+    initial: Dict[str, Optional[str]],
+    session_parameters: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Switches the session back to the given role, warehouse, database and schema,
+    as returned by [session_context]. Returns False if they cannot be restored.
+    """
+    if set(initial) != set(_SESSION_CONTEXT):
+        return False
+    current = session_context(connection)
+    changed = [kind for kind in _SESSION_CONTEXT if current[kind] != initial[kind]]
+    if "database" in changed and "schema" not in changed:
+        # selecting a database selects its default schema as well
+        changed.append("schema")
+
+    statements: List[str] = []
+    for kind in changed:
+        if initial[kind] is None:
+            return False
+        name = _quote(initial[kind])
+        if kind == "schema":
+            if initial["database"] is None:
+                return False
+            name = f"{_quote(initial['database'])}.{name}"
+        statements.append(f"use {kind} {name}")
+    if session_parameters:
+        assignments = " ".join(
+            f"{name} = {_literal(value)}" for name, value in session_parameters.items()
+        )
+        statements.append(f"alter session set {assignments}")
+
+    cursor = connection.cursor()
+    for statement in statements:
+        log.debug("Restoring cached session: %s", statement)
+        cursor.execute(statement)
+    return True
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
@@ -13,7 +13,16 @@ from snowflake.cli.api.exceptions import (
     InvalidConnectionConfiguration,
     SnowflakeConnectionError,
 )
+from snowflake.cli.api.feature_flags import FeatureFlag
 from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.app.session_cache import (
+    end_session,
+    load_session,
+    remove_session,
+    restore_session_context,
+    save_session,
+    session_cache_key,
+)
 from snowflake.cli.app.telemetry import command_info
 from snowflake.connector import SnowflakeConnection
 from snowflake.connector.errors import DatabaseError, ForbiddenError
@@ -78,20 +87,59 @@ def connect_to_snowflake(
             ] = diag_allowlist_path
 
     try:
-        # Whatever output is generated when creating connection,
-        # we don't want it in our output. This is particularly important
-        # for cases when external browser and json format are used.
-        with contextlib.redirect_stdout(None):
-            return snowflake.connector.connect(
-                application=command_info(),
-                **connection_parameters,
-            )
+        if FeatureFlag.ENABLE_SESSION_CACHE.is_enabled():
+            return _connect_with_session_cache(connection_parameters)
+        return _connect(connection_parameters)
     except ForbiddenError as err:
         raise SnowflakeConnectionError(err)
     except DatabaseError as err:
         raise InvalidConnectionConfiguration(err.msg)
 
 
+def _connect(connection_parameters: Dict) -> SnowflakeConnection:
+    # Whatever output is generated when creating connection,
+    # we don't want it in our output. This is particularly important
+    # for cases when external browser and json format are used.
+    with contextlib.redirect_stdout(None):
+        return snowflake.connector.connect(
+            application=command_info(),
+            **connection_parameters,
+        )
+
+
+def _connect_with_session_cache(connection_parameters: Dict) -> SnowflakeConnection:
+    key = session_cache_key(connection_parameters)
+    # session has to outlive the connection to be resumed by the next invocation
+    connection_parameters = {**connection_parameters, "server_session_keep_alive": True}
+
+    cached_session = load_session(key)
+    if cached_session:
+        connection = None
+        try:
+            connection = _connect(
+                {**connection_parameters, **cached_session.as_connection_parameters()}
+            )
+            # resuming a session does not apply the connection configuration,
+            # and previous invocations may have switched to other objects
+            if restore_session_context(
+                connection,
+                cached_session,
+                connection_parameters.get("session_parameters"),
+            ):
+                return connection
+            log.debug("Cannot restore state of cached session, logging in again")
+        except DatabaseError as err:
+            log.debug("Cannot resume cached session, logging in again: %s", err)
+        remove_session(key)
+        if connection is not None:
+            # the session is replaced, so it would not be resumed anymore
+            end_session(connection)
+
+    connection = _connect(connection_parameters)
+    save_session(key, connection)
+    return connection
+
+
 def _update_connection_details_with_private_key(connection_parameters: Dict):
     if "private_key_path" in connection_parameters:
         if connection_parameters.get("authenticator") == "SNOWFLAKE_JWT":
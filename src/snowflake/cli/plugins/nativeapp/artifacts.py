@@ -1,13 +1,36 @@
+import hashlib
+import json
+import logging
 import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from click import ClickException
+from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
 from snowflake.cli.api.project.schemas.native_app.path_mapping import PathMapping
-from snowflake.cli.api.secure_path import SecurePath
-from yaml import safe_load
+from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+from snowflake.cli.api.utils.lazy_import import lazy_import
+from snowflake.connector.config_manager import CONFIG_MANAGER
+
+yaml = lazy_import("yaml")
+
+log = logging.getLogger(__name__)
+
+BUNDLE_MANIFEST_DIRECTORY_NAME = "bundle_manifests"
+# number of files linked or copied concurrently into the deploy root
+BUNDLE_MAX_WORKERS = 8
+
+LINK_SYMLINK = "symlink"
+LINK_HARDLINK = "hardlink"
+LINK_REFLINK = "reflink"
+LINK_COPY = "copy"
+# ioctl cloning a file on Linux file systems with copy-on-write support
+_FICLONE = 0x40049409
 
 
 class DeployRootError(ClickException):
@@ -129,25 +152,6 @@ def delete(path: Path) -> None:
         spath.rmdir(recursive=True)  # remove dir and all contains
 
 
-def symlink_or_copy(src: Path, dst: Path, makedirs=True, overwrite=True) -> None:
-    """
-    Tries to create a symlink to src at dst; failing that (i.e. in Windows
-    without Administrator / Developer Mode) copies the file from src to dst instead.
-    If makedirs is True, the directory hierarchy above dst is created if any
-    of those directories do not exist.
-    """
-    ssrc = SecurePath(src)
-    sdst = SecurePath(dst)
-    if makedirs:
-        sdst.parent.mkdir(parents=True, exist_ok=True)
-    if overwrite:
-        delete(dst)
-    try:
-        os.symlink(src, dst)
-    except OSError:
-        ssrc.copy(dst)
-
-
 def translate_artifact(item: Union[dict, str]) -> ArtifactMapping:
     """
     Builds an artifact mapping from a project definition value.
@@ -174,7 +178,8 @@ def get_source_paths(artifact: ArtifactMapping, project_root: Path) -> List[Path
     source_paths: List[Path]
 
     if is_glob(artifact.src):
-        source_paths = list(project_root.glob(artifact.src))
+        # globs of all artifacts share listings of the project directories
+        source_paths = cli_context.file_index(project_root).glob(artifact.src)
         if not source_paths:
             raise GlobMatchedNothingError(artifact.src)
     else:
@@ -200,6 +205,10 @@ def build_bundle(
     """
     Prepares a local folder (deploy_root) with configured app artifacts.
     This folder can then be uploaded to a stage.
+
+    The deploy root is updated incrementally: entries which are no longer mapped
+    are removed, and only files which are missing or whose mapping or source
+    changed since the last bundle are linked again.
     """
     resolved_root = deploy_root.resolve()
     if resolved_root.exists() and not resolved_root.is_dir():
@@ -212,10 +221,66 @@ def build_bundle(
             f"Deploy root {resolved_root} is not a descendent of the project directory!"
         )
 
+    bundle = _resolve_bundle(project_root, resolved_root, artifacts)
+
     # users may have removed files or entire artifact mappings from their project
-    # definition since the last time we bundled; we need to clear the deploy root first
-    if resolved_root.exists():
-        delete(resolved_root)
+    # definition since the last time we bundled; we need to remove them
+    SecurePath(resolved_root).mkdir(parents=True, exist_ok=True)
+    _remove_unmapped_entries(resolved_root, bundle)
+
+    manifest = BundleManifest(resolved_root)
+    to_link = [
+        (src, resolved_root / relpath)
+        for relpath, src in bundle.items()
+        if not manifest.is_current(relpath, src)
+    ]
+    if len(to_link) > 1:
+        with ThreadPoolExecutor(max_workers=BUNDLE_MAX_WORKERS) as executor:
+            kinds = list(executor.map(lambda entry: link_file(*entry), to_link))
+    else:
+        kinds = [link_file(src, dest) for src, dest in to_link]
+    manifest.update(
+        bundle,
+        {
+            dest.relative_to(resolved_root).as_posix(): kind
+            for (_, dest), kind in zip(to_link, kinds)
+        },
+    )
+    cli_context.invalidate_file_indexes()
+
+
+def _resolve_bundle(
+    project_root: Path, resolved_root: Path, artifacts: List[ArtifactMapping]
+) -> Dict[str, Path]:
+    """
+    Returns source files of the bundle by their paths relative to the deploy root.
+    Directories are expanded to the files they contain; files mapped by later
+    artifacts replace files mapped to the same paths by earlier ones.
+    """
+    bundle: Dict[str, Path] = {}
+
+    def _add(source_path: Path, dest_path: Path):
+        relpath = dest_path.relative_to(resolved_root)
+        # whatever was mapped to the path, inside of it, or to a file in place of
+        # one of its parent directories is replaced
+        key = relpath.as_posix()
+        for mapped in [
+            p
+            for p in bundle
+            if p == key or p.startswith(f"{key}/") or key.startswith(f"{p}/")
+        ]:
+            del bundle[mapped]
+        if source_path.is_dir():
+            for root, directories, files in os.walk(source_path, followlinks=True):
+                # the deploy root itself is never part of the bundle
+                directories[:] = [
+                    d for d in directories if Path(root, d).resolve() != resolved_root
+                ]
+                for name in files:
+                    file = Path(root, name)
+                    bundle[(relpath / file.relative_to(source_path)).as_posix()] = file
+        else:
+            bundle[relpath.as_posix()] = source_path
 
     for artifact in artifacts:
         dest_path = resolve_without_follow(Path(resolved_root, artifact.dest))
@@ -228,7 +293,7 @@ def build_bundle(
 
             # copy all files as children of the given destination path
             for source_path in source_paths:
-                symlink_or_copy(source_path, dest_path / source_path.name)
+                _add(source_path, dest_path / source_path.name)
         else:
             # ensure we are copying into the deploy root, not replacing it!
             if resolved_root not in dest_path.parents:
@@ -236,18 +301,169 @@ def build_bundle(
 
             if len(source_paths) == 1:
                 # copy a single file as the given destination path
-                symlink_or_copy(source_paths[0], dest_path)
+                _add(source_paths[0], dest_path)
             else:
                 # refuse to map multiple source files to one destination (undefined behaviour)
                 raise TooManyFilesError(dest_path)
 
+    return bundle
+
+
+def _remove_unmapped_entries(resolved_root: Path, bundle: Dict[str, Path]) -> None:
+    """
+    Removes files and links from the deploy root which are not part of the bundle,
+    and directories which are left empty.
+    """
+    for root, directories, files in os.walk(resolved_root):
+        root_path = Path(root)
+        for name in list(directories):
+            path = root_path / name
+            # symlinked directories are not walked, files are linked one by one
+            if (
+                path.is_symlink()
+                or path.relative_to(resolved_root).as_posix() in bundle
+            ):
+                directories.remove(name)
+                _remove_path(path)
+        for name in files:
+            path = root_path / name
+            if path.relative_to(resolved_root).as_posix() not in bundle:
+                _remove_path(path)
+
+    for root, _, _ in os.walk(resolved_root, topdown=False):
+        if Path(root) != resolved_root and not os.listdir(root):
+            os.rmdir(root)
+
+
+def _remove_path(path: Path) -> None:
+    if path.is_symlink():
+        path.unlink()
+    else:
+        delete(path)
+
+
+def link_file(src: Path, dst: Path) -> str:
+    """
+    Makes the file at src available at dst, with the cheapest method the file
+    system supports: a symlink, a hardlink, a reflink or a copy, in this order.
+    Returns the kind of the created link.
+    """
+    SecurePath(dst.parent).mkdir(parents=True, exist_ok=True)
+    if dst.is_symlink() or dst.exists():
+        _remove_path(dst)
+    try:
+        os.symlink(src, dst)
+        return LINK_SYMLINK
+    except OSError:
+        pass
+    try:
+        os.link(src, dst)
+        return LINK_HARDLINK
+    except OSError:
+        pass
+    if _reflink(src, dst):
+        return LINK_REFLINK
+    shutil.copy2(src, dst)
+    return LINK_COPY
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clones the file on file systems supporting copy-on-write, on Linux."""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def bundle_manifest_directory() -> SecurePath:
+    return SecurePath(CONFIG_MANAGER.file_path.parent) / BUNDLE_MANIFEST_DIRECTORY_NAME
+
+
+class BundleManifest:
+    """
+    Persisted record of how files of a deploy root were linked to their sources.
+    Symlinked and hardlinked files stay current as long as they point to the same
+    source; reflinked and copied files as long as neither the source nor the
+    file in the deploy root changed size or modification time.
+    """
+
+    def __init__(self, deploy_root: Path):
+        self._root = deploy_root
+        key = hashlib.sha256(str(deploy_root).encode()).hexdigest()
+        self._file = bundle_manifest_directory() / f"{key}.json"
+        self._entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self._file.exists():
+            return {}
+        try:
+            entries = json.loads(self._file.read_text(file_size_limit_mb=UNLIMITED))
+        except ValueError:
+            log.debug("Ignoring malformed bundle manifest %s", self._file.path)
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def is_current(self, relpath: str, src: Path) -> bool:
+        entry = self._entries.get(relpath)
+        if not entry or entry.get("src") != str(src):
+            return False
+        dst = self._root / relpath
+        try:
+            if entry["kind"] == LINK_SYMLINK:
+                return dst.is_symlink() and os.readlink(dst) == str(src)
+            if dst.is_symlink():
+                return False
+            if entry["kind"] == LINK_HARDLINK:
+                return os.path.samefile(dst, src)
+            return entry["stat"] == [_stat_key(src), _stat_key(dst)]
+        except (OSError, KeyError):
+            return False
+
+    def update(self, bundle: Dict[str, Path], linked: Dict[str, str]) -> None:
+        """
+        Records the bundle, with kinds of links created now. Entries of files
+        which were not linked again are kept.
+        """
+        entries: Dict[str, Dict] = {}
+        for relpath, src in bundle.items():
+            kind = linked.get(relpath)
+            if kind is None:
+                entries[relpath] = self._entries[relpath]
+                continue
+            entry: Dict = {"src": str(src), "kind": kind}
+            if kind in (LINK_REFLINK, LINK_COPY):
+                entry["stat"] = [_stat_key(src), _stat_key(self._root / relpath)]
+            entries[relpath] = entry
+
+        if entries == self._entries:
+            return
+        self._entries = entries
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            self._file.write_text(json.dumps(entries))
+        except OSError as err:
+            log.debug("Could not save bundle manifest: %s", err)
+
+
+def _stat_key(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
 
 def find_manifest_file(deploy_root: Path) -> Path:
     """
     Find manifest.yml file, if available, in the deploy_root of the Snowflake Native App project.
     """
     resolved_root = deploy_root.resolve()
-    for root, _, files in os.walk(resolved_root):
+    for root, _, files in cli_context.file_index(resolved_root).walk():
         for file in files:
             if file.lower() == "manifest.yml":
                 return Path(os.path.join(root, file))
@@ -271,7 +487,7 @@ def find_version_info_in_manifest_file(
     with SecurePath(manifest_file).open(
         "r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB
     ) as file:
-        manifest_content = safe_load(file.read())
+        manifest_content = yaml.safe_load(file.read())
 
     version_name: Optional[str] = None
     patch_name: Optional[str] = None
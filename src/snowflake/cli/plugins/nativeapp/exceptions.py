@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from textwrap import dedent
+from typing import TYPE_CHECKING
 
-import jinja2
 from click.exceptions import ClickException
 
+if TYPE_CHECKING:
+    import jinja2
+
 
 class ApplicationPackageAlreadyExistsError(ClickException):
     """An application package not created by Snowflake CLI exists with the same name."""
@@ -14,8 +14,10 @@ from snowflake.cli.api.project.util import (
     to_identifier,
 )
 from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.cli.api.utils.rendering import generic_render_template
-from yaml import dump, safe_dump, safe_load
+
+yaml = lazy_import("yaml")
 
 log = logging.getLogger(__name__)
 
@@ -103,7 +105,7 @@ def _to_yaml_string(identifier: str):
     if is_valid_unquoted_identifier(identifier):
         return identifier
     else:
-        return dump(identifier).rstrip()
+        return yaml.dump(identifier).rstrip()
 
 
 def _render_snowflake_yml(parent_to_snowflake_yml: Path, project_identifier: str):
@@ -156,7 +158,7 @@ def _replace_snowflake_yml_name_with_project(
     with path_to_snowflake_yml.open(
         "r", read_file_limit_mb=DEFAULT_SIZE_LIMIT_MB
     ) as file:
-        contents = safe_load(file)
+        contents = yaml.safe_load(file)
 
     if (
         (contents is not None)
@@ -166,7 +168,7 @@ def _replace_snowflake_yml_name_with_project(
     ):
         contents["native_app"]["name"] = project_identifier
         with path_to_snowflake_yml.open("w") as file:
-            safe_dump(contents, file, sort_keys=False)
+            yaml.safe_dump(contents, file, sort_keys=False)
 
 
 def _validate_and_update_snowflake_yml(target_directory: Path, project_identifier: str):
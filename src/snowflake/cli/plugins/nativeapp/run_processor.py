@@ -1,13 +1,14 @@
+from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
 from typing import Optional
 
-import jinja2
 import typer
 from click import UsageError
 from snowflake.cli.api.console import cli_console as cc
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
 from snowflake.cli.api.project.schemas.native_app.native_app import NativeApp
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.cli.plugins.nativeapp.constants import (
     ALLOWED_SPECIAL_COMMENTS,
     COMMENT_COL,
@@ -33,22 +34,82 @@ from snowflake.cli.plugins.nativeapp.policy import PolicyBase
 from snowflake.cli.plugins.object.stage.diff import DiffResult
 from snowflake.cli.plugins.object.stage.manager import StageManager
 from snowflake.connector import ProgrammingError
-from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector.cursor import DictCursor, SnowflakeCursor
+from snowflake.connector.errors import Error
+
+jinja2 = lazy_import("jinja2")
 
 UPGRADE_RESTRICTION_CODES = {93044, 93055, 93045, 93046}
 
 
+@dataclass
+class RunPreflight:
+    """
+    State of the application package and the application object in the account,
+    fetched once at the beginning of `snow app run`.
+    """
+
+    app_pkg_row: Optional[dict]
+    app_pkg_distribution: Optional[str]
+    "None if the application package does not exist or the query failed"
+    app_row: Optional[dict]
+
+
 class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
     def __init__(self, project_definition: NativeApp, project_root: Path):
         super().__init__(project_definition, project_root)
 
-    def create_app_package(self) -> None:
+    def get_run_preflight(self) -> RunPreflight:
+        """
+        Fetches the application package, its distribution and the application
+        object with queries running concurrently, instead of one after another.
+        """
+        with self.use_role(self.package_role):
+            app_pkg_query, app_pkg_name = self._show_specific_object_query(
+                "application packages", self.package_name
+            )
+            show_app_pkg = self._execute_query_async(
+                app_pkg_query, cursor_class=DictCursor
+            )
+            # fails if the package does not exist, which is checked afterwards
+            describe_app_pkg = self._execute_query_async(
+                f"describe application package {self.package_name}"
+            )
+        with self.use_role(self.app_role):
+            app_query, app_name = self._show_specific_object_query(
+                "applications", self.app_name
+            )
+            show_app = self._execute_query_async(app_query, cursor_class=DictCursor)
+
+        self._wait_for_queries([show_app_pkg, describe_app_pkg, show_app])
+
+        app_pkg_row = self._specific_object_row(
+            app_pkg_query, show_app_pkg, app_pkg_name
+        )
+        app_pkg_distribution = None
+        if app_pkg_row:
+            try:
+                for row in describe_app_pkg.fetchall():
+                    if row[0].lower() == "distribution":
+                        app_pkg_distribution = row[1].lower()
+            except Error:
+                # the describe query is repeated with the usual error handling
+                pass
+        return RunPreflight(
+            app_pkg_row=app_pkg_row,
+            app_pkg_distribution=app_pkg_distribution,
+            app_row=self._specific_object_row(app_query, show_app, app_name),
+        )
+
+    def create_app_package(self, preflight: Optional[RunPreflight] = None) -> None:
         """
         Creates the application package with our up-to-date stage if none exists.
         """
 
         # 1. Check for existing existing application package
-        show_obj_row = self.get_existing_app_pkg_info()
+        show_obj_row = (
+            preflight.app_pkg_row if preflight else self.get_existing_app_pkg_info()
+        )
 
         if show_obj_row:
             # 1. Check for the right owner role
@@ -57,7 +118,9 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             )
 
             # 2. Check distribution of the existing application package
-            actual_distribution = self.get_app_pkg_distribution_in_snowflake
+            actual_distribution = (
+                preflight and preflight.app_pkg_distribution
+            ) or self.get_app_pkg_distribution_in_snowflake
             if not self.verify_project_distribution(actual_distribution):
                 cc.warning(
                     f"Continuing to execute `snow app run` on application package {self.package_name} with distribution '{actual_distribution}'."
@@ -115,7 +178,7 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
         # once we're sure all the templates expanded correctly, execute all of them
         try:
             if self.package_warehouse:
-                self._execute_query(f"use warehouse {self.package_warehouse}")
+                self.use_warehouse(self.package_warehouse)
 
             for i, queries in enumerate(queued_queries):
                 cc.step(f"Applying package script: {self.package_scripts[i]}")
@@ -125,7 +188,9 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
                 err, role=self.package_role, warehouse=self.package_warehouse
             )
 
-    def _create_dev_app(self, diff: DiffResult) -> None:
+    def _create_dev_app(
+        self, diff: DiffResult, preflight: Optional[RunPreflight] = None
+    ) -> None:
         """
         (Re-)creates the application object with our up-to-date stage.
         """
@@ -134,14 +199,16 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             # 1. Need to use a warehouse to create an application object
             try:
                 if self.application_warehouse:
-                    self._execute_query(f"use warehouse {self.application_warehouse}")
+                    self.use_warehouse(self.application_warehouse)
             except ProgrammingError as err:
                 generic_sql_error_handler(
                     err=err, role=self.app_role, warehouse=self.application_warehouse
                 )
 
             # 2. Check for an existing application object by the same name
-            show_app_row = self.get_existing_app_info()
+            show_app_row = (
+                preflight.app_row if preflight else self.get_existing_app_info()
+            )
 
             # 3. If existing application object is found, perform a few validations and upgrade the application object.
             if show_app_row:
@@ -279,7 +346,7 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             # 1. Need to use a warehouse to create an application object
             try:
                 if self.application_warehouse:
-                    self._execute_query(f"use warehouse {self.application_warehouse}")
+                    self.use_warehouse(self.application_warehouse)
             except ProgrammingError as err:
                 generic_sql_error_handler(
                     err=err, role=self.app_role, warehouse=self.application_warehouse
@@ -385,15 +452,18 @@ class NativeAppRunProcessor(NativeAppManager, NativeAppCommandProcessor):
             )
             return
 
-        # 1. Create an empty application package, if none exists
-        self.create_app_package()
-
         with self.use_role(self.package_role):
-            # 2. now that the application package exists, create shared data
+            # 1. Fetch the state of the application package and application at once
+            preflight = self.get_run_preflight()
+
+            # 2. Create an empty application package, if none exists
+            self.create_app_package(preflight)
+
+            # 3. now that the application package exists, create shared data
             self._apply_package_scripts()
 
-            # 3. Upload files from deploy root local folder to the above stage
+            # 4. Upload files from deploy root local folder to the above stage
             diff = self.sync_deploy_root_with_stage(self.package_role)
 
-        # 4. Create an application if none exists, else upgrade the application
-        self._create_dev_app(diff)
+        # 5. Create an application if none exists, else upgrade the application
+        self._create_dev_app(diff, preflight)
@@ -1,18 +1,32 @@
 import hashlib
+import json
 import logging
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from snowflake.cli.api.cli_global_context import cli_context
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+from snowflake.connector.config_manager import CONFIG_MANAGER
 from snowflake.connector.cursor import SnowflakeCursor
 
 from .manager import StageManager
 
 MD5SUM_REGEX = r"^[A-Fa-f0-9]{32}$"
 CHUNK_SIZE_BYTES = 8192
+CHECKSUM_INDEX_DIRECTORY_NAME = "stage_checksum_index"
+# hashing a few files concurrently is not worth starting threads
+PARALLEL_HASHING_THRESHOLD = 8
+# hashlib releases the GIL while hashing, so threads hash files in parallel
+HASHING_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# files modified this recently may change again within the same mtime tick
+MTIME_GRANULARITY_NS = 2_000_000_000
 
 log = logging.getLogger(__name__)
 
@@ -122,6 +136,82 @@ def compute_md5sum(file: Path) -> str:
     return file_hash.hexdigest()
 
 
+def compute_md5sums(files: List[Path]) -> List[str]:
+    """
+    Returns hexidecimal checksums for the given files, computed concurrently if
+    there are many of them.
+    """
+    if len(files) >= PARALLEL_HASHING_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=HASHING_MAX_WORKERS) as executor:
+            return list(executor.map(compute_md5sum, files))
+    return [compute_md5sum(file) for file in files]
+
+
+def checksum_index_directory() -> SecurePath:
+    return SecurePath(CONFIG_MANAGER.file_path.parent) / CHECKSUM_INDEX_DIRECTORY_NAME
+
+
+class ChecksumIndex:
+    """
+    Persisted mapping of files in a local directory to their md5sums. Entries are
+    valid as long as size and modification time of the file did not change, so
+    unchanged files are not hashed again on later runs.
+    """
+
+    def __init__(self, root: Path):
+        self._root = root
+        key = hashlib.sha256(str(root.resolve()).encode()).hexdigest()
+        self._file = checksum_index_directory() / f"{key}.json"
+        self._entries: Dict[str, List] = self._load()
+
+    def _load(self) -> Dict[str, List]:
+        if not self._file.exists():
+            return {}
+        try:
+            entries = json.loads(self._file.read_text(file_size_limit_mb=UNLIMITED))
+        except ValueError:
+            log.debug("Ignoring malformed checksum index %s", self._file.path)
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def md5sums(self, files: List[Path]) -> Dict[Path, str]:
+        """
+        Returns md5sums of the given files, hashing only files which changed since
+        they were indexed. The index is updated to contain exactly the given files.
+        """
+        md5sums: Dict[Path, str] = {}
+        entries: Dict[str, List] = {}
+        to_compute = []
+        for file in files:
+            relpath = str(file.relative_to(self._root))
+            stat = file.stat()
+            entry = self._entries.get(relpath)
+            if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+                md5sums[file] = entry[2]
+                entries[relpath] = entry
+            else:
+                to_compute.append((file, relpath, stat))
+
+        hashed_at = time.time_ns()
+        computed = compute_md5sums([file for file, _, _ in to_compute])
+        for (file, relpath, stat), md5 in zip(to_compute, computed):
+            md5sums[file] = md5
+            if stat.st_mtime_ns + MTIME_GRANULARITY_NS < hashed_at:
+                entries[relpath] = [stat.st_size, stat.st_mtime_ns, md5]
+
+        if entries != self._entries:
+            self._save(entries)
+        return md5sums
+
+    def _save(self, entries: Dict[str, List]) -> None:
+        self._entries = entries
+        try:
+            self._file.parent.mkdir(parents=True, exist_ok=True)
+            self._file.write_text(json.dumps(entries))
+        except OSError as err:
+            log.debug("Could not save checksum index: %s", err)
+
+
 def enumerate_files(path: Path) -> List[Path]:
     """
     Get a list of all files in a directory (recursively).
@@ -129,14 +219,7 @@ def enumerate_files(path: Path) -> List[Path]:
     if not path.is_dir():
         raise ValueError("Path must point to a directory")
 
-    paths: List[Path] = []
-    for child in sorted(path.iterdir()):
-        if child.is_dir():
-            paths += enumerate_files(child)
-        else:
-            paths.append(child)
-
-    return paths
+    return cli_context.file_index(path).files()
 
 
 def strip_stage_name(path: str) -> str:
@@ -164,19 +247,27 @@ def stage_diff(local_path: Path, stage_fqn: str) -> DiffResult:
 
     result: DiffResult = DiffResult()
 
+    # N.B. we could compare local size vs remote size to skip the relatively-
+    # expensive md5sum operation, but after seeing a comment that says the value
+    # may not always be correctly populated, we'll ignore that column.
+    local_md5 = ChecksumIndex(local_path).md5sums(
+        [
+            local_file
+            for local_file in local_files
+            if is_valid_md5sum(
+                remote_md5.get(str(local_file.relative_to(local_path)), "")
+            )
+        ]
+    )
+
     for local_file in local_files:
         relpath = str(local_file.relative_to(local_path))
         if relpath not in remote_md5:
             # doesn't exist on the stage
             result.only_local.append(relpath)
         else:
-            # N.B. we could compare local size vs remote size to skip the relatively-
-            # expensive md5sum operation, but after seeing a comment that says the value
-            # may not always be correctly populated, we'll ignore that column.
             stage_md5sum = remote_md5[relpath]
-            if is_valid_md5sum(stage_md5sum) and stage_md5sum == compute_md5sum(
-                local_file
-            ):
+            if is_valid_md5sum(stage_md5sum) and stage_md5sum == local_md5[local_file]:
                 # the file definitely hasn't changed
                 result.identical.append(relpath)
             else:
@@ -208,8 +299,7 @@ def delete_only_on_stage_files(
     """
     Deletes all files from a Snowflake stage according to the input list of filenames, using a custom role.
     """
-    for _file in only_on_stage:
-        stage_manager.remove(stage_name=stage_fqn, path=_file, role=role)
+    stage_manager.remove_many(stage_name=stage_fqn, paths=only_on_stage, role=role)
 
 
 def put_files_on_stage(
@@ -223,17 +313,14 @@ def put_files_on_stage(
     """
     Uploads all files given input list of filenames on your local filesystem, to a Snowflake stage, using a custom role.
     """
+    uploads = []
     for _file in files:
         stage_sub_path = get_stage_path_from_file(_file)
         full_stage_path = (
             f"{stage_fqn}/{stage_sub_path}" if stage_sub_path else stage_fqn
         )
-        stage_manager.put(
-            local_path=deploy_root_path / _file,
-            stage_path=full_stage_path,
-            role=role,
-            overwrite=overwrite,
-        )
+        uploads.append((deploy_root_path / _file, full_stage_path))
+    stage_manager.put_many(uploads, role=role, overwrite=overwrite)
 
 
 def sync_local_diff_with_stage(
@@ -249,20 +336,21 @@ def sync_local_diff_with_stage(
     )
 
     try:
-        delete_only_on_stage_files(
-            stage_manager, stage_path, diff_result.only_on_stage, role
-        )
-        put_files_on_stage(
-            stage_manager,
-            stage_path,
-            deploy_root_path,
-            diff_result.different,
-            role,
-            overwrite=True,
-        )
-        put_files_on_stage(
-            stage_manager, stage_path, deploy_root_path, diff_result.only_local, role
-        )
+        # switch the role once for the whole sync instead of once per file
+        with stage_manager.use_role(role) if role else nullcontext():
+            delete_only_on_stage_files(
+                stage_manager, stage_path, diff_result.only_on_stage
+            )
+            put_files_on_stage(
+                stage_manager,
+                stage_path,
+                deploy_root_path,
+                diff_result.different,
+                overwrite=True,
+            )
+            put_files_on_stage(
+                stage_manager, stage_path, deploy_root_path, diff_result.only_local
+            )
     except Exception as err:
         # Could be ProgrammingError or IntegrityError from SnowflakeCursor
         log.error(err)
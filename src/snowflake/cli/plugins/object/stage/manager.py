@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import glob
 import logging
+import os
 import re
-from contextlib import nullcontext
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from snowflake.cli.api.project.util import to_string_literal
 from snowflake.cli.api.secure_path import SecurePath
@@ -16,6 +20,14 @@ log = logging.getLogger(__name__)
 
 
 UNQUOTED_FILE_URI_REGEX = r"[\w/*?\-.=&{}$#[\]\"\\!@%^+:]+"
+GLOB_MAGIC_REGEX = r"[*?[]"
+# number of PUT statements executed concurrently by put_many
+PUT_MAX_WORKERS = 4
+# smaller groups of files are uploaded file by file, concurrently
+PUT_BATCH_MIN_FILES = 4
+# maximal length of a regular expression used by remove_many
+REMOVE_PATTERN_MAX_LENGTH = 4096
+REGEX_SPECIAL_CHARACTERS = re.compile(r"([\\.^$*+?()\[\]{}|])")
 
 
 class StageManager(SqlExecutionMixin):
@@ -110,6 +122,88 @@ class StageManager(SqlExecutionMixin):
             )
         return cursor
 
+    def put_many(
+        self,
+        files: Iterable[Tuple[Union[str, Path], str]],
+        parallel: int = 4,
+        overwrite: bool = False,
+        role: Optional[str] = None,
+    ) -> List[SnowflakeCursor]:
+        """
+        Uploads files given as pairs of local path and stage path. Files from the same
+        local directory going to the same stage path are uploaded by a single PUT
+        statement, and statements are executed concurrently.
+        """
+        entries = list(dict.fromkeys((Path(path), stage) for path, stage in files))
+        groups: Dict[Tuple[Path, str], List[Path]] = {}
+        for path, stage_path in entries:
+            groups.setdefault((path.parent, stage_path), []).append(path)
+
+        with ExitStack() as temporary_directories:
+            uploads: List[Tuple[Path, str]] = []
+            batched = set()
+            for path, stage_path in entries:
+                key = (path.parent, stage_path)
+                if not self._can_put_in_batch(groups[key]):
+                    uploads.append((path, stage_path))
+                elif key not in batched:
+                    batched.add(key)
+                    source = self._batch_source(
+                        path.parent, groups[key], temporary_directories
+                    )
+                    uploads.append((source, stage_path))
+
+            with self.use_role(role) if role else nullcontext():
+                if len(uploads) <= 1:
+                    return [
+                        self.put(source, stage_path, parallel, overwrite)
+                        for source, stage_path in uploads
+                    ]
+                # ensure the connection is established before it is shared by threads
+                _ = self._conn
+                with ThreadPoolExecutor(max_workers=PUT_MAX_WORKERS) as executor:
+                    return list(
+                        executor.map(
+                            lambda upload: self.put(
+                                upload[0], upload[1], parallel, overwrite
+                            ),
+                            uploads,
+                        )
+                    )
+
+    @staticmethod
+    def _can_put_in_batch(paths: List[Path]) -> bool:
+        # wildcards skip hidden files, and paths with wildcards cannot be linked
+        return len(paths) >= PUT_BATCH_MIN_FILES and not any(
+            path.name.startswith(".") or re.search(GLOB_MAGIC_REGEX, path.name)
+            for path in paths
+        )
+
+    @staticmethod
+    def _batch_source(
+        directory: Path, paths: List[Path], temporary_directories: ExitStack
+    ) -> Path:
+        """
+        Returns a wildcard matching exactly the given files. If the directory contains
+        other files, the given files are linked into a temporary directory.
+        """
+        wildcard = directory / "*"
+        if not re.search(GLOB_MAGIC_REGEX, str(directory)):
+            matched = [Path(p) for p in glob.glob(str(wildcard))]
+            if set(matched) == set(paths) and all(p.is_file() for p in matched):
+                return wildcard
+
+        temporary_directory = temporary_directories.enter_context(
+            SecurePath.temporary_directory()
+        ).path
+        for path in paths:
+            link = temporary_directory / path.name
+            try:
+                os.symlink(path.resolve(), link)
+            except OSError:
+                shutil.copyfile(path, link)
+        return temporary_directory / "*"
+
     def copy_files(self, source_path: str, destination_path: str) -> SnowflakeCursor:
         source = self.get_standard_stage_prefix(source_path)
         destination = self.get_standard_stage_directory_path(destination_path)
@@ -132,6 +226,48 @@ class StageManager(SqlExecutionMixin):
             quoted_stage_name = self.quote_stage_name(f"{stage_name}{path}")
             return self._execute_query(f"remove {quoted_stage_name}")
 
+    def remove_many(
+        self, stage_name: str, paths: Iterable[str], role: Optional[str] = None
+    ) -> List[SnowflakeCursor]:
+        """
+        Removes files, given as paths relative to the stage root, using as few
+        REMOVE statements with a PATTERN as the limit of pattern length allows.
+        """
+        stage_name = self.get_standard_stage_prefix(stage_name)
+        cursors = []
+        with self.use_role(role) if role else nullcontext():
+            for pattern in self._compile_remove_patterns(paths):
+                cursors.append(
+                    self._execute_query(
+                        f"remove {self.quote_stage_name(stage_name)} "
+                        f"pattern = {to_string_literal(pattern)}"
+                    )
+                )
+        return cursors
+
+    @staticmethod
+    def _compile_remove_patterns(paths: Iterable[str]) -> Iterable[str]:
+        """
+        Yields regular expressions matching exactly the given paths, as listed on the
+        stage, that is prefixed by the stage name. Each is at most
+        REMOVE_PATTERN_MAX_LENGTH long, unless it matches a single longer path.
+        """
+        prefix, suffix = "[^/]+/(", ")"
+        alternatives: List[str] = []
+        length = len(prefix) + len(suffix)
+        for path in dict.fromkeys(p.lstrip("/") for p in paths):
+            alternative = REGEX_SPECIAL_CHARACTERS.sub(r"\\\1", path)
+            if (
+                alternatives
+                and length + len(alternative) + 1 > REMOVE_PATTERN_MAX_LENGTH
+            ):
+                yield prefix + "|".join(alternatives) + suffix
+                alternatives, length = [], len(prefix) + len(suffix)
+            alternatives.append(alternative)
+            length += len(alternative) + 1
+        if alternatives:
+            yield prefix + "|".join(alternatives) + suffix
+
     def create(self, stage_name: str, comment: Optional[str] = None) -> SnowflakeCursor:
         query = f"create stage if not exists {stage_name}"
         if comment:
@@ -0,0 +1,95 @@
+"""
+Thin client forwarding Snowflake CLI invocations to a warm server process.
+
+This module is an entry point executed on every call, so it must import
+only the standard library. If the server is not running, the command is
+executed in-process as if "snow" was called.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+SERVER_SOCKET_ENV_VARIABLE = "SNOWFLAKE_CLI_SERVER_SOCKET"
+STDIN_OPTIONS = ("-i", "--stdin")
+ENCODING = "utf-8"
+
+
+def default_socket_directory() -> Path:
+    return Path(tempfile.gettempdir()) / f"snowcli-server-{os.getuid()}"
+
+
+def default_socket_path() -> Path:
+    env_value = os.environ.get(SERVER_SOCKET_ENV_VARIABLE)
+    if env_value:
+        return Path(env_value)
+    return default_socket_directory() / "server.sock"
+
+
+def is_owned_by_current_user(path: Path) -> bool:
+    try:
+        return path.stat().st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def send_message(socket_path: Path, message: dict) -> dict:
+    """
+    Sends a single newline-terminated JSON message and waits for the response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        connection.sendall(json.dumps(message).encode(ENCODING) + b"\n")
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile("r", encoding=ENCODING) as stream:
+            return json.loads(stream.readline())
+
+
+def _read_stdin_if_requested(args: List[str]) -> Optional[str]:
+    # stdin is forwarded only when the command explicitly reads it,
+    # otherwise calls inside "while read" shell loops would consume their input
+    if sys.stdin is None or sys.stdin.isatty():
+        return None
+    if not any(arg in STDIN_OPTIONS for arg in args):
+        return None
+    return sys.stdin.read()
+
+
+def forward_command(socket_path: Path, args: List[str]) -> Optional[int]:
+    """
+    Executes command on the server. Returns exit code or None
+    if the server is not available.
+    """
+    # the environment sent to the server holds credentials,
+    # so it is never sent to a server started by another user
+    if not is_owned_by_current_user(socket_path):
+        return None
+    request = {
+        "type": "run",
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "stdin": _read_stdin_if_requested(args),
+    }
+    try:
+        response = send_message(socket_path, request)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["exit_code"]
+
+
+def main():
+    args = sys.argv[1:]
+    exit_code = forward_command(default_socket_path(), args)
+    if exit_code is None:
+        from snowflake.cli.app.__main__ import main as snow_main
+
+        snow_main(args)
+    sys.exit(exit_code)
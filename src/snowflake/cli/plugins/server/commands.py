@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+from snowflake.cli.api.commands.snow_typer import SnowTyper
+from snowflake.cli.api.output.types import CommandResult, MessageResult, ObjectResult
+from snowflake.cli.plugins.server.client import default_socket_path
+from snowflake.cli.plugins.server.manager import ServerManager, ServerNotRunningError
+
+app = SnowTyper(
+    name="server",
+    help="Manages a warm Snowflake CLI process executing commands forwarded by `snow-client`.",
+)
+
+SocketOption = typer.Option(
+    None,
+    "--socket",
+    help="Path of the Unix socket the server listens on. Defaults to `SNOWFLAKE_CLI_SERVER_SOCKET` environment variable or a file in the temporary directory.",
+    show_default=False,
+)
+
+
+@app.command()
+def start(
+    socket: Path = SocketOption,
+    foreground: bool = typer.Option(
+        False,
+        "--foreground",
+        help="Runs the server in the current process instead of starting it in the background.",
+        is_flag=True,
+    ),
+    **options,
+) -> CommandResult:
+    """
+    Starts a server keeping the Snowflake CLI warm. Commands executed with `snow-client`
+    are forwarded to it, reusing loaded plugins and opened connections.
+    """
+    socket_path = socket or default_socket_path()
+    manager = ServerManager(socket_path)
+    if foreground:
+        manager.serve()
+        return MessageResult("Server stopped.")
+    pid = manager.start_in_background()
+    return MessageResult(f"Server started (pid {pid}) listening on {socket_path}.")
+
+
+@app.command()
+def stop(socket: Path = SocketOption, **options) -> CommandResult:
+    """
+    Stops the running server and closes its connections.
+    """
+    ServerManager(socket or default_socket_path()).stop()
+    return MessageResult("Server stopped.")
+
+
+@app.command()
+def status(socket: Path = SocketOption, **options) -> CommandResult:
+    """
+    Shows status of the server.
+    """
+    socket_path = socket or default_socket_path()
+    server_status = ServerManager(socket_path).status()
+    if server_status is None:
+        raise ServerNotRunningError(socket_path)
+    return ObjectResult({"socket": str(socket_path), "pid": server_status["pid"]})
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import struct
+import subprocess
+import sys
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from click import ClickException
+from snowflake.cli.api.cli_global_context import cli_context_manager
+from snowflake.cli.plugins.server.client import (
+    ENCODING,
+    default_socket_directory,
+    send_message,
+)
+
+log = logging.getLogger(__name__)
+
+
+class ServerNotRunningError(ClickException):
+    def __init__(self, socket_path: Path):
+        super().__init__(f"Snowflake CLI server is not running at {socket_path}.")
+
+
+class ServerAlreadyRunningError(ClickException):
+    def __init__(self, socket_path: Path):
+        super().__init__(f"Snowflake CLI server is already running at {socket_path}.")
+
+
+@contextmanager
+def _invocation_environment(
+    cwd: str, env: Dict[str, str], args: List[str], stdin: Optional[str]
+):
+    original_cwd = os.getcwd()
+    original_env = dict(os.environ)
+    original_argv, original_stdin = sys.argv, sys.stdin
+    try:
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+        sys.argv = ["snow", *args]
+        sys.stdin = io.StringIO(stdin or "")
+        yield
+    finally:
+        os.chdir(original_cwd)
+        os.environ.clear()
+        os.environ.update(original_env)
+        sys.argv, sys.stdin = original_argv, original_stdin
+
+
+class WarmCommandExecutor:
+    """
+    Executes commands in a long living process. Interpreter, imported plugins
+    and connections (keyed by connection parameters) are reused between commands.
+    """
+
+    def __init__(self):
+        from snowflake.cli.app.cli_app import app_factory
+
+        cli_context_manager.connection_context.enable_persistent_connections()
+        self._app = app_factory()
+
+    def execute(
+        self, args: List[str], cwd: str, env: Dict[str, str], stdin: Optional[str]
+    ) -> dict:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        with _invocation_environment(cwd, env, args, stdin):
+            cli_context_manager.reset()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    self._app(args, prog_name="snow")
+                except SystemExit as exit_:
+                    exit_code = _exit_code(exit_.code)
+                except Exception as err:
+                    log.exception("Command %s failed", args)
+                    stderr.write(f"{err}\n")
+                    exit_code = 1
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    @staticmethod
+    def close():
+        cli_context_manager.connection_context.close_persistent_connections()
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+def _peer_uid(connection: socket.socket) -> Optional[int]:
+    """Returns the user id of the process on the other end of a Unix socket."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = connection.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: WarmCommandServer
+
+    def handle(self):
+        peer_uid = _peer_uid(self.connection)
+        if peer_uid is not None and peer_uid != os.getuid():
+            log.warning("Rejected request of user %s", peer_uid)
+            return
+        request = json.loads(self.rfile.readline().decode(ENCODING))
+        if request["type"] == "run":
+            response = self.server.executor.execute(
+                args=request["args"],
+                cwd=request["cwd"],
+                env=request["env"],
+                stdin=request.get("stdin"),
+            )
+        elif request["type"] == "stop":
+            response = {"stopped": True}
+            self.server.stop_requested = True
+        else:
+            response = {"running": True, "pid": os.getpid()}
+        self.wfile.write(json.dumps(response).encode(ENCODING) + b"\n")
+
+
+class WarmCommandServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server executing requests one by one,
+    as command execution relies on process-wide state.
+    Only the user running the server can connect to it.
+    """
+
+    def __init__(self, socket_path: Path, executor: WarmCommandExecutor):
+        self.executor = executor
+        self.stop_requested = False
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def server_bind(self):
+        # the socket is created accessible only by the owner, so that
+        # no other user can connect before its permissions are changed
+        previous_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+    def serve_until_stopped(self):
+        while not self.stop_requested:
+            self.handle_request()
+
+
+def _prepare_private_directory(directory: Path) -> None:
+    """
+    Creates the directory accessible only by the current user, or checks that an
+    existing one is, as its name in the temporary directory is predictable.
+    """
+    directory.mkdir(mode=0o700, exist_ok=True)
+    status = directory.lstat()
+    if (
+        not stat.S_ISDIR(status.st_mode)
+        or status.st_uid != os.getuid()
+        or stat.S_IMODE(status.st_mode) & 0o077
+    ):
+        raise ClickException(
+            f"Directory {directory} must be owned and accessible only by the current user."
+        )
+
+
+class ServerManager:
+    def __init__(self, socket_path: Path):
+        self._socket_path = socket_path
+
+    def is_running(self) -> bool:
+        return self.status() is not None
+
+    def status(self) -> Optional[dict]:
+        if not self._socket_path.exists():
+            return None
+        try:
+            return send_message(self._socket_path, {"type": "status"})
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None
+
+    def serve(self):
+        if self.is_running():
+            raise ServerAlreadyRunningError(self._socket_path)
+        if self._socket_path.parent == default_socket_directory():
+            _prepare_private_directory(self._socket_path.parent)
+        self._socket_path.unlink(missing_ok=True)
+
+        executor = WarmCommandExecutor()
+        with WarmCommandServer(self._socket_path, executor) as server:
+            try:
+                server.serve_until_stopped()
+            finally:
+                executor.close()
+                self._socket_path.unlink(missing_ok=True)
+
+    def start_in_background(self) -> int:
+        if self.is_running():
+            raise ServerAlreadyRunningError(self._socket_path)
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "snowflake.cli.app",
+                "server",
+                "start",
+                "--foreground",
+                "--socket",
+                str(self._socket_path),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        return process.pid
+
+    def stop(self):
+        if not self.is_running():
+            raise ServerNotRunningError(self._socket_path)
+        send_message(self._socket_path, {"type": "stop"})
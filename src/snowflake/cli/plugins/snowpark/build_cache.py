@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import sys
+import sysconfig
+from pathlib import Path
+from typing import List, Optional
+
+log = logging.getLogger(__name__)
+
+BUILD_CACHE_DIRECTORY = Path(".snowflake") / "build-cache"
+# number of dependency layers and artifacts kept, least recently used are removed
+BUILD_CACHE_MAX_ENTRIES = 4
+
+_DEPENDENCIES = "dependencies"
+_ARTIFACTS = "artifacts"
+_PACKAGES_LAYER = "packages.zip"
+_PACKAGES_DIGEST = "packages.sha256"
+
+
+def cache_key(*parts: str | bytes | None) -> str:
+    """Returns a hash identifying the given inputs, in the given order."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            part = b"\1"
+        elif isinstance(part, str):
+            part = part.encode()
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def python_environment() -> str:
+    """Identifies the interpreter and platform packages are installed for."""
+    implementation = sys.implementation.name
+    major, minor = sys.version_info[:2]
+    return f"{implementation}-{major}.{minor}-{sysconfig.get_platform()}"
+
+
+class BuildCache:
+    """
+    Keeps results of previous builds of a project, so builds with unchanged inputs
+    do not resolve requirements and compress files again.
+
+    Dependency layers hold the archived `.packages` directory together with the
+    requirements files written while resolving requirements. Artifacts are whole
+    archives built from a dependency layer and the project sources.
+    """
+
+    def __init__(self, directory: Path = BUILD_CACHE_DIRECTORY):
+        self._directory = directory
+
+    def dependency_layer(self, key: str, packages_digest: str) -> Optional[Path]:
+        """
+        Returns the archived `.packages` directory resolved for the key, if it is
+        cached and `.packages` still has the content it was archived with. Restores
+        requirements files written during the resolution.
+        """
+        entry = self._directory / _DEPENDENCIES / key
+        recorded_digest = entry / _PACKAGES_DIGEST
+        if not recorded_digest.exists():
+            return None
+        if recorded_digest.read_text().strip() != packages_digest:
+            log.info("Content of .packages changed since dependencies were cached")
+            return None
+        for file in entry.iterdir():
+            if file.name not in (_PACKAGES_LAYER, _PACKAGES_DIGEST):
+                shutil.copyfile(file, file.name)
+        self._touch(entry)
+        log.info("Using cached dependencies %s", key)
+        return entry / _PACKAGES_LAYER
+
+    def store_dependency_layer(
+        self,
+        key: str,
+        packages_layer: Path,
+        packages_digest: str,
+        requirements_files: List[Path],
+    ) -> Path:
+        """
+        Moves the archived `.packages` directory to the cache, together with copies
+        of requirements files. Returns the new location of the archive.
+        """
+        entry = self._directory / _DEPENDENCIES / key
+        staging = self._staging_path(entry)
+        self._create_directory(staging)
+        for file in requirements_files:
+            if file.exists():
+                shutil.copyfile(file, staging / file.name)
+        shutil.move(str(packages_layer), staging / _PACKAGES_LAYER)
+        (staging / _PACKAGES_DIGEST).write_text(packages_digest)
+        self._publish(staging, entry)
+        self._prune(entry.parent)
+        return entry / _PACKAGES_LAYER
+
+    def artifact(self, key: str) -> Optional[Path]:
+        artifact = self._directory / _ARTIFACTS / f"{key}.zip"
+        if not artifact.exists():
+            return None
+        self._touch(artifact)
+        log.info("Using cached artifact %s", key)
+        return artifact
+
+    def store_artifact(self, key: str, artifact: Path) -> None:
+        cached = self._directory / _ARTIFACTS / f"{key}.zip"
+        staging = self._staging_path(cached)
+        self._create_directory(staging.parent)
+        shutil.copyfile(artifact, staging)
+        self._publish(staging, cached)
+        self._prune(cached.parent)
+
+    def _create_directory(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        gitignore = self._directory / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n")
+
+    @staticmethod
+    def _staging_path(path: Path) -> Path:
+        # entries are prepared under a unique name and renamed when complete, so
+        # interrupted or concurrent builds never leave partial entries
+        return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    @staticmethod
+    def _publish(staging: Path, path: Path) -> None:
+        if path.exists():
+            _remove(staging)
+        else:
+            os.replace(staging, path)
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        os.utime(path)
+
+    @staticmethod
+    def _prune(directory: Path) -> None:
+        entries = sorted(
+            (path for path in directory.iterdir() if not path.name.startswith(".")),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in entries[BUILD_CACHE_MAX_ENTRIES:]:
+            log.debug("Removing %s from build cache", path)
+            _remove(path)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable as TypingCallable
+from typing import Dict, List, Optional, Sequence, Set, TypeVar
 
 import typer
 from click import ClickException
@@ -33,8 +36,11 @@ from snowflake.cli.api.project.schemas.snowpark.callable import (
     ProcedureSchema,
 )
 from snowflake.cli.api.project.schemas.snowpark.snowpark import Snowpark
+from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.plugins.object.manager import ObjectManager
+from snowflake.cli.plugins.object.stage.diff import compute_md5sum, strip_stage_name
 from snowflake.cli.plugins.object.stage.manager import StageManager
+from snowflake.cli.plugins.snowpark.build_cache import BuildCache
 from snowflake.cli.plugins.snowpark.common import (
     build_udf_sproc_identifier,
     check_if_replace_is_required,
@@ -43,15 +49,27 @@ from snowflake.cli.plugins.snowpark.manager import FunctionManager, ProcedureMan
 from snowflake.cli.plugins.snowpark.models import PypiOption
 from snowflake.cli.plugins.snowpark.package_utils import get_snowflake_packages
 from snowflake.cli.plugins.snowpark.snowpark_shared import (
+    BuildCacheOption,
     CheckAnacondaForPyPiDependencies,
+    CompressionLevelOption,
+    OfflineOption,
     PackageNativeLibrariesOption,
     PyPiDownloadOption,
     snowpark_package,
 )
 from snowflake.connector import DictCursor, ProgrammingError
+from snowflake.connector.cursor import SnowflakeCursor
 
 log = logging.getLogger(__name__)
 
+# number of objects described or created concurrently by deploy
+DEPLOY_MAX_WORKERS = 8
+# suffix of empty files marking md5 of the artifact uploaded next to them
+ARTIFACT_MARKER_SUFFIX = ".md5"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 app = SnowTyper(
     name="snowpark",
     help="Manages procedures and functions.",
@@ -127,42 +145,50 @@ def deploy(
     artifact_stage_directory = get_app_stage_path(stage_name, snowpark.project_name)
     artifact_stage_target = f"{artifact_stage_directory}/{build_artifact_path.name}"
 
-    stage_manager.put(
-        local_path=build_artifact_path,
-        stage_path=artifact_stage_directory,
-        overwrite=True,
+    _upload_artifact(
+        stage_manager=stage_manager,
+        artifact=build_artifact_path,
+        stage_directory=artifact_stage_directory,
     )
 
-    deploy_status = []
-    # Procedures
-    for procedure in procedures:
-        operation_result = _deploy_single_object(
-            manager=pm,
-            object_type=ObjectType.PROCEDURE,
-            object_definition=procedure,
-            existing_objects=existing_procedures,
-            packages=packages,
-            stage_artifact_path=artifact_stage_target,
-            source_name=build_artifact_path.name,
-        )
-        deploy_status.append(operation_result)
-
-    # Functions
-    for function in functions:
-        operation_result = _deploy_single_object(
-            manager=fm,
-            object_type=ObjectType.FUNCTION,
-            object_definition=function,
-            existing_objects=existing_functions,
+    deployments = [
+        (pm, ObjectType.PROCEDURE, procedure, existing_procedures)
+        for procedure in procedures
+    ] + [
+        (fm, ObjectType.FUNCTION, function, existing_functions)
+        for function in functions
+    ]
+
+    # objects are independent of each other, results keep the order of definitions
+    deploy_status = _map_concurrently(
+        lambda deployment: _deploy_single_object(
+            manager=deployment[0],
+            object_type=deployment[1],
+            object_definition=deployment[2],
+            existing_objects=deployment[3],
             packages=packages,
             stage_artifact_path=artifact_stage_target,
             source_name=build_artifact_path.name,
-        )
-        deploy_status.append(operation_result)
+        ),
+        deployments,
+    )
 
     return CollectionResult(deploy_status)
 
 
+def _map_concurrently(func: TypingCallable[[T], R], items: Sequence[T]) -> List[R]:
+    """
+    Applies [func] to all items using up to DEPLOY_MAX_WORKERS threads sharing
+    the connection, and returns results in order of items.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    # ensure the connection is established before it is shared by threads
+    _ = cli_context.connection
+    with ThreadPoolExecutor(max_workers=DEPLOY_MAX_WORKERS) as executor:
+        return list(executor.map(func, items))
+
+
 def _assert_object_definitions_are_correct(
     object_type, object_definitions: List[Callable]
 ):
@@ -183,23 +209,56 @@ def _assert_object_definitions_are_correct(
 
 def _find_existing_objects(
     object_type: ObjectType,
-    objects: List[Dict],
+    objects: List[Callable],
     om: ObjectManager,
-):
-    existing_objects = {}
-    for object_definition in objects:
-        identifier = build_udf_sproc_identifier(
-            object_definition, om, include_parameter_names=False
-        )
+) -> Dict[str, SnowflakeCursor]:
+    """
+    Returns current state of defined objects which already exist. Objects in each
+    schema are listed by a single SHOW statement, so only objects with a listed
+    name have to be described.
+    """
+    identifiers = [
+        build_udf_sproc_identifier(object_definition, om, include_parameter_names=False)
+        for object_definition in objects
+    ]
+    names = {identifier: identifier.split("(", 1)[0] for identifier in identifiers}
+
+    listed_names: Set[str] = set()
+    for schema in dict.fromkeys(name.rsplit(".", 1)[0] for name in names.values()):
         try:
-            current_state = om.describe(
-                object_type=object_type.value.sf_name,
-                name=identifier,
+            listed = om.show(
+                object_type=object_type.value.cli_name,
+                scope=("schema", schema),
+                cursor_class=DictCursor,
             )
-            existing_objects[identifier] = current_state
         except ProgrammingError:
-            pass
-    return existing_objects
+            # schema does not exist, so neither do objects in it
+            continue
+        listed_names.update(
+            _comparable_name(f"{schema}.{row['name']}") for row in listed
+        )
+
+    def describe(identifier: str) -> Optional[SnowflakeCursor]:
+        try:
+            return om.describe(object_type=object_type.value.sf_name, name=identifier)
+        except ProgrammingError:
+            return None
+
+    candidates = [
+        identifier
+        for identifier in identifiers
+        if _comparable_name(names[identifier]) in listed_names
+    ]
+    current_states = _map_concurrently(describe, candidates)
+    return {
+        identifier: current_state
+        for identifier, current_state in zip(candidates, current_states)
+        if current_state is not None
+    }
+
+
+def _comparable_name(name: str) -> str:
+    return name.replace('"', "").upper()
 
 
 def _check_if_all_defined_integrations_exists(
@@ -207,11 +266,6 @@ def _check_if_all_defined_integrations_exists(
     functions: List[FunctionSchema],
     procedures: List[ProcedureSchema],
 ):
-    existing_integrations = {
-        i["name"].lower()
-        for i in om.show(object_type="integration", cursor_class=DictCursor, like=None)
-        if i["type"] == "EXTERNAL_ACCESS"
-    }
     declared_integration: Set[str] = set()
     for object_definition in [*functions, *procedures]:
         external_access_integrations = {
@@ -224,6 +278,13 @@ def _check_if_all_defined_integrations_exists(
 
         declared_integration = declared_integration | external_access_integrations
 
+    if not declared_integration:
+        return
+    existing_integrations = {
+        i["name"].lower()
+        for i in om.show(object_type="integration", cursor_class=DictCursor, like=None)
+        if i["type"] == "EXTERNAL_ACCESS"
+    }
     missing = declared_integration - existing_integrations
     if missing:
         raise ClickException(
@@ -236,6 +297,55 @@ def get_app_stage_path(stage_name: Optional[str], project_name: str) -> str:
     return artifact_stage_directory
 
 
+def _upload_artifact(
+    stage_manager: StageManager, artifact: Path, stage_directory: str
+) -> bool:
+    """
+    Uploads the artifact to the stage directory unless an identical one is already
+    there. Returns whether the artifact was uploaded.
+
+    Stages report md5 only of files uploaded in a single part, so after an upload
+    an empty marker file with the md5 of the artifact in its name is put next to it.
+    The marker is valid only if it was not put before the artifact.
+    """
+    md5 = compute_md5sum(artifact)
+    stage_name, _, directory = stage_directory.partition("/")
+    artifact_path = f"{directory}/{artifact.name}"
+    marker_path = f"{artifact_path}.{md5}{ARTIFACT_MARKER_SUFFIX}"
+
+    stage_files = {
+        strip_stage_name(name): (stage_md5, parsedate_to_datetime(last_modified))
+        for name, _, stage_md5, last_modified in stage_manager.list_files(
+            stage_directory
+        ).fetchall()
+    }
+    if artifact_path in stage_files:
+        stage_md5, artifact_modified = stage_files[artifact_path]
+        if stage_md5 == md5 or (
+            marker_path in stage_files
+            and stage_files[marker_path][1] >= artifact_modified
+        ):
+            log.info("Artifact %s is already on the stage, skipping upload.", artifact)
+            return False
+
+    stage_manager.put(local_path=artifact, stage_path=stage_directory, overwrite=True)
+    outdated_markers = [
+        path
+        for path in stage_files
+        if path.startswith(f"{artifact_path}.")
+        and path.endswith(ARTIFACT_MARKER_SUFFIX)
+    ]
+    if outdated_markers:
+        stage_manager.remove_many(stage_name=stage_name, paths=outdated_markers)
+    with SecurePath.temporary_directory() as tmp_dir:
+        marker = tmp_dir / Path(marker_path).name
+        marker.touch()
+        stage_manager.put(
+            local_path=marker.path, stage_path=stage_directory, overwrite=True
+        )
+    return True
+
+
 def _deploy_single_object(
     manager: FunctionManager | ProcedureManager,
     object_type: ObjectType,
@@ -316,6 +426,9 @@ def build(
     pypi_download: PypiOption = PyPiDownloadOption,
     check_anaconda_for_pypi_deps: bool = CheckAnacondaForPyPiDependencies,
     package_native_libraries: PypiOption = PackageNativeLibrariesOption,
+    compression_level: int = CompressionLevelOption,
+    use_build_cache: bool = BuildCacheOption,
+    offline: bool = OfflineOption,
     **options,
 ) -> CommandResult:
     """
@@ -333,6 +446,9 @@ def build(
         pypi_download=pypi_download,  # type: ignore[arg-type]
         check_anaconda_for_pypi_deps=check_anaconda_for_pypi_deps,
         package_native_libraries=package_native_libraries,  # type: ignore[arg-type]
+        compression_level=compression_level,
+        build_cache=BuildCache() if use_build_cache else None,
+        offline=offline,
     )
     return MessageResult(f"Build done. Artifact path: {artifact_file}")
 
@@ -1,14 +1,58 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import List
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
-import requests
-from packaging.version import parse
+from click import ClickException
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.cli.plugins.snowpark.models import Requirement, SplitRequirements
+from snowflake.connector.config_manager import CONFIG_MANAGER
+
+requests = lazy_import("requests")
 
 log = logging.getLogger(__name__)
 
+CHANNEL_CACHE_DIRECTORY_NAME = "anaconda_channel_cache"
+# cached channel data younger than this is used without asking the server
+CHANNEL_CACHE_TTL_SECONDS = 60 * 60
+CHANNEL_REQUEST_TIMEOUT_SECONDS = 30
+
+
+def channel_cache_directory() -> SecurePath:
+    return SecurePath(CONFIG_MANAGER.file_path.parent) / CHANNEL_CACHE_DIRECTORY_NAME
+
+
+@dataclass
+class CachedChannelData:
+    """Snapshot of the channel data, with validators of the response it came from."""
+
+    packages: Dict[str, Dict]
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self) -> bool:
+        return time.time() - self.fetched_at < CHANNEL_CACHE_TTL_SECONDS
+
+    def revalidation_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
 
 class AnacondaChannel:
     snowflake_channel_url: str = (
@@ -18,23 +62,91 @@ class AnacondaChannel:
     def __init__(self, packages):
         self._packages = packages
 
+    @cached_property
+    def _latest_versions(self) -> Dict[str, Optional[Version]]:
+        """Latest versions by normalized package names, parsed once per channel."""
+        return {
+            canonicalize_name(name): _parse_version(package.get("version"))
+            for name, package in self._packages.items()
+        }
+
+    @cached_property
+    def _names(self) -> Dict[str, str]:
+        return {canonicalize_name(name): name for name in self._packages}
+
     def is_package_available(self, package: Requirement):
-        package_name = package.name.lower()
-        if package_name not in self._packages:
+        name = canonicalize_name(package.name)
+        if name not in self._latest_versions:
             return False
-        if package.specs:
-            latest_ver = parse(self._packages[package_name]["version"])
-            return all([parse(spec[1]) <= latest_ver for spec in package.specs])
-        return True
+        if not package.specs:
+            return True
+        latest_version = self._latest_versions[name]
+        return latest_version is not None and _is_satisfiable(
+            package.specs, latest_version
+        )
 
     def package_version(self, package: Requirement):
-        return self._packages[package.name.lower()].get("version")
+        name = self._names[canonicalize_name(package.name)]
+        return self._packages[name].get("version")
+
+    def snapshot_digest(self) -> str:
+        """Returns a hash of the channel data, changing with any published package."""
+        return hashlib.sha256(
+            json.dumps(self._packages, sort_keys=True).encode()
+        ).hexdigest()
 
     @classmethod
-    def from_snowflake(cls):
-        response = requests.get(AnacondaChannel.snowflake_channel_url)
-        response.raise_for_status()
-        return cls(packages=response.json()["packages"])
+    def from_snowflake(cls, offline: bool = False):
+        """
+        Returns the Snowflake Anaconda channel. Channel data is cached on disk and
+        revalidated with the server once it is older than an hour. In offline mode
+        the cached data is used regardless of its age.
+        """
+        cache_file = _channel_cache_file(AnacondaChannel.snowflake_channel_url)
+        cached = _load_channel_data(cache_file)
+        if offline:
+            if cached is None:
+                raise ClickException(
+                    "Snowflake Anaconda channel data is not cached yet. "
+                    "Run the command without --offline first."
+                )
+            return cls(packages=cached.packages)
+        if cached is not None and cached.is_fresh():
+            log.info("Using cached Snowflake Anaconda channel data")
+            return cls(packages=cached.packages)
+
+        try:
+            response = requests.get(
+                AnacondaChannel.snowflake_channel_url,
+                headers=cached.revalidation_headers() if cached else {},
+                timeout=CHANNEL_REQUEST_TIMEOUT_SECONDS,
+            )
+            if cached is not None and response.status_code == 304:
+                log.info("Cached Snowflake Anaconda channel data is up to date")
+                cached.fetched_at = time.time()
+            else:
+                response.raise_for_status()
+                packages = response.json()["packages"]
+                if not isinstance(packages, dict):
+                    raise ValueError("Malformed packages of channel data")
+                cached = CachedChannelData(
+                    packages=_compact_packages(packages),
+                    fetched_at=time.time(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+        except (requests.RequestException, ValueError, KeyError) as err:
+            # failed requests and malformed responses alike
+            if cached is None:
+                raise
+            log.warning(
+                "Could not fetch Snowflake Anaconda channel data, using cached data: %s",
+                err,
+            )
+            return cls(packages=cached.packages)
+
+        _save_channel_data(cache_file, cached)
+        return cls(packages=cached.packages)
 
     def parse_anaconda_packages(self, packages: List[Requirement]) -> SplitRequirements:
         """
@@ -65,3 +177,76 @@ class AnacondaChannel:
                 )
                 result.other.append(package)
         return result
+
+
+def _parse_version(version: Optional[str]) -> Optional[Version]:
+    try:
+        return Version(version) if version else None
+    except InvalidVersion:
+        return None
+
+
+def _is_satisfiable(specs: List[Tuple[str, str]], latest_version: Version) -> bool:
+    """
+    Checks if any version up to the latest one satisfies the specifiers. The channel
+    keeps older versions of packages, so only the lower bounds of specifiers need
+    to be checked when the latest version does not satisfy them.
+    """
+    try:
+        specifiers = SpecifierSet(
+            ",".join(operator + version for operator, version in specs)
+        )
+    except InvalidSpecifier:
+        log.debug("Invalid version specifiers: %s", specs)
+        return False
+    if specifiers.contains(latest_version, prereleases=True):
+        return True
+    for specifier in specifiers:
+        if specifier.operator in ("<", "<=", "!="):
+            continue
+        bound = _parse_version(specifier.version.rstrip(".*"))
+        if bound is None:
+            return False
+        if specifier.operator == ">":
+            if not bound < latest_version:
+                return False
+        elif not bound <= latest_version:
+            return False
+    return True
+
+
+def _channel_cache_file(url: str) -> SecurePath:
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return channel_cache_directory() / f"{key}.pickle"
+
+
+def _compact_packages(packages: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Keeps only the part of the channel data which is used to look up packages."""
+    return {
+        name: {"version": package.get("version")} for name, package in packages.items()
+    }
+
+
+def _load_channel_data(cache_file: SecurePath) -> Optional[CachedChannelData]:
+    if not cache_file.exists():
+        return None
+    try:
+        with cache_file.open("rb", read_file_limit_mb=UNLIMITED) as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as err:
+        log.debug("Ignoring malformed channel cache %s: %s", cache_file.path, err)
+        return None
+    return cached if isinstance(cached, CachedChannelData) else None
+
+
+def _save_channel_data(cache_file: SecurePath, cached: CachedChannelData) -> None:
+    # written under a temporary name and renamed, so readers never see partial data
+    temporary_file = cache_file.parent / f".{cache_file.path.name}.{os.getpid()}"
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with temporary_file.open("wb") as f:
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file.path, cache_file.path)
+    except (OSError, pickle.PicklingError) as err:
+        log.debug("Could not save Snowflake Anaconda channel data: %s", err)
+        temporary_file.unlink(missing_ok=True)
@@ -6,10 +6,10 @@ from textwrap import dedent
 
 import typer
 from click import ClickException
-from requests import HTTPError
 from snowflake.cli.api.commands.flags import deprecated_flag_callback
 from snowflake.cli.api.commands.snow_typer import SnowTyper
 from snowflake.cli.api.output.types import CommandResult, MessageResult
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.cli.plugins.snowpark.models import PypiOption, Requirement
 from snowflake.cli.plugins.snowpark.package.anaconda import AnacondaChannel
 from snowflake.cli.plugins.snowpark.package.manager import (
@@ -22,7 +22,12 @@ from snowflake.cli.plugins.snowpark.package.utils import (
     NotInAnaconda,
     RequiresPackages,
 )
-from snowflake.cli.plugins.snowpark.snowpark_shared import PackageNativeLibrariesOption
+from snowflake.cli.plugins.snowpark.snowpark_shared import (
+    OfflineOption,
+    PackageNativeLibrariesOption,
+)
+
+requests = lazy_import("requests")
 
 app = SnowTyper(
     name="package",
@@ -61,14 +66,15 @@ def package_lookup(
     # todo: remove with 3.0
     _: bool = lookup_install_option,
     __: bool = lookup_deprecated_install_option,
+    offline: bool = OfflineOption,
     **options,
 ) -> CommandResult:
     """
     Checks if a package is available on the Snowflake Anaconda channel.
     """
     try:
-        anaconda = AnacondaChannel.from_snowflake()
-    except HTTPError as err:
+        anaconda = AnacondaChannel.from_snowflake(offline=offline)
+    except requests.HTTPError as err:
         raise ClickException(
             f"Accessing Snowflake Anaconda channel failed. Reason {err}"
         )
@@ -144,6 +150,7 @@ def package_create(
     install_packages: bool = install_option,
     _deprecated_install_option: bool = deprecated_install_option,
     allow_native_libraries: PypiOption = PackageNativeLibrariesOption,
+    offline: bool = OfflineOption,
     **options,
 ) -> CommandResult:
     """
@@ -156,6 +163,7 @@ def package_create(
         name=name,
         install_packages=install_packages,
         allow_native_libraries=allow_native_libraries,
+        offline=offline,
     )
 
     if not isinstance(lookup_result, (NotInAnaconda, RequiresPackages)):
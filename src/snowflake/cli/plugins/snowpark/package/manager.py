@@ -29,10 +29,13 @@ log = logging.getLogger(__name__)
 
 
 def lookup(
-    name: str, install_packages: bool, allow_native_libraries: PypiOption
+    name: str,
+    install_packages: bool,
+    allow_native_libraries: PypiOption,
+    offline: bool = False,
 ) -> LookupResult:
 
-    anaconda = AnacondaChannel.from_snowflake()
+    anaconda = AnacondaChannel.from_snowflake(offline=offline)
     package_response = anaconda.parse_anaconda_packages(
         packages=[Requirement.parse(name)]
     )
@@ -8,6 +8,7 @@ from typing import List
 import click
 import requirements
 from click import ClickException
+from packaging.utils import canonicalize_name
 from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.plugins.snowpark.models import (
@@ -19,7 +20,7 @@ from snowflake.cli.plugins.snowpark.models import (
     second_chance_msg,
 )
 from snowflake.cli.plugins.snowpark.package.anaconda import AnacondaChannel
-from snowflake.cli.plugins.snowpark.venv import Venv
+from snowflake.cli.plugins.snowpark.venv import Venv, venv_pool_key
 
 log = logging.getLogger(__name__)
 
@@ -95,10 +96,18 @@ def install_packages(
     if file_name and not Path(file_name).exists():
         raise ClickException(f"File {file_name} does not exists.")
 
-    with Venv() as v:
+    requirements = (
+        str(package_name)
+        if package_name
+        else SecurePath(file_name).read_text(file_size_limit_mb=DEFAULT_SIZE_LIMIT_MB)
+    )
+    pool_key = venv_pool_key(
+        requirements, Path(file_name).parent if file_name else None
+    )
+    with Venv(pool_key=pool_key) as v:
         if package_name:
             # This is a Windows workaround where use TemporaryDirectory instead of NamedTemporaryFile
-            tmp_requirements = Path(v.directory.name) / "requirements.txt"
+            tmp_requirements = v.path / "requirements.txt"
             tmp_requirements.write_text(str(package_name))
             file_name = str(tmp_requirements)
 
@@ -169,10 +178,11 @@ def _get_dependencies_not_avaiable_in_conda(
     dependencies: List[RequirementWithFilesAndDeps],
     avaiable_in_conda: List[Requirement],
 ) -> List[RequirementWithFilesAndDeps]:
+    names_in_conda = {canonicalize_name(package.name) for package in avaiable_in_conda}
     return [
         dep
         for dep in dependencies
-        if dep.requirement.name not in [package.name for package in avaiable_in_conda]
+        if canonicalize_name(dep.requirement.name) not in names_in_conda
     ]
 
 
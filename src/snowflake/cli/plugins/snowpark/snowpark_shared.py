@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import logging
+import shutil
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
 import click
 import typer
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.plugins.snowpark import package_utils
+from snowflake.cli.plugins.snowpark.build_cache import (
+    BuildCache,
+    cache_key,
+    python_environment,
+)
 from snowflake.cli.plugins.snowpark.models import PypiOption, Requirement
 from snowflake.cli.plugins.snowpark.package.anaconda import AnacondaChannel
-from snowflake.cli.plugins.snowpark.zipper import zip_dir
+from snowflake.cli.plugins.snowpark.zipper import (
+    DEFAULT_COMPRESSION_LEVEL,
+    append_zip,
+    tree_digest,
+    zip_dir,
+)
 
 PyPiDownloadOption: PypiOption = typer.Option(
     PypiOption.ASK.value, help="Whether to download non-Anaconda packages from PyPi."
@@ -28,6 +39,27 @@ CheckAnacondaForPyPiDependencies: bool = typer.Option(
     help="""Checks if any of missing Anaconda packages dependencies can be imported directly from Anaconda. Valid values include: `true`, `false`, Default: `true`.""",
 )
 
+BuildCacheOption: bool = typer.Option(
+    True,
+    "--cache/--no-cache",
+    help="Whether to reuse dependencies and artifacts of previous builds with unchanged inputs.",
+)
+
+OfflineOption: bool = typer.Option(
+    False,
+    "--offline",
+    help="Uses cached Snowflake Anaconda channel data instead of downloading it.",
+    is_flag=True,
+)
+
+CompressionLevelOption: int = typer.Option(
+    DEFAULT_COMPRESSION_LEVEL,
+    "--compression-level",
+    min=0,
+    max=9,
+    help="Compression level of the artifact, from 0 (store files without compression) to 9. Files larger than 64MB are compressed at the default level.",
+)
+
 ReturnsOption = typer.Option(
     ...,
     "--returns",
@@ -46,6 +78,7 @@ log = logging.getLogger(__name__)
 
 REQUIREMENTS_SNOWFLAKE = "requirements.snowflake.txt"
 REQUIREMENTS_OTHER = "requirements.other.txt"
+PACKAGES_DIRECTORY = Path(".packages")
 
 
 def snowpark_package(
@@ -54,11 +87,17 @@ def snowpark_package(
     pypi_download: PypiOption,
     check_anaconda_for_pypi_deps: bool,
     package_native_libraries: PypiOption,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    build_cache: BuildCache | None = None,
+    offline: bool = False,
 ):
     log.info("Resolving any requirements from requirements.txt...")
     requirements = package_utils.parse_requirements()
+    anaconda = None
+    split_requirements = None
+    do_download = False
     if requirements:
-        anaconda = AnacondaChannel.from_snowflake()
+        anaconda = AnacondaChannel.from_snowflake(offline=offline)
         log.info("Comparing provided packages from Snowflake Anaconda...")
         split_requirements = anaconda.parse_anaconda_packages(packages=requirements)
         if not split_requirements.other:
@@ -73,19 +112,23 @@ def snowpark_package(
                 if pypi_download == PypiOption.ASK
                 else pypi_download == PypiOption.YES
             )
-            if do_download:
-                log.info("Installing non-Anaconda packages...")
-                should_continue, second_chance_results = package_utils.install_packages(
-                    anaconda,
-                    REQUIREMENTS_OTHER,
-                    check_anaconda_for_pypi_deps,
-                    allow_native_libraries=package_native_libraries,
+
+    def resolve_requirements():
+        if anaconda is None or split_requirements is None:
+            return
+        if do_download:
+            log.info("Installing non-Anaconda packages...")
+            should_continue, second_chance_results = package_utils.install_packages(
+                anaconda,
+                REQUIREMENTS_OTHER,
+                check_anaconda_for_pypi_deps,
+                allow_native_libraries=package_native_libraries,
+            )
+            # add the Anaconda packages discovered as dependencies
+            if should_continue and second_chance_results:
+                split_requirements.snowflake = (
+                    split_requirements.snowflake + second_chance_results.snowflake
                 )
-                # add the Anaconda packages discovered as dependencies
-                if should_continue and second_chance_results:
-                    split_requirements.snowflake = (
-                        split_requirements.snowflake + second_chance_results.snowflake
-                    )
 
         # write requirements.snowflake.txt file
         if split_requirements.snowflake:
@@ -94,13 +137,96 @@ def snowpark_package(
                 package_utils.deduplicate_and_sort_reqs(split_requirements.snowflake),
             )
 
-    zip_dir(source=source, dest_zip=artifact_file)
-
-    if Path(".packages").exists():
-        zip_dir(source=Path(".packages"), dest_zip=artifact_file, mode="a")
+    if build_cache is not None and (
+        PypiOption(package_native_libraries) == PypiOption.ASK
+    ):
+        log.info("Build cache is not used, as native libraries need confirmation")
+        build_cache = None
+
+    if build_cache is None:
+        resolve_requirements()
+        zip_dir(
+            source=source, dest_zip=artifact_file, compression_level=compression_level
+        )
+        if PACKAGES_DIRECTORY.exists():
+            zip_dir(
+                source=PACKAGES_DIRECTORY,
+                dest_zip=artifact_file,
+                mode="a",
+                compression_level=compression_level,
+            )
+    else:
+        dependencies_key = cache_key(
+            python_environment(),
+            _read_bytes(Path("requirements.txt")),
+            anaconda.snapshot_digest() if anaconda else None,
+            str(do_download),
+            str(check_anaconda_for_pypi_deps),
+            PypiOption(package_native_libraries).value,
+            str(compression_level),
+        )
+        _package_with_build_cache(
+            build_cache,
+            source,
+            artifact_file,
+            dependencies_key,
+            resolve_requirements,
+            compression_level,
+        )
     log.info("Deployment package now ready: %s", artifact_file)
 
 
+def _package_with_build_cache(
+    build_cache: BuildCache,
+    source: Path,
+    artifact_file: Path,
+    dependencies_key: str,
+    resolve_requirements: Callable[[], None],
+    compression_level: int,
+):
+    """
+    Builds the artifact reusing results of previous builds: requirements are resolved
+    only when they changed, and when only sources changed, archived `.packages`
+    directory is appended to freshly archived sources.
+    """
+    packages_digest = tree_digest(PACKAGES_DIRECTORY)
+    packages_layer = build_cache.dependency_layer(dependencies_key, packages_digest)
+    if packages_layer is None:
+        resolve_requirements()
+        packages_digest = tree_digest(PACKAGES_DIRECTORY)
+        with SecurePath.temporary_directory() as tmp_dir:
+            new_layer = tmp_dir.path / "packages.zip"
+            zip_dir(
+                source=PACKAGES_DIRECTORY,
+                dest_zip=new_layer,
+                compression_level=compression_level,
+            )
+            packages_layer = build_cache.store_dependency_layer(
+                dependencies_key,
+                new_layer,
+                packages_digest,
+                [Path(REQUIREMENTS_SNOWFLAKE), Path(REQUIREMENTS_OTHER)],
+            )
+
+    artifact_key = cache_key(dependencies_key, packages_digest, tree_digest(source))
+    cached_artifact = build_cache.artifact(artifact_key)
+    if cached_artifact is not None:
+        shutil.copyfile(cached_artifact, artifact_file)
+        return
+
+    zip_dir(source=source, dest_zip=artifact_file, compression_level=compression_level)
+    append_zip(
+        source_zip=packages_layer,
+        dest_zip=artifact_file,
+        compression_level=compression_level,
+    )
+    build_cache.store_artifact(artifact_key, artifact_file)
+
+
+def _read_bytes(file: Path) -> bytes | None:
+    return file.read_bytes() if file.exists() else None
+
+
 def _write_requirements_file(file_name: str, requirements: List[Requirement]):
     log.info("Writing %s file", file_name)
     with SecurePath(file_name).open("w", encoding="utf-8") as f:
@@ -1,43 +1,230 @@
+from __future__ import annotations
+
 import json
 import locale
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+import time
+import uuid
 import venv
-from enum import Enum
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from packaging.utils import canonicalize_name
+from snowflake.cli.api.secure_path import SecurePath
+from snowflake.cli.plugins.snowpark.build_cache import cache_key, python_environment
 from snowflake.cli.plugins.snowpark.models import (
     Requirement,
     RequirementWithFilesAndDeps,
 )
+from snowflake.connector.config_manager import CONFIG_MANAGER
 
 log = logging.getLogger(__name__)
 
+VENV_POOL_DIRECTORY_NAME = "venv_pool"
+# number of prepared environments kept, least recently used are removed
+VENV_POOL_MAX_ENTRIES = 4
+# environments are prepared again after the same time Anaconda channel data is
+# cached for, so unpinned requirements pick up new releases
+VENV_POOL_TTL_SECONDS = 60 * 60
+_PREPARED_MARKER = ".prepared"
+# suffix of files marking pooled environments used by running commands
+_REFERENCE_SUFFIX = ".ref"
+
+_REFERENCED_REQUIREMENTS = re.compile(
+    r"^(?:-r|-c|--requirement|--constraint)(?:\s*=\s*|\s*)(\S+)$"
+)
+# requirements installed from local files or directories, which may change
+_LOCAL_REQUIREMENT = re.compile(
+    r"^(?:\.|/|~|-e\b|--editable\b|[A-Za-z]:[\\/])|file:|\.(?:whl|zip|tar\.gz)$"
+)
 
-class PackageInfoType(Enum):
-    FILES = "files"
-    DEPENDENCIES = "requires"
+
+# lists distributions installed in the environment it is run in
+_INSTALLED_PACKAGES_SCRIPT = """
+import json
+from importlib.metadata import distributions
+
+print(json.dumps([
+    {
+        "name": dist.metadata["Name"],
+        "requires": dist.requires or [],
+        "files": [str(file) for file in dist.files or []],
+    }
+    for dist in distributions()
+]))
+"""
+
+
+def venv_pool_directory() -> SecurePath:
+    return SecurePath(CONFIG_MANAGER.file_path.parent) / VENV_POOL_DIRECTORY_NAME
+
+
+def venv_pool_key(requirements: str, base_directory: Path | None = None) -> str | None:
+    """
+    Returns the key of pooled environments with the given requirements installed,
+    for the current interpreter and pip configuration. Returns None if the
+    environment should not be pooled, because requirements are installed from
+    local files or directories. Requirements files referenced with -r or -c are
+    resolved against [base_directory], the current directory by default.
+    """
+    inputs = _requirements_inputs(requirements, base_directory or Path.cwd(), set())
+    if inputs is None:
+        return None
+    pip_environment = sorted(
+        f"{name}={value}"
+        for name, value in os.environ.items()
+        if name.startswith("PIP_")
+    )
+    pip_config = [
+        f"{file}\0{file.read_text(errors='replace')}"
+        for file in _pip_config_files()
+        if file.is_file()
+    ]
+    return cache_key(python_environment(), *inputs, *pip_environment, *pip_config)[:32]
+
+
+def _requirements_inputs(
+    requirements: str, base_directory: Path, visited: set
+) -> Optional[List[str]]:
+    """
+    Returns requirements together with contents of requirements files they
+    reference, or None if any requirement is installed from a local path.
+    """
+    inputs = [requirements]
+    for line in requirements.splitlines():
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if not line:
+            continue
+        referenced = _REFERENCED_REQUIREMENTS.match(line)
+        if referenced:
+            file = (base_directory / referenced.group(1)).resolve()
+            if not file.is_file():
+                return None
+            if file in visited:
+                continue
+            visited.add(file)
+            nested = _requirements_inputs(file.read_text(), file.parent, visited)
+            if nested is None:
+                return None
+            inputs += [str(file), *nested]
+        elif _LOCAL_REQUIREMENT.search(line):
+            return None
+    return inputs
+
+
+def _pip_config_files() -> List[Path]:
+    """Returns files pip may read its configuration from."""
+    files = []
+    if os.environ.get("PIP_CONFIG_FILE"):
+        files.append(Path(os.environ["PIP_CONFIG_FILE"]))
+    if sys.platform == "win32":
+        files += [
+            Path(os.environ.get("PROGRAMDATA", ""), "pip", "pip.ini"),
+            Path(os.environ.get("APPDATA", ""), "pip", "pip.ini"),
+            Path.home() / "pip" / "pip.ini",
+        ]
+    else:
+        config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+        files += [
+            Path("/etc/pip.conf"),
+            Path("/etc/xdg/pip/pip.conf"),
+            Path(config_home, "pip", "pip.conf"),
+            Path.home() / ".pip" / "pip.conf",
+        ]
+        if sys.platform == "darwin":
+            files.append(
+                Path.home() / "Library" / "Application Support" / "pip" / "pip.conf"
+            )
+    return files
 
 
 class Venv:
+    """
+    Virtual environment in a temporary directory. Environments created with
+    [pool_key] are kept in the pool after successful installation of requirements,
+    and later environments with the same key reuse them without installing again.
+    """
+
     ERROR_MESSAGE = "Running command {0} caused error {1}"
 
-    def __init__(self, directory: str = "", with_pip: bool = True):
-        self.directory = TemporaryDirectory(directory)
+    def __init__(
+        self, directory: str = "", with_pip: bool = True, pool_key: str | None = None
+    ):
         self.with_pip = with_pip
+        self._library_path: Optional[Path] = None
+        self._pool_key = pool_key
+        self._installed = False
+        if pool_key is None:
+            self.directory = TemporaryDirectory(directory)
+            self.path = Path(self.directory.name)
+            self.prepared = False
+        else:
+            pool_directory = venv_pool_directory().path
+            pooled = _find_prepared(pool_directory, pool_key)
+            self.prepared = pooled is not None
+            # environments are prepared under a unique name and published under
+            # a new name when complete, so concurrent invocations never use
+            # partial environments and never see environments being replaced
+            self.path = pooled or pool_directory / f".{pool_key}.{os.getpid()}.tmp"
+        self._reference: Optional[Path] = None
 
     def __enter__(self):
-        self._create_venv()
-        self.python_path = self._get_python_path(Path(self.directory.name))
+        if self.prepared:
+            self._acquire_pooled()
+        if self.prepared:
+            log.info("Reusing prepared virtual environment %s", self._pool_key)
+            os.utime(self.path)
+        else:
+            if self._pool_key is not None:
+                shutil.rmtree(self.path, ignore_errors=True)
+                self.path.mkdir(parents=True)
+            self._create_venv()
+        self.python_path = self._get_python_path(self.path)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.directory.cleanup()
+        if self._pool_key is None:
+            self.directory.cleanup()
+        elif self.prepared:
+            _release(self._reference)
+        elif exc_type is None and self._installed:
+            self._add_to_pool()
+        else:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def _acquire_pooled(self) -> None:
+        """
+        Marks the pooled environment as used, so it is not removed from the pool
+        until the command completes. Falls back to preparing a new environment
+        if it was removed in the meantime.
+        """
+        self._reference = self.path.with_name(
+            f".{self.path.name}.{os.getpid()}.{uuid.uuid4().hex}{_REFERENCE_SUFFIX}"
+        )
+        self._reference.touch()
+        if not (self.path / _PREPARED_MARKER).is_file():
+            log.debug("Virtual environment %s was removed from the pool", self.path)
+            _release(self._reference)
+            self._reference = None
+            self.prepared = False
+            self.path = self.path.with_name(f".{self._pool_key}.{os.getpid()}.tmp")
+
+    def _add_to_pool(self) -> None:
+        pooled = self.path.with_name(f"{self._pool_key}.{time.time_ns()}")
+        (self.path / _PREPARED_MARKER).touch()
+        try:
+            os.replace(self.path, pooled)
+        except OSError:
+            log.debug("Could not add virtual environment %s to the pool", pooled.name)
+            shutil.rmtree(self.path, ignore_errors=True)
+            return
+        _prune_pool(pooled.parent)
 
     def run_python(self, args):
 
@@ -55,7 +242,10 @@ class Venv:
         return process
 
     def pip_install(self, requirements_files):
+        if self.prepared:
+            return 0
         process = self.run_python(["-m", "pip", "install", "-r", requirements_files])
+        self._installed = process.returncode == 0
         return process.returncode
 
     def pip_download(self, requirements_files, download_dir):
@@ -65,7 +255,7 @@ class Venv:
         return process.returncode
 
     def _create_venv(self):
-        venv.create(self.directory.name, with_pip=self.with_pip)
+        venv.create(self.path, with_pip=self.with_pip)
 
     @staticmethod
     def _get_python_path(venv_dir: Path) -> Path:
@@ -74,25 +264,24 @@ class Venv:
         return venv_dir / "bin" / "python"
 
     def _get_library_path(self) -> Path:
-        return [
-            lib for lib in (Path(self.directory.name) / "lib").glob("**/site-packages")
-        ][0]
+        if self._library_path is None:
+            self._library_path = [
+                lib for lib in (self.path / "lib").glob("**/site-packages")
+            ][0]
+        return self._library_path
 
     def get_package_dependencies(
         self, requirements_file: str
     ) -> List[RequirementWithFilesAndDeps]:
         installed_packages = self._get_installed_packages_metadata()
+        library_path = self._get_library_path()
         dependencies: Dict = {}
 
         def _get_dependencies(package: Requirement):
             if package.name not in dependencies.keys():
-                requires = installed_packages.get(package.name, {}).get(
-                    "requires_dist", []
-                )
-                files = self._parse_file_list(
-                    self._get_library_path(),
-                    self._parse_info(package.name, PackageInfoType.FILES),
-                )
+                metadata = installed_packages.get(canonicalize_name(package.name), {})
+                requires = metadata.get("requires", [])
+                files = self._parse_file_list(library_path, metadata.get("files", []))
 
                 dependencies[package.name] = RequirementWithFilesAndDeps(
                     requirement=package, files=files, dependencies=requires
@@ -111,41 +300,21 @@ class Venv:
 
         return [dep for dep in dependencies.values()]
 
-    def _get_installed_packages_metadata(self):
-        if inspect := self.get_pip_inspect():
-            return {
-                package.get("metadata", {}).get("name"): package.get("metadata", {})
-                for package in inspect.get("installed", {})
-            }
-        else:
-            return {}
-
-    def get_pip_inspect(self) -> Dict:
-        result = self.run_python(["-m", "pip", "inspect", "--local"])
-
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        else:
+    def _get_installed_packages_metadata(self) -> Dict[str, Dict]:
+        """
+        Returns requirements and files of all distributions installed in the
+        environment, by their canonical names, collected in a single run of
+        the environment interpreter.
+        """
+        result = self.run_python(["-c", _INSTALLED_PACKAGES_SCRIPT])
+        if result.returncode != 0:
+            log.debug("Listing installed packages failed: %s", result.stderr)
             return {}
-
-    def _parse_info(self, package_name: str, info_type: PackageInfoType) -> List[str]:
-        from importlib.metadata import PackagePath  # noqa
-
-        info = self.run_python(
-            [
-                "-c",
-                f"from importlib.metadata import {info_type.value}; print({info_type.value}('{package_name}'))",
-            ]
-        )
-        if info.returncode != 0:
-            return []
-
-        result = eval(info.stdout)
-
-        if result:
-            return result
-        else:
-            return []
+        return {
+            canonicalize_name(package["name"]): package
+            for package in json.loads(result.stdout)
+            if package["name"]
+        }
 
     def _parse_file_list(self, base_dir: Path, files: List):
         result = []
@@ -170,3 +339,102 @@ class Venv:
             if not destination_file.parent.exists():
                 os.makedirs(destination_file.parent)
             shutil.copy(file, destination / file.relative_to(library_path))
+
+
+def _is_prepared(pooled: Path) -> bool:
+    try:
+        prepared_at = (pooled / _PREPARED_MARKER).stat().st_mtime
+    except OSError:
+        return False
+    return time.time() - prepared_at < VENV_POOL_TTL_SECONDS
+
+
+def _generation(entry: Path) -> int:
+    _, _, generation = entry.name.rpartition(".")
+    return int(generation) if generation.isdigit() else 0
+
+
+def _used_at(entry: Path) -> float:
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        # removed concurrently
+        return 0.0
+
+
+def _find_prepared(pool_directory: Path, pool_key: str) -> Optional[Path]:
+    """Returns the newest prepared environment with the given key, if any."""
+    prepared = [
+        entry for entry in pool_directory.glob(f"{pool_key}.*") if _is_prepared(entry)
+    ]
+    return max(prepared, key=_generation, default=None)
+
+
+def _release(reference: Optional[Path]) -> None:
+    if reference is not None:
+        reference.unlink(missing_ok=True)
+
+
+def _in_use(entry: Path) -> bool:
+    """
+    Returns whether any command uses the pooled environment. References left by
+    commands which did not complete are removed once they are older than the
+    time environments are kept for.
+    """
+    in_use = False
+    for reference in entry.parent.glob(f".{entry.name}.*{_REFERENCE_SUFFIX}"):
+        try:
+            referenced_at = reference.stat().st_mtime
+        except OSError:
+            continue
+        if time.time() - referenced_at < VENV_POOL_TTL_SECONDS:
+            in_use = True
+        else:
+            _release(reference)
+    return in_use
+
+
+def _prune_pool(pool_directory: Path) -> None:
+    """
+    Removes expired environments, environments replaced by newer ones with the
+    same key and least recently used environments beyond the pool size.
+    Environments used by running commands are kept.
+    """
+    entries = sorted(
+        (entry for entry in pool_directory.iterdir() if not entry.name.startswith(".")),
+        key=_used_at,
+        reverse=True,
+    )
+    newest: Dict[str, Path] = {}
+    for entry in entries:
+        key = entry.name.rpartition(".")[0]
+        if key not in newest or _generation(entry) > _generation(newest[key]):
+            newest[key] = entry
+    kept = 0
+    for entry in entries:
+        key = entry.name.rpartition(".")[0]
+        if (
+            kept < VENV_POOL_MAX_ENTRIES
+            and _is_prepared(entry)
+            and newest[key] == entry
+        ):
+            kept += 1
+            continue
+        _remove_unused(entry)
+
+
+def _remove_unused(entry: Path) -> None:
+    if _in_use(entry):
+        return
+    removed = entry.with_name(f".{entry.name}.{os.getpid()}.removed")
+    try:
+        os.replace(entry, removed)
+    except OSError:
+        return
+    # references are checked again after the environment is unpublished, so
+    # commands either see it removed or are seen using it and it is restored
+    if _in_use(entry):
+        os.replace(removed, entry)
+        return
+    log.debug("Removing virtual environment %s from the pool", entry.name)
+    shutil.rmtree(removed, ignore_errors=True)
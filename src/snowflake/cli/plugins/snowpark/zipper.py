@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import logging
+import os
+import re
+import shutil
+import stat
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Literal
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Deque, Iterator, Literal, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 log = logging.getLogger(__name__)
 
@@ -24,8 +31,29 @@ IGNORED_FILES = [
     "**/requirements.snowflake.txt",
     "**/requirements.other.txt",
     "**/snowflake.yml",
+    "**/.snowflake/build-cache/*",
 ]
 
+# all ignore patterns as a single regular expression matching absolute paths
+_IGNORED_FILES_REGEX = re.compile(
+    "|".join(fnmatch.translate(os.path.normcase(p)) for p in IGNORED_FILES)
+)
+# directories which content is ignored entirely, so they are not walked at all
+_IGNORED_DIRECTORIES = {
+    os.path.normcase(p[len("**/") : -len("/*")])
+    for p in IGNORED_FILES
+    if re.fullmatch(r"\*\*/[^*?\[/]+/\*", p)
+}
+
+DEFAULT_COMPRESSION_LEVEL = 6
+# files in these formats are compressed already, so they are stored as they are
+ALREADY_COMPRESSED_SUFFIXES = {".whl", ".gz", ".bz2", ".xz", ".jar", ".egg"}
+# larger files are streamed into the archive instead of compressed in memory
+MAX_IN_MEMORY_FILE_SIZE = 64 * 1024 * 1024
+ZIP_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# timestamp of all entries, so identical inputs give identical archives
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
 
 def add_file_to_existing_zip(zip_file: str, file: str):
     """Adds another file to an existing zip file
@@ -39,26 +67,147 @@ def add_file_to_existing_zip(zip_file: str, file: str):
 
 
 def zip_dir(
-    source: Path, dest_zip: Path, mode: Literal["r", "w", "x", "a"] = "w"
+    source: Path,
+    dest_zip: Path,
+    mode: Literal["r", "w", "x", "a"] = "w",
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
 ) -> None:
-    files_to_pack: Iterator[Path] = filter(
-        _to_be_zipped, map(lambda f: f.absolute(), source.glob("**/*"))
-    )
+    """
+    Archives files from the source directory, except ignored ones. Entries are
+    sorted and have normalized timestamps and permissions, so the archive depends
+    only on names and contents of files. Files are read ahead concurrently, while
+    the archive is compressed and written sequentially. Compression level 0 stores
+    files without compression. Files larger than MAX_IN_MEMORY_FILE_SIZE are
+    streamed into the archive, and compressed at the default level regardless of
+    the given one, as ZipFile.open has no compression level argument.
+    """
+    files_to_pack = _files_to_be_zipped(source.absolute())
 
     with ZipFile(dest_zip, mode, ZIP_DEFLATED, allowZip64=True) as package_zip:
-        for file in files_to_pack:
-            log.debug("Adding %s to %s", file, dest_zip)
-            package_zip.write(file, arcname=file.relative_to(source.absolute()))
+        with ThreadPoolExecutor(max_workers=ZIP_MAX_WORKERS) as executor:
+            # bound the number of files held in memory
+            pending: Deque[Tuple[Path, ZipInfo, Future]] = deque()
+            for file, arcname in files_to_pack:
+                zinfo = _zip_info(file, arcname, compression_level)
+                pending.append((file, zinfo, executor.submit(_read, file)))
+                if len(pending) >= 4 * ZIP_MAX_WORKERS:
+                    _write_entry(
+                        package_zip, *pending.popleft(), compression_level, dest_zip
+                    )
+            while pending:
+                _write_entry(
+                    package_zip, *pending.popleft(), compression_level, dest_zip
+                )
+
+
+def tree_digest(source: Path) -> str:
+    """
+    Returns a hash of names, contents and permissions of files which [zip_dir]
+    would archive from the source directory.
+    """
+    digest = hashlib.sha256()
+    for file, arcname in _files_to_be_zipped(source.absolute()):
+        executable = os.stat(file).st_mode & stat.S_IXUSR
+        digest.update(f"{arcname}\0{int(bool(executable))}\0".encode())
+        with open(file, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def append_zip(
+    source_zip: Path,
+    dest_zip: Path,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+) -> None:
+    """
+    Appends all entries of the source archive to the destination archive, giving
+    the same result as archiving their files with [zip_dir] in append mode.
+    """
+    with ZipFile(source_zip) as source, ZipFile(
+        dest_zip, "a", allowZip64=True
+    ) as target:
+        for source_info in source.infolist():
+            log.debug("Adding %s to %s", source_info.filename, dest_zip)
+            zinfo = ZipInfo(source_info.filename, date_time=source_info.date_time)
+            zinfo.create_system = source_info.create_system
+            zinfo.external_attr = source_info.external_attr
+            zinfo.compress_type = source_info.compress_type
+            if source_info.file_size <= MAX_IN_MEMORY_FILE_SIZE:
+                target.writestr(
+                    zinfo,
+                    source.read(source_info),
+                    compress_type=zinfo.compress_type,
+                    compresslevel=compression_level,
+                )
+                continue
+            with source.open(source_info) as source_file, target.open(
+                zinfo, "w", force_zip64=True
+            ) as target_file:
+                shutil.copyfileobj(source_file, target_file, 1024 * 1024)
+
+
+def _files_to_be_zipped(source: Path) -> Iterator[Tuple[Path, str]]:
+    """Yields files to be archived with their archive names, in a stable order."""
+    for root, directories, files in os.walk(source, followlinks=True):
+        directories[:] = sorted(
+            d for d in directories if os.path.normcase(d) not in _IGNORED_DIRECTORIES
+        )
+        root_path = Path(root)
+        for name in sorted(files):
+            file = root_path / name
+            if _to_be_zipped(file):
+                yield file, file.relative_to(source).as_posix()
 
 
 def _to_be_zipped(file: Path) -> bool:
     if file.is_dir():
         return False
+    return not _IGNORED_FILES_REGEX.match(os.path.normcase(str(file)))
 
-    for pattern in IGNORED_FILES:
-        # This has to be a string because of fnmatch
-        file_as_str = str(file)
-        if file_as_str == pattern or fnmatch.fnmatch(file_as_str, pattern):
-            return False
 
-    return True
+def _zip_info(file: Path, arcname: str, compression_level: int) -> ZipInfo:
+    zinfo = ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    zinfo.create_system = 3  # unix, regardless of the platform archive is built on
+    executable = os.stat(file).st_mode & stat.S_IXUSR
+    zinfo.external_attr = (stat.S_IFREG | (0o755 if executable else 0o644)) << 16
+    if compression_level == 0 or file.suffix.lower() in ALREADY_COMPRESSED_SUFFIXES:
+        zinfo.compress_type = ZIP_STORED
+    else:
+        zinfo.compress_type = ZIP_DEFLATED
+    return zinfo
+
+
+def _read(file: Path) -> bytes | None:
+    """Returns content of the file, or None if it is too large to be held in memory."""
+    if file.stat().st_size > MAX_IN_MEMORY_FILE_SIZE:
+        return None
+    return file.read_bytes()
+
+
+def _write_entry(
+    package_zip: ZipFile,
+    file: Path,
+    zinfo: ZipInfo,
+    content: Future,
+    compression_level: int,
+    dest: Path,
+) -> None:
+    log.debug("Adding %s to %s", file, dest)
+    data = content.result()
+    if data is not None:
+        package_zip.writestr(
+            zinfo,
+            data,
+            compress_type=zinfo.compress_type,
+            compresslevel=compression_level,
+        )
+        return
+    # large files are streamed, ZipFile.open compresses them at the default level
+    # (unless the level is 0, which stores them)
+    with open(file, "rb") as source, package_zip.open(
+        zinfo, "w", force_zip64=True
+    ) as target:
+        while chunk := source.read(1024 * 1024):
+            target.write(chunk)
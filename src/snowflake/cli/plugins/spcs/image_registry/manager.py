@@ -4,11 +4,13 @@ import re
 import subprocess
 from urllib.parse import urlparse
 
-import requests
 from click import ClickException
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.connector.cursor import DictCursor
 
+requests = lazy_import("requests")
+
 
 class NoImageRepositoriesFoundError(ClickException):
     def __init__(self):
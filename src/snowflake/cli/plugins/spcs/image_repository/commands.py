@@ -1,7 +1,6 @@
 import json
 from typing import Optional
 
-import requests
 import typer
 from click import ClickException
 from snowflake.cli.api.commands.flags import IfNotExistsOption, ReplaceOption
@@ -13,9 +12,12 @@ from snowflake.cli.api.output.types import (
     SingleQueryResult,
 )
 from snowflake.cli.api.project.util import is_valid_object_name
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.cli.plugins.spcs.image_registry.manager import RegistryManager
 from snowflake.cli.plugins.spcs.image_repository.manager import ImageRepositoryManager
 
+requests = lazy_import("requests")
+
 app = SnowTyper(
     name="image-repository",
     help="Manages Snowpark Container Services image repositories.",
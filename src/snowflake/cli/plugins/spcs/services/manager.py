@@ -2,10 +2,10 @@ import json
 from pathlib import Path
 from typing import List, Optional
 
-import yaml
 from snowflake.cli.api.constants import DEFAULT_SIZE_LIMIT_MB, ObjectType
 from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.api.utils.lazy_import import lazy_import
 from snowflake.cli.plugins.object.common import Tag
 from snowflake.cli.plugins.spcs.common import (
     NoPropertiesProvidedError,
@@ -15,6 +15,8 @@ from snowflake.cli.plugins.spcs.common import (
 from snowflake.connector.cursor import SnowflakeCursor
 from snowflake.connector.errors import ProgrammingError
 
+yaml = lazy_import("yaml")
+
 
 class ServiceManager(SqlExecutionMixin):
     def create(
@@ -34,6 +34,14 @@ def execute_sql(
         "-i",
         help="Read the query from standard input. Use it when piping input to this command.",
     ),
+    parallel: int = typer.Option(
+        1,
+        "--parallel",
+        min=1,
+        help="Maximum number of statements executed concurrently. Results are returned in order of statements."
+        " Statements changing session state (`use`, `alter session`, `set`, `unset`), PUT and GET commands"
+        " and statements inside transactions wait for all previous statements to finish.",
+    ),
     **options
 ) -> CommandResult:
     """
@@ -42,7 +50,7 @@ def execute_sql(
     Query to execute can be specified using query option, filename option (all queries from file will be executed)
     or via stdin by piping output from other command. For example `cat my.sql | snow sql -i`.
     """
-    single_statement, cursors = SqlManager().execute(query, file, std_in)
+    single_statement, cursors = SqlManager().execute(query, file, std_in, parallel)
     if single_statement:
         return QueryResult(next(cursors))
     return MultipleResults((QueryResult(c) for c in cursors))
@@ -1,18 +1,52 @@
 import sys
+import time
+from collections import deque
+from contextlib import suppress
 from io import StringIO
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Deque, Iterable, List, Optional, Tuple
 
 from click import UsageError
 from snowflake.cli.api.secure_path import UNLIMITED, SecurePath
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
 from snowflake.connector.cursor import SnowflakeCursor
+from snowflake.connector.errors import Error
 from snowflake.connector.util_text import split_statements
 
+# statements changing session state, all previous statements have to finish first
+SESSION_STATE_STATEMENTS = ("use", "alter session", "set", "unset")
+TRANSACTION_START_STATEMENTS = ("begin", "begin transaction", "begin work")
+TRANSACTION_END_STATEMENTS = ("commit", "rollback")
+
+# seconds between checks of status of running queries
+MIN_POLLING_INTERVAL = 0.05
+MAX_POLLING_INTERVAL = 1.0
+
+
+class _PendingQuery:
+    def __init__(
+        self,
+        cursor: SnowflakeCursor,
+        query_id: str,
+        statement: str,
+        started_at_ns: int,
+        started: int,
+    ):
+        self.cursor = cursor
+        self.query_id = query_id
+        self.statement = statement
+        self.started_at_ns = started_at_ns
+        self.started = started
+        self.finished = False
+
 
 class SqlManager(SqlExecutionMixin):
     def execute(
-        self, query: Optional[str], file: Optional[Path], std_in: bool
+        self,
+        query: Optional[str],
+        file: Optional[Path],
+        std_in: bool,
+        parallel: int = 1,
     ) -> Tuple[int, Iterable[SnowflakeCursor]]:
         inputs = [query, file, std_in]
         if not any(inputs):
@@ -29,10 +63,131 @@ class SqlManager(SqlExecutionMixin):
         elif file:
             query = SecurePath(file).read_text(file_size_limit_mb=UNLIMITED)
 
-        statements = tuple(
-            statement
-            for statement, _ in split_statements(StringIO(query), remove_comments=True)
-        )
+        statements = tuple(split_statements(StringIO(query), remove_comments=True))
         single_statement = len(statements) == 1
 
-        return single_statement, self._execute_string("\n".join(statements))
+        if parallel > 1 and not single_statement:
+            return single_statement, self._execute_statements_in_parallel(
+                statements, parallel
+            )
+        return single_statement, self._execute_string(
+            "\n".join(statement for statement, _ in statements)
+        )
+
+    def _execute_statements_in_parallel(
+        self, statements: Iterable[Tuple[str, bool]], parallel: int
+    ) -> Iterable[SnowflakeCursor]:
+        """
+        Submits up to [parallel] statements asynchronously and returns their cursors
+        in submission order. Statements changing session state, PUT/GET and
+        statements inside transactions wait for all previous statements to finish
+        and are executed synchronously.
+        """
+        pending: Deque[_PendingQuery] = deque()
+        in_transaction = False
+        try:
+            for statement, is_put_or_get in statements:
+                normalized = _normalize_statement(statement)
+                if is_put_or_get or in_transaction or _is_barrier(normalized):
+                    yield from self._wait_for_pending_queries(pending, amount=None)
+                    cursor = self._conn.cursor()
+                    self._log.debug("Executing %s", statement)
+                    started_at_ns, started = time.time_ns(), time.perf_counter_ns()
+                    cursor.execute(statement)
+                    self._update_session_state(statement)
+                    self._trace_query(
+                        cursor,
+                        statement,
+                        started_at_ns,
+                        time.perf_counter_ns() - started,
+                    )
+                    yield cursor
+                    if _starts_transaction(normalized):
+                        in_transaction = True
+                    elif normalized in TRANSACTION_END_STATEMENTS:
+                        in_transaction = False
+                    continue
+
+                if len(pending) >= parallel:
+                    yield from self._wait_for_pending_queries(
+                        pending, amount=len(pending) - parallel + 1
+                    )
+                cursor = self._conn.cursor()
+                self._log.debug("Submitting %s", statement)
+                started_at_ns, started = time.time_ns(), time.perf_counter_ns()
+                cursor.execute_async(statement)
+                self._update_session_state(statement)
+                pending.append(
+                    _PendingQuery(
+                        cursor, cursor.sfqid, statement, started_at_ns, started
+                    )
+                )
+
+            yield from self._wait_for_pending_queries(pending, amount=None)
+        finally:
+            # abort statements which results won't be read due to an error
+            for query in pending:
+                if query.finished:
+                    continue
+                self._log.debug("Aborting query %s", query.query_id)
+                with suppress(Error):
+                    query.cursor.abort_query(query.query_id)
+
+    def _wait_for_pending_queries(
+        self, pending: Deque[_PendingQuery], amount: Optional[int]
+    ) -> Iterable[SnowflakeCursor]:
+        """
+        Polls status of all pending queries until [amount] first of them
+        (all if amount is None) finish, and returns their cursors in order.
+        Errors are raised in order as well, once all previous queries returned
+        their results, like in sequential execution.
+        """
+        amount = len(pending) if amount is None else amount
+        interval = MIN_POLLING_INTERVAL
+        while amount > 0:
+            self._update_status(pending)
+            while amount > 0 and pending[0].finished:
+                query = pending[0]
+                # raises an error if query failed
+                self._conn.get_query_status_throw_if_error(query.query_id)
+                query.cursor.query_result(query.query_id)
+                self._trace_query(
+                    query.cursor,
+                    query.statement,
+                    query.started_at_ns,
+                    time.perf_counter_ns() - query.started,
+                )
+                pending.popleft()
+                amount -= 1
+                yield query.cursor
+            if amount > 0 and not pending[0].finished:
+                time.sleep(interval)
+                interval = min(interval * 2, MAX_POLLING_INTERVAL)
+
+    def _update_status(self, pending: Iterable[_PendingQuery]) -> None:
+        for query in pending:
+            if not query.finished:
+                status = self._conn.get_query_status(query.query_id)
+                query.finished = not self._conn.is_still_running(status)
+
+
+def _normalize_statement(statement: str) -> str:
+    return " ".join(statement.rstrip().rstrip(";").split()).lower()
+
+
+def _starts_transaction(normalized_statement: str) -> bool:
+    return normalized_statement in TRANSACTION_START_STATEMENTS or (
+        normalized_statement.startswith("start transaction")
+    )
+
+
+def _is_barrier(normalized_statement: str) -> bool:
+    words: List[str] = normalized_statement.split(" ")
+    return (
+        _starts_transaction(normalized_statement)
+        or words[0] in TRANSACTION_END_STATEMENTS
+        or any(
+            words[: len(keyword.split(" "))] == keyword.split(" ")
+            for keyword in SESSION_STATE_STATEMENTS
+        )
+    )
@@ -35,15 +35,13 @@ class StreamlitManager(SqlExecutionMixin):
         pages_dir: Optional[Path],
         additional_source_files: Optional[List[str]],
     ):
-        stage_manager = StageManager()
-
-        stage_manager.put(main_file, root_location, 4, True)
+        files = [(main_file, root_location)]
 
         if environment_file and environment_file.exists():
-            stage_manager.put(environment_file, root_location, 4, True)
+            files.append((environment_file, root_location))
 
         if pages_dir and pages_dir.exists():
-            stage_manager.put(pages_dir / "*.py", f"{root_location}/pages", 4, True)
+            files.append((pages_dir / "*.py", f"{root_location}/pages"))
 
         if additional_source_files:
             for file in additional_source_files:
@@ -54,7 +52,9 @@ class StreamlitManager(SqlExecutionMixin):
                     if "/" in file
                     else root_location
                 )
-                stage_manager.put(file, destination, 4, True)
+                files.append((Path(file), destination))
+
+        StageManager().put_many(files, overwrite=True)
 
     def _create_streamlit(
         self,
@@ -0,0 +1,124 @@
+import json
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.query_trace import statement_hash
+from snowflake.connector.errors import ProgrammingError
+
+
+def _traced_ctx(mock_ctx, mock_cursor):
+    cursor = mock_cursor([("a",), ("b",)], ["column"])
+    cursor._sfqid = "01-query-id"  # noqa: SLF001
+    ctx = mock_ctx(cursor)
+    ctx.cursor.return_value.fetchall.return_value = [("01-query-id", 42)]
+    return ctx
+
+
+@mock.patch("snowflake.connector.connect")
+def test_trace_queries_json(mock_connector, mock_ctx, mock_cursor, runner, tmp_path):
+    mock_connector.return_value = _traced_ctx(mock_ctx, mock_cursor)
+    report = tmp_path / "report.json"
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "select column from table",
+            "--trace-queries",
+            "json",
+            "--trace-queries-file",
+            str(report),
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    [traced] = json.loads(report.read_text())
+    assert traced["statement_hash"] == statement_hash("SELECT A MOCK QUERY")
+    assert traced["query_id"] == "01-query-id"
+    assert traced["server_elapsed_ms"] == 42
+    assert traced["rows"] == 2
+    assert traced["client_latency_ms"] >= 0
+
+
+@mock.patch("snowflake.connector.connect")
+def test_trace_queries_otel(mock_connector, mock_ctx, mock_cursor, runner, tmp_path):
+    mock_connector.return_value = _traced_ctx(mock_ctx, mock_cursor)
+    report = tmp_path / "spans.json"
+
+    result = runner.invoke(
+        [
+            "sql",
+            "-q",
+            "select column from table",
+            "--trace-queries",
+            "otel",
+            "--trace-queries-file",
+            str(report),
+        ]
+    )
+
+    assert result.exit_code == 0, result.output
+    [resource_spans] = json.loads(report.read_text())["resourceSpans"]
+    command_span, query_span = resource_spans["scopeSpans"][0]["spans"]
+    assert command_span["name"].endswith(" sql")
+    assert query_span["parentSpanId"] == command_span["spanId"]
+    assert query_span["traceId"] == command_span["traceId"]
+    assert {"key": "snowflake.query_id", "value": {"stringValue": "01-query-id"}} in (
+        query_span["attributes"]
+    )
+
+
+@mock.patch("snowflake.connector.connect")
+def test_trace_queries_of_failed_command(
+    mock_connector, mock_ctx, mock_cursor, runner, tmp_path
+):
+    ctx = _traced_ctx(mock_ctx, mock_cursor)
+    execute_stream = ctx.execute_stream
+
+    def _execute_stream(*args, **kwargs):
+        yield from execute_stream(*args, **kwargs)
+        raise ProgrammingError(
+            "Object does not exist", sfqid="02-query-id", query="select 2"
+        )
+
+    ctx.execute_stream = _execute_stream
+    mock_connector.return_value = ctx
+    report = tmp_path / "report.json"
+
+    with pytest.raises(ProgrammingError):
+        runner.invoke(
+            [
+                "sql",
+                "-q",
+                "select 1; select 2",
+                "--trace-queries",
+                "json",
+                "--trace-queries-file",
+                str(report),
+            ]
+        )
+
+    succeeded, failed = json.loads(report.read_text())
+    assert succeeded["query_id"] == "01-query-id"
+    assert failed["query_id"] == "02-query-id"
+    assert failed["statement_hash"] == statement_hash("select 2")
+    assert failed["rows"] is None
+
+
+@mock.patch("snowflake.connector.connect")
+def test_queries_are_not_traced_by_default(
+    mock_connector, mock_ctx, mock_cursor, runner
+):
+    ctx = _traced_ctx(mock_ctx, mock_cursor)
+    mock_connector.return_value = ctx
+
+    result = runner.invoke(["sql", "-q", "select column from table"])
+
+    assert result.exit_code == 0, result.output
+    assert "Executed queries" not in result.output
+    ctx.cursor.assert_not_called()
+
+
+def test_statement_hash_ignores_whitespace():
+    assert statement_hash("select 1;") == statement_hash("  select\n  1 ")
+    assert statement_hash("select 1") != statement_hash("select 2")
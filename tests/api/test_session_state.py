@@ -0,0 +1,112 @@
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.cli_global_context import cli_context
+from snowflake.cli.api.session_state import SessionState
+from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.connector.cursor import DictCursor
+
+
+def _known_state():
+    return SessionState(role="r", warehouse="w", database="d", schema="s")
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("use role some_role", SessionState("some_role", "w", "d", "s")),
+        ("USE WAREHOUSE xs ;", SessionState("r", "xs", "d", "s")),
+        ("use database db", SessionState("r", "w", "db", None)),
+        ("use schema sch", SessionState("r", "w", "d", "sch")),
+        ("use schema db.sch", SessionState("r", "w", "db", "sch")),
+        ("select 1", SessionState("r", "w", "d", "s")),
+        ("use secondary roles all", SessionState()),
+        ('use role "Quoted Role"', SessionState()),
+        ("call my_procedure()", SessionState()),
+        ("execute immediate 'use role x'", SessionState()),
+        ("create warehouse new_wh", SessionState("r", None, "d", "s")),
+        ("CREATE OR REPLACE DATABASE db2", SessionState("r", "w", None, None)),
+        ("create transient schema db2.sch", SessionState("r", "w", None, None)),
+        ("create schema if not exists sch", SessionState("r", "w", None, None)),
+        ("drop warehouse if exists w", SessionState("r", None, "d", "s")),
+        ("drop database d", SessionState("r", "w", None, None)),
+        ("create table t (a int)", SessionState("r", "w", "d", "s")),
+        ("drop role r", SessionState("r", "w", "d", "s")),
+    ],
+)
+def test_session_state_update(query, expected):
+    state = _known_state()
+
+    state.update(query)
+
+    assert state == expected
+
+
+@mock.patch.object(SqlExecutionMixin, "_execute_query")
+def test_use_role_probes_current_role_once(mock_execute, mock_cursor):
+    mock_execute.return_value = mock_cursor([{"CURRENT_ROLE()": "old_role"}], [])
+    sql = SqlExecutionMixin()
+
+    with sql.use_role("new_role"):
+        with sql.use_role("NEW_ROLE"):
+            pass
+    with sql.use_role("other_role"):
+        pass
+
+    assert mock_execute.mock_calls == [
+        mock.call("select current_role()", cursor_class=DictCursor),
+        mock.call("use role new_role"),
+        mock.call("use role old_role"),
+        mock.call("use role other_role"),
+        mock.call("use role old_role"),
+    ]
+
+
+@mock.patch.object(SqlExecutionMixin, "_execute_query")
+def test_use_warehouse_skips_switch_to_current_warehouse(mock_execute):
+    sql = SqlExecutionMixin()
+
+    sql.use_warehouse("xs")
+    sql.use_warehouse("XS")
+
+    mock_execute.assert_called_once_with("use warehouse xs")
+
+
+@mock.patch.object(SqlExecutionMixin, "_execute_query")
+def test_use_warehouse_after_creating_warehouse(mock_execute):
+    sql = SqlExecutionMixin()
+
+    sql.use_warehouse("xs")
+    cli_context.session_state.update("create warehouse new_wh")
+    sql.use_warehouse("xs")
+
+    assert mock_execute.mock_calls == [
+        mock.call("use warehouse xs"),
+        mock.call("use warehouse xs"),
+    ]
+
+
+def test_executed_statements_update_session_state(mock_ctx, mock_cursor):
+    ctx = mock_ctx()
+    executed = []
+
+    def _execute_stream(stream, **kwargs):
+        for query in stream.read().split(";"):
+            cursor = mock_cursor([], [])
+            cursor.query = query
+            executed.append(query)
+            yield cursor
+
+    ctx.execute_stream = _execute_stream
+    sql = SqlExecutionMixin()
+
+    with mock.patch.object(
+        SqlExecutionMixin, "_conn", new_callable=mock.PropertyMock, return_value=ctx
+    ):
+        sql._execute_queries("use role a;use warehouse w;select 1")  # noqa: SLF001
+        with sql.use_role("A"):
+            sql.use_warehouse("w")
+
+    assert executed == ["use role a", "use warehouse w", "select 1"]
+    assert cli_context.session_state.role == "a"
+    assert cli_context.session_state.executed_queries == 3
@@ -0,0 +1,75 @@
+import os
+from unittest import mock
+
+import pytest
+from snowflake.cli.api.cli_global_context import cli_context
+from snowflake.cli.api.utils.file_index import FileIndex
+
+FILES = [
+    "app/manifest.yml",
+    "app/README.md",
+    "app/.hidden.sql",
+    "src/a.py",
+    "src/lib/b.py",
+    "src/lib/nested/c.py",
+    "src/lib/nested/d.txt",
+]
+
+
+@pytest.fixture
+def project(tmp_path):
+    for file in FILES:
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).write_text(file)
+    (tmp_path / "linked").symlink_to(tmp_path / "src", target_is_directory=True)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "app/*",
+        "app/*.sql",
+        "src/*.py",
+        "src/**/*.py",
+        "**/*.py",
+        "**",
+        "src/**",
+        "*/",
+        "src/*/",
+        "*/lib/*",
+        "linked/*.py",
+        "src/lib/nested/?.py",
+        "src/lib/nested/[cd].*",
+        "./src/lib/*",
+        "src/missing/*",
+        "app/manifest.yml",
+    ],
+)
+def test_glob_matches_path_glob(project, pattern):
+    assert sorted(FileIndex(project).glob(pattern)) == sorted(project.glob(pattern))
+
+
+def test_directories_are_scanned_once(project):
+    index = FileIndex(project)
+    with mock.patch("os.scandir", wraps=os.scandir) as scandir:
+        index.glob("src/**/*.py")
+        index.glob("src/lib/*.py")
+        files = index.files(project / "src")
+
+    assert scandir.call_count == 3
+    assert files == [
+        project / "src/a.py",
+        project / "src/lib/b.py",
+        project / "src/lib/nested/c.py",
+        project / "src/lib/nested/d.txt",
+    ]
+
+
+def test_file_index_is_shared_until_invalidated(project):
+    index = cli_context.file_index(project)
+    assert cli_context.file_index(project / "app" / "..") is index
+
+    cli_context.invalidate_file_indexes()
+    assert cli_context.file_index(project) is not index
@@ -0,0 +1,23 @@
+import sys
+
+from snowflake.cli.api.utils.lazy_import import lazy_import
+
+
+def test_module_is_imported_on_first_attribute_access(monkeypatch):
+    monkeypatch.delitem(sys.modules, "json.tool", raising=False)
+
+    json_tool = lazy_import("json.tool")
+    assert "json.tool" not in sys.modules
+
+    assert callable(json_tool.main)
+    assert "json.tool" in sys.modules
+
+
+def test_attributes_can_be_patched(monkeypatch):
+    json = lazy_import("json")
+
+    monkeypatch.setattr(json, "dumps", lambda _: "patched")
+    assert json.dumps({}) == "patched"
+
+    monkeypatch.undo()
+    assert json.dumps({}) == "{}"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from logging import FileHandler
+from unittest import mock
 
 import pytest
 from snowflake.cli.api.cli_global_context import cli_context_manager
@@ -10,6 +11,7 @@ from snowflake.cli.api.commands.decorators import global_options, with_output
 from snowflake.cli.api.config import config_init
 from snowflake.cli.api.console import cli_console
 from snowflake.cli.api.output.types import QueryResult
+from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.app import loggers
 
 pytest_plugins = ["tests.testing_utils.fixtures", "tests.project.fixtures"]
@@ -48,6 +50,20 @@ def isolate_snowflake_home(snowflake_home):
     yield snowflake_home
 
 
+# This automatically used fixture keeps Snowflake Anaconda channel data and
+# virtual environments cached by one test from being used by other tests.
+@pytest.fixture(autouse=True)
+def isolate_snowpark_caches(tmp_path):
+    with mock.patch(
+        "snowflake.cli.plugins.snowpark.package.anaconda.channel_cache_directory",
+        return_value=SecurePath(tmp_path / "anaconda_channel_cache"),
+    ), mock.patch(
+        "snowflake.cli.plugins.snowpark.venv.venv_pool_directory",
+        return_value=SecurePath(tmp_path / "venv_pool"),
+    ):
+        yield
+
+
 def clean_logging_handlers():
     for logger in [logging.getLogger()] + list(
         logging.Logger.manager.loggerDict.values()
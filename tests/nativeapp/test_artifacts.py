@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import List, Optional
+from unittest import mock
 
 import pytest
 from snowflake.cli.api.project.definition import load_project_definition
@@ -11,6 +12,7 @@ from snowflake.cli.plugins.nativeapp.artifacts import (
     SourceNotFoundError,
     TooManyFilesError,
     build_bundle,
+    link_file,
     translate_artifact,
 )
 
@@ -163,3 +165,89 @@ def test_too_many_files(project_definition_files):
                 ArtifactMapping("app/streamlit/*.py", "somehow_combined_streamlits.py")
             ],
         )
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_rebundle_links_only_changed_entries(project_definition_files):
+    project_root = project_definition_files[0].parent
+    deploy_root = Path(project_root, "output", "deploy")
+    artifacts = [
+        ArtifactMapping("setup.sql", "setup.sql"),
+        ArtifactMapping("app", "app"),
+    ]
+    build_bundle(project_root, deploy_root, artifacts)
+
+    with mock.patch(
+        "snowflake.cli.plugins.nativeapp.artifacts.link_file", side_effect=link_file
+    ) as mock_link:
+        build_bundle(project_root, deploy_root, artifacts)
+        mock_link.assert_not_called()
+
+        artifacts[0] = ArtifactMapping("app/README.md", "setup.sql")
+        build_bundle(project_root, deploy_root, artifacts)
+        mock_link.assert_called_once_with(
+            project_root / "app" / "README.md", deploy_root.resolve() / "setup.sql"
+        )
+
+    assert trimmed_contents(deploy_root / "setup.sql") == "app/README.md"
+    assert "app/streamlit/main.py" in dir_structure(deploy_root)
+
+    build_bundle(project_root, deploy_root, artifacts[:1])
+    assert dir_structure(deploy_root) == ["setup.sql"]
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_bundle_copies_files_when_links_are_not_supported(project_definition_files):
+    project_root = project_definition_files[0].parent
+    deploy_root = Path(project_root, "output", "deploy")
+    artifacts = [ArtifactMapping("setup.sql", "setup.sql")]
+
+    with mock.patch("os.symlink", side_effect=OSError), mock.patch(
+        "os.link", side_effect=OSError
+    ):
+        build_bundle(project_root, deploy_root, artifacts)
+        assert not (deploy_root / "setup.sql").is_symlink()
+        assert (
+            trimmed_contents(deploy_root / "setup.sql")
+            == "create versioned schema myschema;"
+        )
+
+        # copies are updated only when their sources change
+        with mock.patch(
+            "snowflake.cli.plugins.nativeapp.artifacts.link_file",
+            side_effect=link_file,
+        ) as mock_link:
+            build_bundle(project_root, deploy_root, artifacts)
+            mock_link.assert_not_called()
+
+            (project_root / "setup.sql").write_text("select 1;")
+            build_bundle(project_root, deploy_root, artifacts)
+            mock_link.assert_called_once()
+
+    assert trimmed_contents(deploy_root / "setup.sql") == "select 1;"
+
+
+@pytest.mark.parametrize("project_definition_files", ["napp_project_1"], indirect=True)
+def test_rebundle_with_files_replacing_directories(project_definition_files):
+    project_root = project_definition_files[0].parent
+    deploy_root = Path(project_root, "output", "deploy")
+
+    # a file replaces the directory mapped before it, and vice versa
+    artifacts = [
+        ArtifactMapping("app", "app"),
+        ArtifactMapping("setup.sql", "app"),
+    ]
+    for _ in range(2):
+        build_bundle(project_root, deploy_root, artifacts)
+        assert dir_structure(deploy_root) == ["app"]
+        assert trimmed_contents(deploy_root / "app") == (
+            "create versioned schema myschema;"
+        )
+
+    artifacts = [
+        ArtifactMapping("setup.sql", "app"),
+        ArtifactMapping("app/README.md", "app/README.md"),
+    ]
+    for _ in range(2):
+        build_bundle(project_root, deploy_root, artifacts)
+        assert dir_structure(deploy_root) == ["app/README.md"]
@@ -382,10 +382,6 @@ def test_create_dev_app_create_new_with_additional_privileges(
             ),
             (None, mock.call("use role app_role")),
             (None, mock.call("use warehouse app_warehouse")),
-            (
-                mock_cursor([{"CURRENT_ROLE()": "app_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (None, mock.call("use role app_role")),
             (
@@ -1236,10 +1232,6 @@ def test_upgrade_app_recreate_app(
                 mock.call("alter application myapp upgrade "),
             ),
             (None, mock.call("drop application myapp")),
-            (
-                mock_cursor([{"CURRENT_ROLE()": "app_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (
                 None,
@@ -1369,10 +1361,6 @@ def test_upgrade_app_recreate_app_from_version(
                 mock.call("alter application myapp upgrade using version v1 "),
             ),
             (None, mock.call("drop application myapp")),
-            (
-                mock_cursor([{"CURRENT_ROLE()": "app_role"}], []),
-                mock.call("select current_role()", cursor_class=DictCursor),
-            ),
             (None, mock.call("use role package_role")),
             (
                 None,
@@ -1462,3 +1450,60 @@ def test_get_existing_version_info(mock_execute, temp_dir, mock_cursor):
     result = processor.get_existing_version_info(version)
     assert mock_execute.mock_calls == expected
     assert result["version"] == version
+
+
+# Test get_run_preflight submits all queries before waiting for any of them
+@mock.patch(NATIVEAPP_MANAGER_EXECUTE)
+@mock_connection()
+def test_get_run_preflight(mock_conn, mock_execute, temp_dir, mock_cursor):
+    side_effects, expected = mock_execute_helper(
+        [
+            (
+                mock_cursor([{"CURRENT_ROLE()": "old_role"}], []),
+                mock.call("select current_role()", cursor_class=DictCursor),
+            ),
+            (None, mock.call("use role package_role")),
+            (None, mock.call("use role old_role")),
+            (None, mock.call("use role app_role")),
+            (None, mock.call("use role old_role")),
+        ]
+    )
+    mock_execute.side_effect = side_effects
+    results = {
+        r"show application packages like 'APP\\_PKG'": [
+            {"name": "APP_PKG", "owner": "package_role", "comment": SPECIAL_COMMENT}
+        ],
+        "describe application package app_pkg": [("distribution", "INTERNAL")],
+        "show applications like 'MYAPP'": [],
+    }
+    events = []
+
+    def _cursor(cursor_class):
+        cursor = mock.Mock()
+        cursor.execute_async.side_effect = lambda query: events.append(
+            ("submit", query)
+        )
+        cursor.get_results_from_sfqid.side_effect = lambda _: events.append(
+            ("wait", cursor.execute_async.call_args.args[0])
+        )
+        cursor.fetchall.side_effect = lambda: results[
+            cursor.execute_async.call_args.args[0]
+        ]
+        return cursor
+
+    mock_conn.return_value.cursor.side_effect = _cursor
+
+    current_working_directory = os.getcwd()
+    create_named_file(
+        file_name="snowflake.yml",
+        dir_name=current_working_directory,
+        contents=[mock_snowflake_yml_file],
+    )
+
+    preflight = _get_na_run_processor().get_run_preflight()
+
+    assert mock_execute.mock_calls == expected
+    assert [kind for kind, _ in events] == ["submit"] * 3 + ["wait"] * 3
+    assert preflight.app_pkg_row["name"] == "APP_PKG"
+    assert preflight.app_pkg_distribution == "internal"
+    assert preflight.app_row is None
@@ -1,12 +1,17 @@
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Union
 from unittest import mock
 
 import pytest
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
+from snowflake.cli.api.secure_path import SecurePath
 from snowflake.cli.plugins.object.stage.diff import (
     DiffResult,
+    compute_md5sum,
+    compute_md5sums,
     delete_only_on_stage_files,
     enumerate_files,
     get_stage_path_from_file,
@@ -19,6 +24,7 @@ from snowflake.cli.plugins.object.stage.manager import StageManager
 from tests.testing_utils.files_and_dirs import temp_local_dir
 
 STAGE_MANAGER = "snowflake.cli.plugins.object.stage.manager.StageManager"
+DIFF_MODULE = "snowflake.cli.plugins.object.stage.diff"
 
 FILE_CONTENTS = {
     "README.md": "This is a README\n",
@@ -29,6 +35,21 @@ DEFAULT_LAST_MODIFIED = "Tue, 5 Sep 2023 17:59:21 GMT"
 STAGE_LS_COLUMNS = ["name", "size", "md5", "last_modified"]
 
 
+@pytest.fixture(autouse=True)
+def checksum_index_directory(tmp_path):
+    with mock.patch(
+        f"{DIFF_MODULE}.checksum_index_directory",
+        return_value=SecurePath(tmp_path / "index"),
+    ):
+        yield tmp_path / "index"
+
+
+def _set_old_mtime(local_path: Path):
+    # recently modified files are not indexed, as they may change again unnoticed
+    for file in enumerate_files(local_path):
+        os.utime(file, (1_600_000_000, 1_600_000_000))
+
+
 def md5_of(contents: Union[str, bytes]) -> str:
     hash_value = hashlib.md5()
     if isinstance(contents, bytes):
@@ -130,6 +151,60 @@ def test_modified_file(mock_list, mock_cursor):
         assert len(diff_result.only_local) == 0
 
 
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_unchanged_files_are_not_hashed_again(mock_list, mock_cursor):
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        _set_old_mtime(local_path)
+        mock_list.return_value = mock_cursor(
+            rows=stage_contents(FILE_CONTENTS), columns=STAGE_LS_COLUMNS
+        )
+        stage_diff(local_path, "a.b.c")
+
+        (local_path / "README.md").write_text("This is a modified README\n")
+        mock_list.return_value = mock_cursor(
+            rows=stage_contents(FILE_CONTENTS), columns=STAGE_LS_COLUMNS
+        )
+        with mock.patch(
+            f"{DIFF_MODULE}.compute_md5sums", side_effect=compute_md5sums
+        ) as mock_compute:
+            diff_result = stage_diff(local_path, "a.b.c")
+
+        mock_compute.assert_called_once_with([local_path / "README.md"])
+        assert diff_result.different == ["README.md"]
+        assert sorted(diff_result.identical) == ["my.jar", "ui/streamlit.py"]
+
+
+@mock.patch(f"{STAGE_MANAGER}.list_files")
+def test_malformed_checksum_index_is_ignored(
+    mock_list, mock_cursor, checksum_index_directory
+):
+    mock_list.return_value = mock_cursor(
+        rows=stage_contents(FILE_CONTENTS), columns=STAGE_LS_COLUMNS
+    )
+    checksum_index_directory.mkdir()
+    with temp_local_dir(FILE_CONTENTS) as local_path:
+        index_name = hashlib.sha256(str(local_path.resolve()).encode()).hexdigest()
+        (checksum_index_directory / f"{index_name}.json").write_text("{not json")
+
+        diff_result = stage_diff(local_path, "a.b.c")
+
+    assert sorted(diff_result.identical) == sorted(FILE_CONTENTS.keys())
+
+
+@mock.patch(f"{DIFF_MODULE}.PARALLEL_HASHING_THRESHOLD", 2)
+def test_compute_md5sums_in_parallel():
+    files = {f"file_{i}.txt": f"content {i}" for i in range(5)}
+    with temp_local_dir(files) as local_path:
+        paths = [local_path / name for name in files]
+        with mock.patch(
+            f"{DIFF_MODULE}.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as executor:
+            md5sums = compute_md5sums(paths)
+        assert md5sums == [compute_md5sum(path) for path in paths]
+
+    executor.assert_called_once()
+
+
 def test_get_stage_path_from_file():
     expected = [
         "",
@@ -153,20 +228,20 @@ def test_get_stage_path_from_file():
     assert actual.sort() == expected
 
 
-@mock.patch(f"{STAGE_MANAGER}.remove")
-def test_delete_only_on_stage_files(mock_remove):
+@mock.patch(f"{STAGE_MANAGER}.remove_many")
+def test_delete_only_on_stage_files(mock_remove_many):
     stage_name = "some_stage_name"
     random_file = "some_file_on_stage"
 
     delete_only_on_stage_files(StageManager(), stage_name, [random_file], "some_role")
-    mock_remove.assert_has_calls(
-        [mock.call(stage_name=stage_name, path=random_file, role="some_role")]
+    mock_remove_many.assert_called_once_with(
+        stage_name=stage_name, paths=[random_file], role="some_role"
     )
 
 
-@mock.patch(f"{STAGE_MANAGER}.put")
+@mock.patch(f"{STAGE_MANAGER}.put_many")
 @pytest.mark.parametrize("overwrite_param", [True, False])
-def test_put_files_on_stage(mock_put, overwrite_param):
+def test_put_files_on_stage(mock_put_many, overwrite_param):
     stage_name = "some_stage_name"
     with temp_local_dir(
         {
@@ -182,24 +257,18 @@ def test_put_files_on_stage(mock_put, overwrite_param):
             role="some_role",
             overwrite=overwrite_param,
         )
-        expected = [
-            mock.call(
-                local_path=local_path / "ui/nested/environment.yml",
-                stage_path=f"{stage_name}/ui/nested",  # TODO: verify if trailing slash is needed, doesnt seem so from regression tests
-                role="some_role",
-                overwrite=overwrite_param,
-            ),
-            mock.call(
-                local_path=local_path / "README.md",
-                stage_path=f"{stage_name}",
-                role="some_role",
-                overwrite=overwrite_param,
-            ),
-        ]
-        assert mock_put.mock_calls == expected
-
-
-@mock.patch(f"{STAGE_MANAGER}.remove")
+        mock_put_many.assert_called_once_with(
+            [
+                # TODO: verify if trailing slash is needed, doesnt seem so from regression tests
+                (local_path / "ui/nested/environment.yml", f"{stage_name}/ui/nested"),
+                (local_path / "README.md", stage_name),
+            ],
+            role="some_role",
+            overwrite=overwrite_param,
+        )
+
+
+@mock.patch(f"{STAGE_MANAGER}.remove_many")
 def test_sync_local_diff_with_stage(mock_remove, other_directory):
     temp_dir = Path(other_directory)
     mock_remove.side_effect = Exception("Mock Exception")
@@ -215,3 +284,29 @@ def test_sync_local_diff_with_stage(mock_remove, other_directory):
             diff_result=diff,
             stage_path=stage_name,
         )
+
+
+@mock.patch(f"{STAGE_MANAGER}.use_role")
+@mock.patch(f"{STAGE_MANAGER}.put_many")
+@mock.patch(f"{STAGE_MANAGER}.remove_many")
+def test_sync_local_diff_with_stage_switches_role_once(
+    mock_remove, mock_put_many, mock_use_role, other_directory
+):
+    temp_dir = Path(other_directory)
+    diff: DiffResult = DiffResult()
+    diff.only_on_stage = ["a.txt", "b.txt"]
+    diff.only_local = ["c.txt", "d.txt"]
+    diff.different = ["e.txt"]
+
+    sync_local_diff_with_stage(
+        role="some_role",
+        deploy_root_path=temp_dir,
+        diff_result=diff,
+        stage_path="some_stage_name",
+    )
+
+    mock_use_role.assert_called_once_with("some_role")
+    assert mock_remove.call_count == 1
+    assert mock_put_many.call_count == 2
+    assert all(c.kwargs["role"] is None for c in mock_remove.mock_calls)
+    assert all(c.kwargs["role"] is None for c in mock_put_many.mock_calls)
@@ -70,6 +70,131 @@ def test_stage_copy_remote_to_local_quoted_stage(mock_execute, runner, mock_curs
     )
 
 
+@pytest.fixture
+def stage_connection(mock_ctx):
+    ctx = mock_ctx()
+    with mock.patch(
+        f"{STAGE_MANAGER}._conn", new_callable=mock.PropertyMock, return_value=ctx
+    ):
+        yield ctx
+
+
+def _put_many_query(source, destination: str) -> str:
+    return f"put file://{source} @{destination} auto_compress=false parallel=4 overwrite=True"
+
+
+def test_stage_put_many_uploads_whole_directory_with_wildcard(stage_connection):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir).resolve()
+        files = [tmp_dir_path / f"file{i}.txt" for i in range(5)]
+        for file in files:
+            file.touch()
+
+        StageManager().put_many(
+            [(file, "stageName/dir") for file in files], overwrite=True
+        )
+
+    assert stage_connection.get_queries() == [
+        _put_many_query(tmp_dir_path / "*", "stageName/dir")
+    ]
+
+
+def test_stage_put_many_links_part_of_directory(stage_connection):
+    uploaded = []
+
+    def _record_uploaded_files(query, **kwargs):
+        source = Path(query.split()[1][len("file://") :]).parent
+        uploaded.extend(sorted(p.name for p in source.iterdir()))
+        return (stage_connection.cs,)
+
+    stage_connection.execute_string = mock.Mock(side_effect=_record_uploaded_files)
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir).resolve()
+        files = [tmp_dir_path / f"file{i}.txt" for i in range(6)]
+        for file in files:
+            file.write_text(file.name)
+
+        StageManager().put_many([(file, "stageName") for file in files[:4]])
+
+    assert stage_connection.execute_string.call_count == 1
+    assert uploaded == ["file0.txt", "file1.txt", "file2.txt", "file3.txt"]
+
+
+@mock.patch("snowflake.cli.plugins.object.stage.manager.PUT_MAX_WORKERS", 1)
+def test_stage_put_many_uploads_small_groups_file_by_file(stage_connection):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir).resolve()
+        for name in ["a.py", "b.py", ".hidden", "c.py", "d.py", "e.py"]:
+            (tmp_dir_path / name).touch()
+
+        StageManager().put_many(
+            [
+                (tmp_dir_path / "a.py", "stageName"),
+                (tmp_dir_path / "b.py", "stageName/other"),
+                # hidden files are not matched by wildcards
+                (tmp_dir_path / ".hidden", "stageName"),
+                (tmp_dir_path / "c.py", "stageName"),
+                (tmp_dir_path / "d.py", "stageName"),
+            ],
+            overwrite=True,
+        )
+
+    assert stage_connection.get_queries() == [
+        _put_many_query(tmp_dir_path / "a.py", "stageName"),
+        _put_many_query(tmp_dir_path / "b.py", "stageName/other"),
+        _put_many_query(tmp_dir_path / ".hidden", "stageName"),
+        _put_many_query(tmp_dir_path / "c.py", "stageName"),
+        _put_many_query(tmp_dir_path / "d.py", "stageName"),
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.use_role")
+def test_stage_put_many_switches_role_once(mock_use_role, stage_connection):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir).resolve()
+        for name in ["a.py", "b.py"]:
+            (tmp_dir_path / name).touch()
+
+        StageManager().put_many(
+            [(tmp_dir_path / "a.py", "stageName"), (tmp_dir_path / "b.py", "other")],
+            role="new_role",
+        )
+
+    mock_use_role.assert_called_once_with("new_role")
+    assert len(stage_connection.get_queries()) == 2
+
+
+def test_stage_remove_many(stage_connection):
+    StageManager().remove_many(
+        "stageName", ["a.txt", "/dir/b (1).py", "x[1].sql"], role=None
+    )
+
+    assert stage_connection.get_queries() == [
+        r"remove @stageName pattern = '[^/]+/(a\\.txt|dir/b \\(1\\)\\.py|x\\[1\\]\\.sql)'"
+    ]
+
+
+@mock.patch("snowflake.cli.plugins.object.stage.manager.REMOVE_PATTERN_MAX_LENGTH", 30)
+def test_stage_remove_many_splits_long_patterns(stage_connection):
+    StageManager().remove_many("stageName", [f"file_{i}" for i in range(5)])
+
+    assert stage_connection.get_queries() == [
+        "remove @stageName pattern = '[^/]+/(file_0|file_1|file_2)'",
+        "remove @stageName pattern = '[^/]+/(file_3|file_4)'",
+    ]
+
+
+@mock.patch(f"{STAGE_MANAGER}.use_role")
+def test_stage_remove_many_switches_role_once(mock_use_role, stage_connection):
+    with mock.patch(
+        "snowflake.cli.plugins.object.stage.manager.REMOVE_PATTERN_MAX_LENGTH", 14
+    ):
+        StageManager().remove_many("stageName", ["a", "b", "c", "d", "e", "f"], "role")
+
+    mock_use_role.assert_called_once_with("role")
+    assert len(stage_connection.get_queries()) == 2
+
+
 @pytest.mark.parametrize(
     "raw_path,expected_uri",
     [
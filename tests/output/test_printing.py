@@ -1,8 +1,10 @@
 from datetime import datetime
 from textwrap import dedent
 from typing import NamedTuple
+from unittest import mock
 
 import pytest
+from click import ClickException
 from snowflake.cli.api.output.formats import OutputFormat
 from snowflake.cli.api.output.types import (
     CollectionResult,
@@ -302,6 +304,146 @@ def test_print_with_no_response_json(capsys):
     assert get_output(capsys) == "null"
 
 
+@mock.patch("snowflake.cli.app.printing.TABLE_PAGE_SIZE", 2)
+def test_print_table_in_pages(capsys):
+    output_data = CollectionResult({"key": f"value_{i}"} for i in range(3))
+
+    print_result(output_data, output_format=OutputFormat.TABLE)
+
+    assert get_output(capsys) == dedent(
+        """\
+    +---------+
+    | key     |
+    |---------|
+    | value_0 |
+    | value_1 |
+    +---------+
+    +---------+
+    | key     |
+    |---------|
+    | value_2 |
+    +---------+
+    """
+    )
+
+
+def test_print_multi_results_json_is_indented(capsys):
+    output_data = MultipleResults(
+        [
+            CollectionResult({"key": f"value_{i}"} for i in range(2)),
+            MessageResult("Command done"),
+        ]
+    )
+
+    print_result(output_data, output_format=OutputFormat.JSON)
+
+    assert get_output(capsys) == dedent(
+        """\
+    [
+      [
+        {
+          "key": "value_0"
+        },
+        {
+          "key": "value_1"
+        }
+      ],
+      {
+        "message": "Command done"
+      }
+    ]
+    """
+    )
+
+
+def test_print_collection_json_is_streamed(capsys):
+    def _rows():
+        yield {"key": "value_0"}
+        # previous row has to be written before next one is fetched
+        assert '"key": "value_0"' in get_output(capsys)
+        yield {"key": "value_1"}
+
+    print_result(CollectionResult(_rows()), output_format=OutputFormat.JSON)
+
+    assert get_output(capsys) == ',\n    {\n        "key": "value_1"\n    }\n]'
+
+
+def test_print_multi_results_csv(capsys, _create_mock_cursor):
+    output_data = MultipleResults(
+        [QueryResult(_create_mock_cursor()), MessageResult("Command done")]
+    )
+
+    print_result(output_data, output_format=OutputFormat.CSV)
+
+    assert get_output(capsys) == dedent(
+        """\
+    string,number,array,object,date
+    string,42,"[""array""]","{""k"": ""object""}",2022-03-21 00:00:00
+    string,43,"[""array""]","{""k"": ""object""}",2022-03-21 00:00:00
+
+    message
+    Command done
+    """
+    )
+
+
+def test_print_multi_results_ndjson(capsys, _create_mock_cursor):
+    output_data = MultipleResults(
+        [QueryResult(_create_mock_cursor()), MessageResult("Command done")]
+    )
+
+    print_result(output_data, output_format=OutputFormat.NDJSON)
+
+    assert get_output(capsys) == dedent(
+        """\
+    {"string": "string", "number": 42, "array": ["array"], "object": {"k": "object"}, "date": "2022-03-21T00:00:00"}
+    {"string": "string", "number": 43, "array": ["array"], "object": {"k": "object"}, "date": "2022-03-21T00:00:00"}
+    {"message": "Command done"}
+    """
+    )
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.ARROW, OutputFormat.PARQUET])
+def test_print_arrow_formats(capsysbinary, mock_cursor, output_format):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    cursor = mock_cursor(columns=["name", "number"], rows=[("a", 1), ("b", 2)])
+
+    print_result(QueryResult(cursor), output_format=output_format)
+
+    output = pyarrow.BufferReader(capsysbinary.readouterr().out)
+    if output_format == OutputFormat.ARROW:
+        table = pyarrow.ipc.open_stream(output).read_all()
+    else:
+        table = pyarrow.parquet.read_table(output)
+    assert table.to_pylist() == [
+        {"name": "a", "number": 1},
+        {"name": "b", "number": 2},
+    ]
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.ARROW, OutputFormat.PARQUET])
+def test_print_arrow_formats_to_terminal(mock_cursor, output_format):
+    pytest.importorskip("pyarrow")
+    cursor = mock_cursor(columns=["name"], rows=[("a",)])
+
+    with mock.patch("sys.stdout.isatty", return_value=True):
+        with pytest.raises(ClickException) as err:
+            print_result(QueryResult(cursor), output_format=output_format)
+
+    assert "cannot be written to a terminal" in err.value.message
+
+
+def test_print_arrow_without_pyarrow(capsys):
+    with mock.patch.dict("sys.modules", {"pyarrow": None}):
+        with pytest.raises(ClickException) as err:
+            print_result(MessageResult("Done"), output_format=OutputFormat.PARQUET)
+
+    assert "Output format PARQUET requires pyarrow" in err.value.message
+
+
 @pytest.fixture
 def _empty_cursor(mock_cursor):
     return lambda: mock_cursor(
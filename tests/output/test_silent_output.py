@@ -22,7 +22,12 @@ def test_silent_in_global_context(
 
 
 def test_silent_output_help(runner):
-    result = runner.invoke(["streamlit", "get-url", "--help"], catch_exceptions=False)
+    # wide enough to print descriptions of options in single lines
+    result = runner.invoke(
+        ["streamlit", "get-url", "--help"],
+        catch_exceptions=False,
+        env={"COLUMNS": "120"},
+    )
 
     assert result.exit_code == 0, result.output
     expected_message = "Turns off intermediate output to console"
@@ -0,0 +1,207 @@
+import os
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from click import ClickException
+from snowflake.cli.api.cli_global_context import cli_context_manager
+from snowflake.cli.plugins.server.client import forward_command, send_message
+from snowflake.cli.plugins.server.manager import (
+    ServerManager,
+    WarmCommandExecutor,
+    WarmCommandServer,
+    _prepare_private_directory,
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 characters
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmp_dir:
+        yield Path(tmp_dir) / "snowcli.sock"
+
+
+@pytest.fixture
+def executor():
+    warm_executor = WarmCommandExecutor()
+    yield warm_executor
+    warm_executor.close()
+
+
+@pytest.fixture
+def running_server(socket_path, executor):
+    server = WarmCommandServer(socket_path, executor)
+    thread = threading.Thread(target=server.serve_until_stopped, daemon=True)
+    thread.start()
+    yield server
+    if not server.stop_requested:
+        ServerManager(socket_path).stop()
+    thread.join(timeout=5)
+    server.server_close()
+
+
+def _pooled_connection(mock_cursor):
+    connection = mock.MagicMock()
+    connection.is_closed.return_value = False
+    connection.execute_stream.side_effect = lambda *_, **__: iter(
+        [mock_cursor(rows=[(1,)], columns=["1"])]
+    )
+    context_query = connection.cursor.return_value.execute.return_value
+    context_query.fetchone.return_value = ("ROLE", "WH", "DB", "SCHEMA")
+    return connection
+
+
+def _execute(executor, args, test_snowcli_config, stdin=None):
+    return executor.execute(
+        args=["--config-file", str(test_snowcli_config), *args],
+        cwd=os.getcwd(),
+        env=dict(os.environ),
+        stdin=stdin,
+    )
+
+
+def test_executor_runs_command(executor, test_snowcli_config):
+    result = _execute(executor, ["connection", "list"], test_snowcli_config)
+
+    assert result["exit_code"] == 0
+    assert "dev_account" in result["stdout"]
+
+
+def test_executor_returns_usage_error_exit_code(executor, test_snowcli_config):
+    result = _execute(executor, ["sql"], test_snowcli_config)
+
+    assert result["exit_code"] == 2
+    assert "Use either query, filename or input option" in result["stderr"]
+
+
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_executor_reuses_connections(
+    mock_connect, executor, test_snowcli_config, mock_cursor
+):
+    connection = _pooled_connection(mock_cursor)
+    mock_connect.return_value = connection
+
+    for _ in range(3):
+        result = _execute(executor, ["sql", "-q", "select 1"], test_snowcli_config)
+        assert result["exit_code"] == 0, result
+    _execute(executor, ["sql", "-q", "select 1", "-c", "full"], test_snowcli_config)
+
+    assert mock_connect.call_count == 2
+    assert cli_context_manager.connection_context._persistent_connections  # noqa
+    connection.close.assert_not_called()
+
+
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_executor_restores_context_of_reused_connections(
+    mock_connect, executor, test_snowcli_config, mock_cursor
+):
+    connection = _pooled_connection(mock_cursor)
+    context_query = connection.cursor.return_value.execute.return_value
+    context_query.fetchone.side_effect = [
+        ("ROLE", "WH", "DB", "SCHEMA"),
+        ("OTHER_ROLE", "WH", "DB", "SCHEMA"),
+    ]
+    mock_connect.return_value = connection
+
+    for _ in range(2):
+        result = _execute(executor, ["sql", "-q", "select 1"], test_snowcli_config)
+        assert result["exit_code"] == 0, result
+
+    assert mock_connect.call_count == 1
+    connection.cursor.return_value.execute.assert_called_with('use role "ROLE"')
+
+
+@mock.patch("snowflake.cli.app.snow_connector.connect_to_snowflake")
+def test_executor_replaces_connections_with_unrestorable_context(
+    mock_connect, executor, test_snowcli_config, mock_cursor
+):
+    connection = _pooled_connection(mock_cursor)
+    context_query = connection.cursor.return_value.execute.return_value
+    context_query.fetchone.side_effect = [
+        ("ROLE", "WH", None, None),
+        ("ROLE", "WH", "DB", "SCHEMA"),
+        ("ROLE", "WH", None, None),
+    ]
+    mock_connect.return_value = connection
+
+    for _ in range(2):
+        result = _execute(executor, ["sql", "-q", "select 1"], test_snowcli_config)
+        assert result["exit_code"] == 0, result
+
+    assert mock_connect.call_count == 2
+    connection.close.assert_called_once()
+
+
+def test_executor_forwards_stdin(executor, test_snowcli_config):
+    with mock.patch(
+        "snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_string"
+    ) as mock_execute:
+        mock_execute.return_value = iter(())
+        _execute(executor, ["sql", "-i"], test_snowcli_config, stdin="select 42")
+
+    mock_execute.assert_called_once_with("select 42")
+
+
+def test_client_forwards_command_to_server(
+    running_server, socket_path, test_snowcli_config, capsys
+):
+    assert ServerManager(socket_path).is_running()
+
+    exit_code = forward_command(
+        socket_path, ["--config-file", str(test_snowcli_config), "connection", "list"]
+    )
+
+    assert exit_code == 0
+    assert "dev_account" in capsys.readouterr().out
+
+
+def test_client_returns_none_if_server_is_not_running(socket_path):
+    assert forward_command(socket_path, ["connection", "list"]) is None
+
+
+def test_server_stop(running_server, socket_path):
+    ServerManager(socket_path).stop()
+
+    assert running_server.stop_requested
+
+
+def test_status_of_not_running_server(runner, socket_path):
+    result = runner.invoke(["server", "status", "--socket", str(socket_path)])
+
+    assert result.exit_code == 1
+    assert "Snowflake CLI server is not running" in result.output
+
+
+def test_server_socket_is_accessible_only_by_owner(running_server, socket_path):
+    assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+
+def test_server_rejects_requests_of_other_users(running_server, socket_path):
+    with mock.patch(
+        "snowflake.cli.plugins.server.manager._peer_uid", return_value=os.getuid() + 1
+    ):
+        with pytest.raises((ValueError, ConnectionError)):
+            send_message(socket_path, {"type": "status"})
+
+    assert ServerManager(socket_path).is_running()
+
+
+def test_client_does_not_forward_to_server_of_other_user(running_server, socket_path):
+    with mock.patch(
+        "snowflake.cli.plugins.server.client.is_owned_by_current_user",
+        return_value=False,
+    ):
+        assert forward_command(socket_path, ["connection", "list"]) is None
+
+
+def test_private_directory_must_not_be_accessible_by_others(tmp_path):
+    directory = tmp_path / "server"
+    _prepare_private_directory(directory)
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+    directory.chmod(0o755)
+    with pytest.raises(ClickException):
+        _prepare_private_directory(directory)
@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+from click import ClickException
+from requests import HTTPError
+from snowflake.cli.plugins.snowpark.models import Requirement
+from snowflake.cli.plugins.snowpark.package.anaconda import AnacondaChannel
+
+CHANNEL_DATA = {"packages": {"pandas": {"version": "2.1.4", "subdirs": ["noarch"]}}}
+ETAG = '"channeldata-1"'
+
+
+@pytest.fixture
+def channel_failures():
+    """Failures the channel server responds with to following requests, in order."""
+    return []
+
+
+@pytest.fixture
+def channel_server(channel_failures):
+    """Serves channel data with an ETag, answering matching revalidations with 304."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            requests.append(dict(self.headers))
+            failure = channel_failures.pop(0) if channel_failures else None
+            if failure == "timeout":
+                time.sleep(0.5)
+            elif isinstance(failure, bytes):
+                # malformed channel data
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(failure)))
+                self.end_headers()
+                self.wfile.write(failure)
+                return
+            elif failure is not None:
+                self.send_response(failure)
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == ETAG:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps(CHANNEL_DATA).encode()
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/channeldata.json"
+    with mock.patch.object(AnacondaChannel, "snowflake_channel_url", url):
+        yield requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_channel_data_is_cached(channel_server):
+    first = AnacondaChannel.from_snowflake()
+    second = AnacondaChannel.from_snowflake()
+
+    assert len(channel_server) == 1
+    assert second.package_version(Requirement.parse("pandas")) == "2.1.4"
+    assert first.snapshot_digest() == second.snapshot_digest()
+
+
+def test_stale_channel_data_is_revalidated(channel_server):
+    AnacondaChannel.from_snowflake()
+
+    with mock.patch(
+        "snowflake.cli.plugins.snowpark.package.anaconda.CHANNEL_CACHE_TTL_SECONDS", 0
+    ):
+        anaconda = AnacondaChannel.from_snowflake()
+
+    assert len(channel_server) == 2
+    assert channel_server[1]["If-None-Match"] == ETAG
+    assert anaconda.is_package_available(Requirement.parse("pandas>=2"))
+
+
+@pytest.mark.parametrize(
+    "failure", [503, "timeout", b"{}", b"not json", b'{"packages": []}']
+)
+@mock.patch(
+    "snowflake.cli.plugins.snowpark.package.anaconda.CHANNEL_CACHE_TTL_SECONDS", 0
+)
+@mock.patch(
+    "snowflake.cli.plugins.snowpark.package.anaconda.CHANNEL_REQUEST_TIMEOUT_SECONDS",
+    0.1,
+)
+def test_stale_channel_data_is_used_if_channel_fails(
+    channel_server, channel_failures, failure
+):
+    AnacondaChannel.from_snowflake()
+    channel_failures.append(failure)
+
+    anaconda = AnacondaChannel.from_snowflake()
+
+    assert len(channel_server) == 2
+    assert anaconda.is_package_available(Requirement.parse("pandas"))
+
+
+def test_channel_failure_is_raised_without_cached_data(
+    channel_server, channel_failures
+):
+    channel_failures.append(503)
+
+    with pytest.raises(HTTPError):
+        AnacondaChannel.from_snowflake()
+
+
+def test_offline_mode_uses_cached_channel_data(channel_server):
+    AnacondaChannel.from_snowflake()
+
+    with mock.patch(
+        "snowflake.cli.plugins.snowpark.package.anaconda.CHANNEL_CACHE_TTL_SECONDS", 0
+    ):
+        anaconda = AnacondaChannel.from_snowflake(offline=True)
+
+    assert len(channel_server) == 1
+    assert anaconda.is_package_available(Requirement.parse("pandas"))
+
+
+def test_offline_mode_requires_cached_channel_data(channel_server):
+    with pytest.raises(ClickException, match="not cached yet"):
+        AnacondaChannel.from_snowflake(offline=True)
+
+    assert channel_server == []
+
+
+@pytest.mark.parametrize(
+    "requirement, expected",
+    [
+        ("pandas", True),
+        ("Pandas", True),
+        ("snowflake_connector.python", True),
+        ("pandas==2.1.4", True),
+        ("pandas==1.5.3", True),
+        ("pandas==2.1.*", True),
+        ("pandas==2.2.0", False),
+        ("pandas>=2.0,<3", True),
+        ("pandas<2.2", True),
+        ("pandas<2.0", True),
+        ("pandas>2.1.4", False),
+        ("pandas~=2.1", True),
+        ("pandas~=2.2", False),
+        ("pandas!=2.1.4", True),
+        ("unknown-package", False),
+    ],
+)
+def test_is_package_available(requirement, expected):
+    anaconda = AnacondaChannel(
+        packages={
+            "pandas": {"version": "2.1.4"},
+            "snowflake-connector-python": {"version": "3.7.0"},
+        }
+    )
+
+    assert anaconda.is_package_available(Requirement.parse(requirement)) is expected
@@ -3,9 +3,26 @@ from pathlib import Path
 from textwrap import dedent
 from unittest import mock
 
+import pytest
 from snowflake.connector import ProgrammingError
 
 
+@pytest.fixture(autouse=True)
+def sequential_deploy():
+    # objects are deployed concurrently, which makes order of queries nondeterministic
+    with mock.patch("snowflake.cli.plugins.snowpark.commands.DEPLOY_MAX_WORKERS", 1):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def empty_artifact_stage(mock_cursor):
+    with mock.patch(
+        "snowflake.cli.plugins.snowpark.commands.StageManager.list_files",
+        return_value=mock_cursor([], ["name", "size", "md5", "last_modified"]),
+    ) as mock_list_files:
+        yield mock_list_files
+
+
 @mock.patch("snowflake.connector.connect")
 @mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager")
 def test_deploy_function(
@@ -34,6 +51,7 @@ def test_deploy_function(
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project"
         f" auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
         dedent(
             """\
             create or replace function MOCKDATABASE.MOCKSCHEMA.FUNC1(a string default 'default value', b variant)
@@ -81,6 +99,7 @@ def test_deploy_function_with_external_access(
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project"
         f" auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
         dedent(
             """\
             create or replace function MOCKDATABASE.MOCKSCHEMA.FUNC1(a string, b variant)
@@ -162,6 +181,7 @@ def test_deploy_function_no_changes(
     assert queries == [
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
     ]
 
 
@@ -200,6 +220,7 @@ def test_deploy_function_needs_update_because_packages_changes(
     assert queries == [
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
         dedent(
             """\
             create or replace function MOCKDATABASE.MOCKSCHEMA.FUNC1(a string default 'default value', b variant)
@@ -250,6 +271,7 @@ def test_deploy_function_needs_update_because_handler_changes(
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project"
         f" auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
         dedent(
             """\
             create or replace function MOCKDATABASE.MOCKSCHEMA.FUNC1(a string default 'default value', b variant)
@@ -340,6 +362,7 @@ def _deploy_function(
         "snowflake.cli.plugins.snowpark.commands.ObjectManager.show"
     ) as om_show:
         om_describe.return_value = rows
+        om_show.return_value = [{"name": "FUNC1"}]
 
         with project_directory("snowpark_functions") as temp_dir:
             (Path(temp_dir) / "requirements.snowflake.txt").write_text(
@@ -1,11 +1,41 @@
 import json
+import re
 from pathlib import Path
 from textwrap import dedent
 from unittest import mock
 from unittest.mock import call
 
+import pytest
 from snowflake.cli.api.constants import ObjectType
-from snowflake.connector import ProgrammingError
+from snowflake.cli.plugins.object.stage.diff import compute_md5sum
+from snowflake.connector import DictCursor, ProgrammingError
+
+
+@pytest.fixture(autouse=True)
+def sequential_deploy():
+    # objects are deployed concurrently, which makes order of queries nondeterministic
+    with mock.patch("snowflake.cli.plugins.snowpark.commands.DEPLOY_MAX_WORKERS", 1):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def empty_artifact_stage(mock_cursor):
+    with mock.patch(
+        "snowflake.cli.plugins.snowpark.commands.StageManager.list_files",
+        return_value=mock_cursor([], ["name", "size", "md5", "last_modified"]),
+    ) as mock_list_files:
+        yield mock_list_files
+
+
+def _show_objects(*names, integrations=()):
+    """Side effect of mocked ObjectManager.show listing given objects in a schema."""
+
+    def show(object_type, **kwargs):
+        if object_type == "integration":
+            return list(integrations)
+        return [{"name": name} for name in names]
+
+    return show
 
 
 def test_deploy_function_no_procedure(runner, project_directory):
@@ -54,6 +84,7 @@ def test_deploy_procedure(
     assert ctx.get_queries() == [
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(tmp).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
         dedent(
             """\
             create or replace procedure MOCKDATABASE.MOCKSCHEMA.PROCEDURENAME(name string)
@@ -91,10 +122,13 @@ def test_deploy_procedure_with_external_access(
     project_directory,
 ):
     mock_om_describe.side_effect = ProgrammingError("does not exist or not authorized")
-    mock_om_show.return_value = [
-        {"name": "external_1", "type": "EXTERNAL_ACCESS"},
-        {"name": "external_2", "type": "EXTERNAL_ACCESS"},
-    ]
+    mock_om_show.side_effect = _show_objects(
+        "PROCEDURENAME",
+        integrations=[
+            {"name": "external_1", "type": "EXTERNAL_ACCESS"},
+            {"name": "external_2", "type": "EXTERNAL_ACCESS"},
+        ],
+    )
 
     ctx = mock_ctx()
     mock_conn.return_value = ctx
@@ -120,6 +154,7 @@ def test_deploy_procedure_with_external_access(
         "create stage if not exists MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT comment='deployments managed by Snowflake CLI'",
         f"put file://{Path(project_dir).resolve()}/app.zip @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT/my_snowpark_project"
         f" auto_compress=false parallel=4 overwrite=True",
+        mock.ANY,  # marker with md5 of the artifact
         dedent(
             """\
             create or replace procedure MOCKDATABASE.MOCKSCHEMA.PROCEDURENAME(name string)
@@ -218,6 +253,7 @@ def test_deploy_procedure_fails_if_object_exists_and_no_replace(
     project_directory,
     snapshot,
 ):
+    mock_om_show.side_effect = _show_objects("PROCEDURENAME", "TEST")
     mock_om_describe.return_value = mock_cursor(
         [
             ("packages", "[]"),
@@ -248,6 +284,7 @@ def test_deploy_procedure_replace_nothing_to_update(
     mock_ctx,
     project_directory,
 ):
+    mock_om_show.side_effect = _show_objects("PROCEDURENAME", "TEST")
     mock_om_describe.side_effect = [
         mock_cursor(
             [
@@ -301,6 +338,7 @@ def test_deploy_procedure_replace_updates_single_object(
     mock_ctx,
     project_directory,
 ):
+    mock_om_show.side_effect = _show_objects("PROCEDURENAME", "TEST")
     mock_om_describe.side_effect = [
         mock_cursor(
             [
@@ -354,6 +392,7 @@ def test_deploy_procedure_replace_creates_missing_object(
     mock_ctx,
     project_directory,
 ):
+    mock_om_show.side_effect = _show_objects("PROCEDURENAME", "TEST")
     mock_om_describe.side_effect = [
         mock_cursor(
             [
@@ -429,6 +468,156 @@ def test_deploy_procedure_fully_qualified_name(
         assert result.output == snapshot(name="ok")
 
 
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
+def test_deploy_procedure_describes_only_listed_objects(
+    mock_om_show,
+    mock_om_describe,
+    mock_conn,
+    runner,
+    mock_ctx,
+    project_directory,
+    alter_snowflake_yml,
+):
+    mock_om_show.side_effect = _show_objects("FQN_PROCEDURE", "SCHEMA_PROCEDURE")
+    mock_om_describe.side_effect = ProgrammingError("does not exist or not authorized")
+    mock_conn.return_value = mock_ctx()
+
+    with project_directory("snowpark_procedure_fully_qualified_name") as tmp_dir:
+        alter_snowflake_yml(
+            tmp_dir / "snowflake.yml",
+            parameter_path="snowpark.procedures.5.name",
+            value="fqn_procedure3",
+        )
+        result = runner.invoke(["snowpark", "deploy"])
+
+    assert result.exit_code == 0, result.output
+    assert mock_om_show.mock_calls == [
+        call(object_type="procedure", scope=("schema", schema), cursor_class=DictCursor)
+        for schema in [
+            "CUSTOM_DB.CUSTOM_SCHEMA",
+            "MOCKDATABASE.CUSTOM_SCHEMA",
+            "CUSTOM_DB.MOCKSCHEMA",
+            "CUSTOM_DATABASE.CUSTOM_SCHEMA",
+        ]
+    ]
+    assert mock_om_describe.mock_calls == [
+        call(
+            object_type="procedure",
+            name="CUSTOM_DB.CUSTOM_SCHEMA.FQN_PROCEDURE(string)",
+        ),
+        call(
+            object_type="procedure",
+            name="MOCKDATABASE.CUSTOM_SCHEMA.SCHEMA_PROCEDURE(string)",
+        ),
+    ]
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
+@pytest.mark.parametrize(
+    "stage_md5, marker_modified",
+    [("md5", None), ("multipart-md5", "Tue, 5 Sep 2023 18:00:00 GMT")],
+)
+def test_deploy_procedure_skips_upload_of_unchanged_artifact(
+    mock_om_show,
+    mock_om_describe,
+    mock_conn,
+    stage_md5,
+    marker_modified,
+    runner,
+    mock_ctx,
+    mock_cursor,
+    project_directory,
+    empty_artifact_stage,
+):
+    mock_om_describe.side_effect = ProgrammingError("does not exist or not authorized")
+    ctx = mock_ctx()
+    mock_conn.return_value = ctx
+
+    with project_directory("snowpark_procedures") as tmp:
+        md5 = compute_md5sum(Path(tmp) / "app.zip")
+        stage_files = [
+            (
+                "dev_deployment/my_snowpark_project/app.zip",
+                1,
+                md5 if stage_md5 == "md5" else stage_md5,
+                "Tue, 5 Sep 2023 17:59:21 GMT",
+            )
+        ]
+        if marker_modified:
+            stage_files.append(
+                (
+                    f"dev_deployment/my_snowpark_project/app.zip.{md5}.md5",
+                    0,
+                    "d41d8cd98f00b204e9800998ecf8427e",
+                    marker_modified,
+                )
+            )
+        empty_artifact_stage.return_value = mock_cursor(
+            stage_files, ["name", "size", "md5", "last_modified"]
+        )
+        result = runner.invoke(["snowpark", "deploy"])
+
+    assert result.exit_code == 0, result.output
+    assert not [query for query in ctx.get_queries() if query.startswith("put")]
+
+
+@mock.patch("snowflake.connector.connect")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.describe")
+@mock.patch("snowflake.cli.plugins.snowpark.commands.ObjectManager.show")
+def test_deploy_procedure_replaces_outdated_artifact_marker(
+    mock_om_show,
+    mock_om_describe,
+    mock_conn,
+    runner,
+    mock_ctx,
+    mock_cursor,
+    project_directory,
+    empty_artifact_stage,
+):
+    mock_om_describe.side_effect = ProgrammingError("does not exist or not authorized")
+    ctx = mock_ctx()
+    mock_conn.return_value = ctx
+
+    with project_directory("snowpark_procedures") as tmp:
+        md5 = compute_md5sum(Path(tmp) / "app.zip")
+        # the artifact was uploaded again after the marker was put
+        empty_artifact_stage.return_value = mock_cursor(
+            [
+                (
+                    "dev_deployment/my_snowpark_project/app.zip",
+                    1,
+                    "multipart-md5",
+                    "Tue, 5 Sep 2023 18:00:00 GMT",
+                ),
+                (
+                    f"dev_deployment/my_snowpark_project/app.zip.{md5}.md5",
+                    0,
+                    "d41d8cd98f00b204e9800998ecf8427e",
+                    "Tue, 5 Sep 2023 17:59:21 GMT",
+                ),
+            ],
+            ["name", "size", "md5", "last_modified"],
+        )
+        result = runner.invoke(["snowpark", "deploy"])
+
+    assert result.exit_code == 0, result.output
+    queries = ctx.get_queries()
+    assert queries[1].startswith(f"put file://{Path(tmp).resolve()}/app.zip @")
+    assert queries[2] == (
+        "remove @MOCKDATABASE.MOCKSCHEMA.DEV_DEPLOYMENT pattern = "
+        f"'[^/]+/(my_snowpark_project/app\\\\.zip\\\\.{md5}\\\\.md5)'"
+    )
+    assert re.fullmatch(
+        rf"put file://\S+/app\.zip\.{md5}\.md5 "
+        r"@MOCKDATABASE\.MOCKSCHEMA\.DEV_DEPLOYMENT/my_snowpark_project .*",
+        queries[3],
+    )
+
+
 @mock.patch("snowflake.connector.connect")
 def test_execute_procedure(mock_connector, runner, mock_ctx):
     ctx = mock_ctx()
@@ -4,7 +4,13 @@ from unittest import mock
 from zipfile import ZipFile
 
 import snowflake.cli.plugins.snowpark.snowpark_shared as shared
-from snowflake.cli.plugins.snowpark.models import Requirement, SplitRequirements
+from snowflake.cli.plugins.snowpark.build_cache import BuildCache
+from snowflake.cli.plugins.snowpark.models import (
+    PypiOption,
+    Requirement,
+    SplitRequirements,
+)
+from snowflake.cli.plugins.snowpark.package.anaconda import AnacondaChannel
 
 
 @mock.patch(
@@ -35,3 +41,67 @@ def test_snowpark_package(
         "app.py",
         os.path.join("totally-awesome-package", "totally-awesome-module.py"),
     ]
+
+
+@mock.patch(
+    "snowflake.cli.plugins.snowpark.package.anaconda.AnacondaChannel.from_snowflake"
+)
+@mock.patch("snowflake.cli.plugins.snowpark.package_utils.install_packages")
+def test_snowpark_package_reuses_build_cache(
+    mock_install,
+    mock_anaconda,
+    temp_dir,
+    correct_requirements_txt,
+    dot_packages_directory,
+):
+    mock_anaconda.return_value = AnacondaChannel({})
+    mock_install.return_value = (True, SplitRequirements([], []))
+    app_root = Path("app")
+    app_root.mkdir()
+    app_root.joinpath("app.py").write_text("print(1)")
+
+    def _build():
+        shared.snowpark_package(
+            app_root,
+            Path("app.zip"),
+            PypiOption.YES,
+            False,
+            PypiOption.NO,
+            build_cache=BuildCache(),
+        )
+        return Path("app.zip").read_bytes()
+
+    first_build = _build()
+    assert _build() == first_build
+    assert mock_install.call_count == 1
+
+    # only sources changed, so requirements are not resolved again
+    app_root.joinpath("app.py").write_text("print(2)")
+    _build()
+    assert mock_install.call_count == 1
+    with ZipFile("app.zip") as artifact:
+        assert artifact.read("app.py") == b"print(2)"
+        assert "totally-awesome-package/totally-awesome-module.py" in (
+            artifact.namelist()
+        )
+
+    Path("requirements.txt").write_text("another-package\n")
+    _build()
+    assert mock_install.call_count == 2
+
+
+@mock.patch("snowflake.cli.plugins.snowpark.package_utils.install_packages")
+def test_snowpark_package_cached_artifact_matches_uncached_build(
+    mock_install, temp_dir, dot_packages_directory
+):
+    app_root = Path("app")
+    app_root.mkdir()
+    app_root.joinpath("app.py").write_text("print(1)")
+
+    shared.snowpark_package(
+        app_root, Path("cached.zip"), "no", False, "no", build_cache=BuildCache()
+    )
+    shared.snowpark_package(app_root, Path("uncached.zip"), "no", False, "no")
+
+    assert Path("cached.zip").read_bytes() == Path("uncached.zip").read_bytes()
+    mock_install.assert_not_called()
@@ -0,0 +1,192 @@
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from snowflake.cli.plugins.snowpark.venv import (
+    VENV_POOL_TTL_SECONDS,
+    Venv,
+    venv_pool_key,
+)
+
+
+def _install_fake_distribution(site_packages: Path, name: str, requires=()):
+    module = name.lower().replace("-", "_")
+    dist_info = site_packages / f"{module}-1.0.dist-info"
+    dist_info.mkdir()
+    (site_packages / f"{module}.py").write_text("")
+    (dist_info / "METADATA").write_text(
+        "\n".join(
+            ["Metadata-Version: 2.1", f"Name: {name}", "Version: 1.0"]
+            + [f"Requires-Dist: {requirement}" for requirement in requires]
+        )
+    )
+    (dist_info / "RECORD").write_text(
+        f"{module}.py,,\n{dist_info.name}/METADATA,,\n{dist_info.name}/RECORD,,\n"
+    )
+
+
+def test_get_package_dependencies_runs_interpreter_once(temp_dir):
+    Path("requirements.txt").write_text("Top-Package\n")
+
+    with Venv(with_pip=False) as venv:
+        site_packages = venv._get_library_path()  # noqa: SLF001
+        _install_fake_distribution(site_packages, "top-package", ["middle_package"])
+        _install_fake_distribution(site_packages, "Middle.Package", ["leaf>=1"])
+        _install_fake_distribution(site_packages, "leaf")
+
+        with mock.patch.object(
+            Venv, "run_python", side_effect=venv.run_python
+        ) as run_python:
+            dependencies = venv.get_package_dependencies("requirements.txt")
+
+        assert run_python.call_count == 1
+        assert [dep.requirement.name for dep in dependencies] == [
+            "Top-Package",
+            "middle_package",
+            "leaf",
+        ]
+        assert dependencies[0].dependencies == ["middle_package"]
+        assert dependencies[2].files == [
+            str(site_packages / "leaf.py"),
+            str(site_packages / "leaf-1.0.dist-info" / "METADATA"),
+            str(site_packages / "leaf-1.0.dist-info" / "RECORD"),
+        ]
+
+
+def _pip_install(venv: Venv, returncode: int) -> int:
+    with mock.patch.object(
+        venv, "run_python", return_value=mock.Mock(returncode=returncode)
+    ) as run_python:
+        result = venv.pip_install("requirements.txt")
+    return result if run_python.called else -1
+
+
+def test_prepared_venv_is_reused_from_pool(temp_dir):
+    with Venv(with_pip=False, pool_key="key") as venv:
+        assert not venv.prepared
+        assert _pip_install(venv, returncode=0) == 0
+
+    with Venv(with_pip=False, pool_key="key") as venv:
+        assert venv.prepared
+        # requirements are installed already, so pip is not run
+        assert _pip_install(venv, returncode=0) == -1
+        assert venv.pip_install("requirements.txt") == 0
+        assert venv._get_library_path().is_dir()  # noqa: SLF001
+
+    with Venv(with_pip=False, pool_key="other-key") as venv:
+        assert not venv.prepared
+
+
+def test_venv_is_not_pooled_when_installation_fails(temp_dir):
+    with Venv(with_pip=False, pool_key="key") as venv:
+        assert _pip_install(venv, returncode=1) == 1
+        staging = venv.path
+
+    assert not staging.exists()
+    with Venv(with_pip=False, pool_key="key") as venv:
+        assert not venv.prepared
+
+
+@mock.patch("snowflake.cli.plugins.snowpark.venv.VENV_POOL_MAX_ENTRIES", 1)
+def test_least_recently_used_venvs_are_removed_from_pool(temp_dir):
+    for key in ["first", "second"]:
+        with Venv(with_pip=False, pool_key=key) as venv:
+            _pip_install(venv, returncode=0)
+
+    assert not Venv(with_pip=False, pool_key="first").prepared
+    assert Venv(with_pip=False, pool_key="second").prepared
+
+
+def _expire(pooled: Path) -> None:
+    prepared_at = time.time() - VENV_POOL_TTL_SECONDS - 1
+    os.utime(pooled / ".prepared", (prepared_at, prepared_at))
+
+
+def _pooled_entries():
+    pool_directory = Venv(with_pip=False, pool_key="key").path.parent
+    return sorted(
+        path.name for path in pool_directory.iterdir() if not path.name.startswith(".")
+    )
+
+
+def test_expired_venvs_are_prepared_again(temp_dir):
+    with Venv(with_pip=False, pool_key="key") as venv:
+        _pip_install(venv, returncode=0)
+
+    _expire(Venv(with_pip=False, pool_key="key").path)
+
+    with Venv(with_pip=False, pool_key="key") as venv:
+        assert not venv.prepared
+        assert _pip_install(venv, returncode=0) == 0
+
+    assert Venv(with_pip=False, pool_key="key").prepared
+    assert len(_pooled_entries()) == 1
+
+
+def test_venv_pool_key_depends_on_referenced_files_and_pip_config(temp_dir):
+    Path("constraints.txt").write_text("requests==2.31.0\n")
+    Path("pip.conf").write_text("[global]\nindex-url = https://first\n")
+    requirements = "requests\n-c constraints.txt  # pinned\n"
+
+    with mock.patch.dict(os.environ, {"PIP_CONFIG_FILE": "pip.conf"}):
+        key = venv_pool_key(requirements)
+        assert venv_pool_key(requirements) == key
+
+        Path("constraints.txt").write_text("requests==2.32.0\n")
+        assert venv_pool_key(requirements) != key
+        key = venv_pool_key(requirements)
+
+        Path("pip.conf").write_text("[global]\nindex-url = https://second\n")
+        assert venv_pool_key(requirements) != key
+
+
+@pytest.mark.parametrize(
+    "requirements",
+    [
+        "./my_package",
+        "-e .",
+        "my_package @ file:///tmp/my_package",
+        "dist/my_package-1.0-py3-none-any.whl",
+        "-r missing.txt",
+    ],
+)
+def test_venvs_with_local_requirements_are_not_pooled(temp_dir, requirements):
+    assert venv_pool_key(f"requests\n{requirements}\n") is None
+
+
+def test_venvs_in_use_are_kept_in_pool(temp_dir):
+    with Venv(with_pip=False, pool_key="key") as venv:
+        _pip_install(venv, returncode=0)
+
+    with Venv(with_pip=False, pool_key="key") as used:
+        assert used.prepared
+        _expire(used.path)
+        with Venv(with_pip=False, pool_key="key") as venv:
+            assert not venv.prepared
+            _pip_install(venv, returncode=0)
+
+        # the expired environment is replaced, but not removed while in use
+        assert used.path.is_dir()
+        assert Venv(with_pip=False, pool_key="key").path != used.path
+
+    with Venv(with_pip=False, pool_key="other-key") as venv:
+        _pip_install(venv, returncode=0)
+
+    assert _pooled_entries() == sorted(
+        Venv(with_pip=False, pool_key=key).path.name for key in ["key", "other-key"]
+    )
+
+
+def test_venv_removed_from_pool_concurrently_is_prepared_again(temp_dir):
+    with Venv(with_pip=False, pool_key="key") as venv:
+        _pip_install(venv, returncode=0)
+
+    venv = Venv(with_pip=False, pool_key="key")
+    assert venv.prepared
+    (venv.path / ".prepared").unlink()
+
+    with venv:
+        assert not venv.prepared
+        assert _pip_install(venv, returncode=0) == 0
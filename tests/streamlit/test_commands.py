@@ -9,6 +9,13 @@ STREAMLIT_NAME = "test_streamlit"
 TEST_WAREHOUSE = "test_warehouse"
 
 
+@pytest.fixture(autouse=True)
+def sequential_uploads():
+    # files are uploaded concurrently, which makes order of queries nondeterministic
+    with mock.patch("snowflake.cli.plugins.object.stage.manager.PUT_MAX_WORKERS", 1):
+        yield
+
+
 @mock.patch("snowflake.connector.connect")
 def test_list_streamlit(mock_connector, runner, mock_ctx):
     ctx = mock_ctx()
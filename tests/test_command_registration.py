@@ -1,14 +1,25 @@
 from unittest import mock
 
+import click
+import pytest
 from snowflake.cli.api.plugins.command import (
     SNOWCLI_ROOT_COMMAND_PATH,
     CommandPath,
     CommandSpec,
     CommandType,
 )
+from snowflake.cli.app.cli_app import app_factory
+from snowflake.cli.app.commands_registration.builtin_plugins import (
+    get_builtin_plugin_spec,
+)
+from snowflake.cli.app.commands_registration.commands_manifest import (
+    RAW_ARGS_CONTEXT_META_KEY,
+    find_invoked_top_level_command_name,
+)
 from snowflake.cli.plugins.connection import plugin_spec as connection_plugin_spec
 from snowflake.cli.plugins.streamlit import plugin_spec as streamlit_plugin_spec
 from typer import Typer
+from typer.main import get_command
 
 
 def test_builtin_plugins_registration(runner):
@@ -194,3 +205,68 @@ def test_broken_external_entrypoint_handling(
     assert result.exit_code == 0
     assert result.output.count("Manages connections to Snowflake") == 1
     assert result.output.count("Manages a Streamlit app in Snowflake") == 1
+
+
+def test_builtin_commands_manifest_is_up_to_date():
+    from snowflake.cli.app.commands_registration.commands_manifest import (
+        BUILTIN_COMMANDS_MANIFEST_PATH,
+    )
+    from snowflake.cli.app.dev.commands_manifest import (
+        dump_builtin_commands_manifest,
+        generate_builtin_commands_manifest,
+    )
+
+    assert BUILTIN_COMMANDS_MANIFEST_PATH.read_text() == dump_builtin_commands_manifest(
+        generate_builtin_commands_manifest()
+    ), "Run 'python -m snowflake.cli.app.dev.commands_manifest' to update manifest"
+
+
+@mock.patch(
+    "snowflake.cli.app.commands_registration.command_plugins_loader.get_builtin_plugin_name_to_plugin_spec"
+)
+@mock.patch(
+    "snowflake.cli.app.commands_registration.command_plugins_loader.get_builtin_plugin_spec",
+    wraps=get_builtin_plugin_spec,
+)
+def test_only_plugin_providing_invoked_command_is_loaded(
+    get_builtin_plugin_spec_mock, get_all_plugin_specs_mock, runner
+):
+    result = runner.invoke(["sql", "--help"])
+
+    assert result.exit_code == 0
+    assert result.output.count("Executes Snowflake query") == 1
+    get_builtin_plugin_spec_mock.assert_called_once_with("sql")
+    get_all_plugin_specs_mock.assert_not_called()
+
+
+@mock.patch(
+    "snowflake.cli.app.commands_registration.builtin_plugins.get_builtin_plugin_spec",
+    wraps=get_builtin_plugin_spec,
+)
+def test_all_plugins_are_loaded_for_unknown_command(
+    get_builtin_plugin_spec_mock, runner
+):
+    result = runner.invoke(["xyz123"])
+
+    assert result.exit_code == 2
+    assert "No such command 'xyz123'" in result.output
+    assert get_builtin_plugin_spec_mock.call_count > 1
+
+
+@pytest.mark.parametrize(
+    "args, expected_command_name",
+    [
+        (["sql", "-q", "select 1"], "sql"),
+        (["--config-file", "object", "object", "list"], "object"),
+        (["--config-file=config.toml", "--debug", "app", "run"], "app"),
+        (["--info", "spcs"], "spcs"),
+        (["--help"], None),
+        ([], None),
+    ],
+)
+def test_find_invoked_top_level_command_name(args, expected_command_name):
+    main_command = get_command(app_factory())
+    ctx = click.Context(main_command)
+    ctx.meta[RAW_ARGS_CONTEXT_META_KEY] = args
+
+    assert find_invoked_top_level_command_name(ctx) == expected_command_name
@@ -25,9 +25,18 @@ _KNOWN_SIG_GLOBAL_PARAMETERS_WITH_CONNECTION = [
     "verbose",
     "debug",
     "silent",
+    "trace_queries",
+    "trace_queries_file",
 ]
 
-_KNOWN_SIG_GLOBAL_PARAMETERS = ["format", "verbose", "debug", "silent"]
+_KNOWN_SIG_GLOBAL_PARAMETERS = [
+    "format",
+    "verbose",
+    "debug",
+    "silent",
+    "trace_queries",
+    "trace_queries_file",
+]
 
 
 def _extract_arguments(func):
@@ -281,3 +281,48 @@ def test_no_error_when_init_from_non_default_config(
     connections_path.chmod(0o777)
 
     config_init(test_snowcli_config)
+
+
+def test_config_file_is_parsed_again_only_if_changed(snowflake_home: Path):
+    from snowflake.cli.api.config import CONFIG_MANAGER, get_config_value
+
+    config_path = snowflake_home / "custom_config.toml"
+    config_path.write_text('[connections.dev]\naccount = "first"\n')
+
+    with mock.patch.object(
+        CONFIG_MANAGER, "read_config", wraps=CONFIG_MANAGER.read_config
+    ) as read_config:
+        config_init(config_path)
+        config_init(config_path)
+        assert read_config.call_count == 1
+        assert get_config_value("connections", "dev", key="account") == "first"
+
+        config_path.write_text('[connections.dev]\naccount = "second_one"\n')
+        config_init(config_path)
+        assert read_config.call_count == 2
+        assert get_config_value("connections", "dev", key="account") == "second_one"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_set_config_value_is_visible_without_reading_file(snowflake_home: Path):
+    from snowflake.cli.api.config import (
+        CONFIG_MANAGER,
+        get_config_value,
+        set_config_value,
+    )
+
+    config_path = snowflake_home / "custom_config.toml"
+    config_path.write_text('[connections.dev]\naccount = "dev_account"\n')
+    config_init(config_path)
+
+    with mock.patch.object(
+        CONFIG_MANAGER, "read_config", wraps=CONFIG_MANAGER.read_config
+    ) as read_config:
+        set_config_value("connections", "prod", {"account": "prod_account"})
+        assert get_config_value("connections", "prod", key="account") == (
+            "prod_account"
+        )
+        config_init(config_path)
+        read_config.assert_not_called()
+
+    assert 'account = "prod_account"' in config_path.read_text()
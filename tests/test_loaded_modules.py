@@ -2,12 +2,40 @@ import sys
 
 import pytest
 
+from tests.testing_utils.import_profiler import (
+    BENCHMARKED_COMMANDS,
+    profile_command_imports,
+)
+
+# heavy modules which must not be imported while executing given command
+SHOULD_NOT_LOAD = {
+    "sql": {"git", "jinja2", "pydantic", "requests", "yaml"},
+    "object list": {"git", "jinja2", "pydantic", "requests", "yaml"},
+    "snowpark build": {"git", "jinja2", "requests", "yaml"},
+    "app run": {"git", "jinja2", "requests", "yaml"},
+    "spcs service logs": {"git", "jinja2", "pydantic", "requests", "yaml"},
+}
+
 
 @pytest.mark.loaded_modules
 def test_loaded_modules(runner):
-    should_not_load = {"git"}
+    should_not_load = {"git", "jinja2", "requests", "yaml"}
 
     runner.invoke(["sql", "-q", "select 1"])
 
     loaded_modules = sys.modules.keys()
     assert loaded_modules.isdisjoint(should_not_load)
+
+
+@pytest.mark.loaded_modules
+@pytest.mark.parametrize("command_name", BENCHMARKED_COMMANDS.keys())
+def test_heavy_modules_not_loaded_by_command(command_name):
+    profile = profile_command_imports(BENCHMARKED_COMMANDS[command_name] + ["--help"])
+
+    loaded_heavy_modules = {
+        module for module in SHOULD_NOT_LOAD[command_name] if profile.contains(module)
+    }
+    assert not loaded_heavy_modules, (
+        f"Command [{command_name}] imports {sorted(loaded_heavy_modules)}. "
+        f"Slowest imports: {[m.name for m in profile.slowest()]}"
+    )
@@ -3,8 +3,18 @@ from timeit import default_timer as timer
 
 import pytest
 
+from tests.testing_utils.import_profiler import (
+    BENCHMARKED_COMMANDS,
+    load_baseline,
+    parse_importtime_report,
+    profile_command_imports,
+    relative_import_time,
+)
+
 SAMPLE_AMOUNT = 20
 EXECUTION_TIME_THRESHOLD = 1.3
+# allowed import time regression against baseline, in percent
+IMPORT_TIME_REGRESSION_THRESHOLD = 20
 
 
 @pytest.mark.performance
@@ -18,3 +28,54 @@ def test_snow_help_performance():
 
     results.sort()
     assert results[int(SAMPLE_AMOUNT * 0.9)] <= EXECUTION_TIME_THRESHOLD
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("command_name", BENCHMARKED_COMMANDS.keys())
+def test_import_time_does_not_regress(command_name):
+    baseline = load_baseline()[command_name]["relative_import_time"]
+
+    import_time = relative_import_time(BENCHMARKED_COMMANDS[command_name] + ["--help"])
+
+    assert import_time <= baseline * (1 + IMPORT_TIME_REGRESSION_THRESHOLD / 100), (
+        f"Import time of [{command_name}] regressed: {import_time:.2f} times "
+        f"the interpreter startup against baseline {baseline:.2f}. "
+        "Run 'python -m tests.testing_utils.import_profiler' to update baseline "
+        "if the regression is expected."
+    )
+
+
+@pytest.mark.parametrize("command_name", BENCHMARKED_COMMANDS.keys())
+def test_commands_import_only_their_plugins(command_name):
+    baseline = set(load_baseline()[command_name]["cli_plugins"])
+
+    profile = profile_command_imports(BENCHMARKED_COMMANDS[command_name] + ["--help"])
+
+    assert profile.cli_plugins <= baseline, (
+        f"[{command_name}] imports plugins {sorted(profile.cli_plugins - baseline)} "
+        "not imported before."
+    )
+
+
+def test_parse_importtime_report():
+    report = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |   _io",
+            "import time:        20 |         20 |     json.decoder",
+            "import time:        30 |         50 |   json",
+            "import time:        40 |         90 | snowflake.cli",
+            "some other stderr output",
+        ]
+    )
+
+    profile = parse_importtime_report(report)
+
+    assert set(profile.modules) == {"_io", "json.decoder", "json", "snowflake.cli"}
+    assert profile.modules["json.decoder"].level == 2
+    assert profile.modules["snowflake.cli"].level == 0
+    assert profile.total_us == 90
+    assert profile.contains("json")
+    assert not profile.contains("js")
+    assert profile.top_level_packages == {"_io", "json", "snowflake"}
+    assert profile.slowest(1)[0].name == "_io"
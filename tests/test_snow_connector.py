@@ -1,7 +1,11 @@
 import os
+import time
 from unittest import mock
 
 import pytest
+from snowflake.cli.api.secure_path import SecurePath
+
+from tests.testing_utils.files_and_dirs import assert_file_permissions_are_strict
 
 
 # Used as a solution to syrupy having some problems with comparing multilines string
@@ -71,3 +75,205 @@ def test_no_output_from_connection(mock_connect, runner):
 
     result = runner.invoke(["sql", "-q", "select 1"])
     assert funny_text not in result.output
+
+
+class _FakeCursor:
+    """Executes statements against the state of a fake session"""
+
+    def __init__(self, state: dict, executed: list):
+        self._state = state
+        self._executed = executed
+        self._row = None
+
+    def execute(self, statement: str):
+        self._executed.append(statement)
+        if statement.startswith("select current_role()"):
+            self._row = tuple(
+                self._state[kind]
+                for kind in ("role", "warehouse", "database", "schema")
+            )
+        elif statement.startswith("use "):
+            _, kind, name = statement.split(" ", 2)
+            name = name.split(".")[-1].strip('"')
+            self._state[kind] = name
+            if kind == "database":
+                self._state["schema"] = "PUBLIC"
+        return self
+
+    def fetchone(self):
+        return self._row
+
+
+class _FakeAuthenticator:
+    """Fakes snowflake.connector.connect, logging in only if no tokens are given"""
+
+    def __init__(self):
+        self.logins = 0
+        self.resumed_sessions = 0
+        self.valid_session_tokens = set()
+        self.sessions = {}
+        self.executed = []
+        self.ended_sessions = []
+
+    def connect(self, **kwargs):
+        from snowflake.connector.errors import ProgrammingError
+
+        if "session_token" in kwargs:
+            if kwargs["session_token"] not in self.valid_session_tokens:
+                raise ProgrammingError("Session and master tokens invalid")
+            self.resumed_sessions += 1
+            session_token = kwargs["session_token"]
+        else:
+            self.logins += 1
+            session_token = f"session_token_{self.logins}"
+            self.valid_session_tokens.add(session_token)
+            self.sessions[session_token] = {
+                "role": kwargs.get("role", "PUBLIC"),
+                "warehouse": kwargs.get("warehouse"),
+                "database": kwargs.get("database"),
+                "schema": kwargs.get("schema"),
+            }
+
+        connection = mock.MagicMock()
+        connection.rest.token = session_token
+        connection.rest.master_token = "master_token"
+        connection.rest.master_validity_in_seconds = 14400
+        connection.rest.delete_session.side_effect = lambda: self.ended_sessions.append(
+            session_token
+        )
+        connection.cursor.side_effect = lambda: _FakeCursor(
+            self.sessions[session_token], self.executed
+        )
+        return connection
+
+
+@pytest.fixture
+def fake_authenticator(test_snowcli_config, tmp_path):
+    from snowflake.cli.api.config import config_init
+
+    config_init(test_snowcli_config)
+    authenticator = _FakeAuthenticator()
+    with mock.patch(
+        "snowflake.connector.connect", side_effect=authenticator.connect
+    ), mock.patch(
+        "snowflake.cli.app.session_cache.session_cache_directory",
+        return_value=SecurePath(tmp_path / "session_cache"),
+    ), mock.patch(
+        "snowflake.cli.app.snow_connector.command_info", return_value="SNOWCLI"
+    ), mock.patch.dict(
+        os.environ, {"SNOWFLAKE_CLI_FEATURES_ENABLE_SESSION_CACHE": "true"}
+    ):
+        yield authenticator
+
+
+def test_cached_session_is_resumed_without_login(fake_authenticator, tmp_path):
+    from snowflake.cli.app.snow_connector import connect_to_snowflake
+
+    connect_to_snowflake()
+    connect_to_snowflake()
+
+    assert fake_authenticator.logins == 1
+    assert fake_authenticator.resumed_sessions == 1
+    (session_file,) = (tmp_path / "session_cache").glob("*.json")
+    assert_file_permissions_are_strict(session_file)
+    assert_file_permissions_are_strict(tmp_path / "session_cache" / "cache.key")
+
+
+def test_session_cache_key_depends_on_installation_key(fake_authenticator, tmp_path):
+    from snowflake.cli.app.session_cache import session_cache_key
+
+    parameters = {"account": "a", "user": "u", "password": "secret"}
+    key = session_cache_key(parameters)
+    assert session_cache_key(parameters) == key
+    assert session_cache_key({**parameters, "password": "other"}) != key
+
+    (tmp_path / "session_cache" / "cache.key").unlink()
+    assert session_cache_key(parameters) != key
+
+
+def test_cached_session_is_not_shared_between_connections(fake_authenticator):
+    from snowflake.cli.app.snow_connector import connect_to_snowflake
+
+    connect_to_snowflake()
+    connect_to_snowflake(connection_name="full")
+
+    assert fake_authenticator.logins == 2
+    assert fake_authenticator.resumed_sessions == 0
+
+
+def test_login_if_cached_session_is_invalid(fake_authenticator):
+    from snowflake.cli.app.snow_connector import connect_to_snowflake
+
+    connect_to_snowflake()
+    fake_authenticator.valid_session_tokens.clear()
+
+    connection = connect_to_snowflake()
+    connect_to_snowflake()
+
+    assert fake_authenticator.logins == 2
+    assert fake_authenticator.resumed_sessions == 1
+    assert connection.rest.token == "session_token_2"
+
+
+def test_login_if_cached_session_expired(fake_authenticator):
+    from snowflake.cli.app.snow_connector import connect_to_snowflake
+
+    connect_to_snowflake()
+    with mock.patch("time.time", return_value=time.time() + 14400):
+        connect_to_snowflake()
+
+    assert fake_authenticator.logins == 2
+    assert fake_authenticator.resumed_sessions == 0
+
+
+def test_resumed_session_is_switched_back_to_configured_objects(fake_authenticator):
+    from snowflake.cli.app.snow_connector import connect_to_snowflake
+
+    connection = connect_to_snowflake(database="db", schema="test")
+    connection.cursor().execute('use database "OTHER"')
+
+    connection = connect_to_snowflake(database="db", schema="test")
+
+    assert fake_authenticator.logins == 1
+    assert fake_authenticator.resumed_sessions == 1
+    assert fake_authenticator.executed[-2:] == [
+        'use database "db"',
+        'use schema "db"."test"',
+    ]
+    assert fake_authenticator.sessions[connection.rest.token]["database"] == "db"
+
+
+def test_login_if_resumed_session_cannot_be_restored(fake_authenticator):
+    from snowflake.cli.app.snow_connector import connect_to_snowflake
+
+    # a session started without a database cannot be switched back to none
+    connection = connect_to_snowflake(connection_name="empty")
+    connection.cursor().execute('use database "OTHER"')
+    connect_to_snowflake(connection_name="empty")
+
+    assert fake_authenticator.logins == 2
+    assert fake_authenticator.resumed_sessions == 1
+    assert fake_authenticator.ended_sessions == ["session_token_1"]
+
+
+def test_resumed_session_sets_session_parameters_again(fake_authenticator):
+    from snowflake.cli.app.session_cache import (
+        CachedSession,
+        restore_session_context,
+    )
+
+    connection = fake_authenticator.connect()
+    session = CachedSession(
+        "token",
+        "master_token",
+        14400,
+        0,
+        context=dict(role="PUBLIC", warehouse=None, database=None, schema=None),
+    )
+
+    assert restore_session_context(
+        connection, session, {"QUERY_TAG": "it's", "AUTOCOMMIT": False}
+    )
+    assert fake_authenticator.executed[-1] == (
+        "alter session set QUERY_TAG = 'it\\'s' AUTOCOMMIT = FALSE"
+    )
@@ -1,11 +1,14 @@
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from textwrap import dedent
+from typing import Dict, List, Optional
 from unittest import mock
 
 import pytest
 from snowflake.cli.api.exceptions import SnowflakeSQLExecutionError
 from snowflake.cli.api.project.util import identifier_to_show_like_pattern
 from snowflake.cli.api.sql_execution import SqlExecutionMixin
+from snowflake.cli.plugins.sql.manager import SqlManager
 from snowflake.connector.cursor import DictCursor
 from snowflake.connector.errors import ProgrammingError
 
@@ -253,3 +256,149 @@ def test_show_specific_object_multiple_rows(mock_execute_query):
     mock_execute_query.assert_called_once_with(
         r"show objects like 'NAME'", cursor_class=DictCursor
     )
+
+
+class _FakeAsyncConnection:
+    """
+    Executes queries asynchronously, each of them finishes after [polls] checks,
+    except the failing query, which fails after the first check
+    """
+
+    def __init__(self, polls: int = 1, failing_query: Optional[str] = None):
+        self.polls = polls
+        self.failing_query = failing_query
+        self.events: List[str] = []
+        self.remaining_polls: Dict[str, int] = {}
+        self.queries: Dict[str, str] = {}
+        self.max_running_queries = 0
+
+    def cursor(self):
+        connection = self
+        cursor = mock.MagicMock()
+
+        def _execute(query):
+            connection.events.append(f"execute {query}")
+            cursor.query = query
+
+        def _execute_async(query):
+            connection.events.append(f"submit {query}")
+            cursor.query = query
+            cursor.sfqid = f"qid_{len(connection.queries)}"
+            connection.queries[cursor.sfqid] = query
+            connection.remaining_polls[cursor.sfqid] = (
+                1 if query == connection.failing_query else connection.polls
+            )
+            connection.max_running_queries = max(
+                connection.max_running_queries,
+                len([p for p in connection.remaining_polls.values() if p > 0]),
+            )
+
+        def _abort_query(qid):
+            connection.events.append(f"abort {connection.queries[qid]}")
+
+        cursor.execute.side_effect = _execute
+        cursor.execute_async.side_effect = _execute_async
+        cursor.abort_query.side_effect = _abort_query
+        return cursor
+
+    def get_query_status(self, qid):
+        self.remaining_polls[qid] = max(self.remaining_polls[qid] - 1, 0)
+        return self.remaining_polls[qid]
+
+    def get_query_status_throw_if_error(self, qid):
+        if self.queries[qid] == self.failing_query:
+            raise ProgrammingError(f"{self.failing_query} failed")
+        return self.remaining_polls[qid]
+
+    @staticmethod
+    def is_still_running(remaining_polls):
+        return remaining_polls > 0
+
+
+@pytest.fixture
+def fake_async_connection():
+    def _connection(**kwargs):
+        connection = _FakeAsyncConnection(**kwargs)
+        patch = mock.patch(
+            "snowflake.cli.plugins.sql.manager.SqlManager._conn",
+            new_callable=mock.PropertyMock,
+            return_value=connection,
+        )
+        patch.start()
+        return connection
+
+    yield _connection
+    mock.patch.stopall()
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.time.sleep")
+def test_sql_parallel_returns_results_in_order(_, fake_async_connection):
+    connection = fake_async_connection(polls=2)
+    query = "select 1; select 2; select 3; select 4; select 5;"
+
+    single_statement, cursors = SqlManager().execute(query, None, False, parallel=2)
+
+    assert not single_statement
+    assert [c.query for c in cursors] == [f"select {i};" for i in range(1, 6)]
+    assert connection.max_running_queries == 2
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.time.sleep")
+def test_sql_parallel_waits_for_previous_statements_before_barriers(
+    _, fake_async_connection
+):
+    connection = fake_async_connection()
+    query = dedent(
+        """\
+        select 1;
+        use role other_role;
+        select 2;
+        begin;
+        insert into t values (1);
+        commit;
+        select 3;
+        select 4;
+        """
+    )
+
+    _, cursors = SqlManager().execute(query, None, False, parallel=4)
+    results = [c.query for c in cursors]
+
+    assert len(results) == 8
+    assert connection.events == [
+        "submit select 1;",
+        "execute use role other_role;",
+        "submit select 2;",
+        "execute begin;",
+        "execute insert into t values (1);",
+        "execute commit;",
+        "submit select 3;",
+        "submit select 4;",
+    ]
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.time.sleep")
+def test_sql_parallel_raises_errors_in_order(_, fake_async_connection):
+    connection = fake_async_connection(polls=3, failing_query="select 2;")
+    query = "select 1; select 2; select 3;"
+
+    _, cursors = SqlManager().execute(query, None, False, parallel=3)
+    results = []
+    with pytest.raises(ProgrammingError, match="select 2; failed"):
+        for cursor in cursors:
+            results.append(cursor.query)
+
+    assert results == ["select 1;"]
+    assert "abort select 1;" not in connection.events
+
+
+@mock.patch("snowflake.cli.plugins.sql.manager.SqlExecutionMixin._execute_string")
+def test_sql_parallel_is_not_used_for_single_statement(
+    mock_execute, runner, mock_cursor
+):
+    mock_execute.return_value = (mock_cursor(["row"], []) for _ in range(1))
+
+    result = runner.invoke(["sql", "-q", "select 1", "--parallel", "4"])
+
+    assert result.exit_code == 0
+    mock_execute.assert_called_once_with("select 1")
@@ -1,8 +1,14 @@
 import os
 from pathlib import Path
-from zipfile import ZipFile
+from unittest import mock
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
-from snowflake.cli.plugins.snowpark.zipper import add_file_to_existing_zip, zip_dir
+from snowflake.cli.plugins.snowpark.zipper import (
+    add_file_to_existing_zip,
+    append_zip,
+    tree_digest,
+    zip_dir,
+)
 
 
 def test_zip_current_dir(temp_dir):
@@ -62,3 +68,90 @@ def test_add_file_to_existing_zip(
     zip_file = ZipFile(app_zip)
 
     assert os.path.basename(correct_requirements_snowflake_txt) in zip_file.namelist()
+
+
+def test_zip_is_reproducible(temp_dir):
+    files = {"b.py": "print('b')", "a/module.py": "x = 1" * 100, "a/c.txt": ""}
+    for name, content in files.items():
+        Path(name).parent.mkdir(parents=True, exist_ok=True)
+        Path(name).write_text(content)
+
+    zip_dir(source=Path("a"), dest_zip=Path("first.zip"))
+    for name in files:
+        os.utime(name, (1_600_000_000, 1_600_000_000))
+    zip_dir(source=Path("a"), dest_zip=Path("second.zip"))
+
+    assert Path("first.zip").read_bytes() == Path("second.zip").read_bytes()
+    assert ZipFile("first.zip").namelist() == ["c.txt", "module.py"]
+
+
+def test_zip_compression_levels(temp_dir):
+    Path("src").mkdir()
+    Path("src/module.py").write_text("x = 1\n" * 1000)
+    Path("src/package.whl").write_text("x = 1\n" * 1000)
+
+    zip_dir(source=Path("src"), dest_zip=Path("deflated.zip"))
+    zip_dir(source=Path("src"), dest_zip=Path("stored.zip"), compression_level=0)
+
+    deflated = {i.filename: i for i in ZipFile("deflated.zip").infolist()}
+    assert deflated["module.py"].compress_type == ZIP_DEFLATED
+    assert deflated["package.whl"].compress_type == ZIP_STORED
+    stored = ZipFile("stored.zip")
+    assert {i.compress_type for i in stored.infolist()} == {ZIP_STORED}
+    assert stored.testzip() is None
+    assert stored.read("module.py") == ZipFile("deflated.zip").read("module.py")
+
+
+def test_zip_dir_appends_to_existing_zip(temp_dir):
+    for name in ["src/app.py", ".packages/dependency/__init__.py"]:
+        Path(name).parent.mkdir(parents=True, exist_ok=True)
+        Path(name).write_text(name)
+
+    zip_dir(source=Path("src"), dest_zip=Path("app.zip"))
+    zip_dir(source=Path(".packages"), dest_zip=Path("app.zip"), mode="a")
+
+    zip_file = ZipFile("app.zip")
+    assert zip_file.testzip() is None
+    assert zip_file.namelist() == ["app.py", "dependency/__init__.py"]
+    assert (
+        zip_file.read("dependency/__init__.py") == b".packages/dependency/__init__.py"
+    )
+
+
+@mock.patch("snowflake.cli.plugins.snowpark.zipper.MAX_IN_MEMORY_FILE_SIZE", 10)
+def test_zip_streams_large_files(temp_dir):
+    Path("src").mkdir()
+    Path("src/large.py").write_text("x = 1\n" * 100)
+
+    zip_dir(source=Path("src"), dest_zip=Path("app.zip"))
+
+    assert ZipFile("app.zip").read("large.py") == b"x = 1\n" * 100
+
+
+@mock.patch("snowflake.cli.plugins.snowpark.zipper.MAX_IN_MEMORY_FILE_SIZE", 10)
+def test_append_zip_gives_same_archive_as_zip_dir(temp_dir):
+    for name in ["src/app.py", ".packages/dependency/__init__.py"]:
+        Path(name).parent.mkdir(parents=True, exist_ok=True)
+        Path(name).write_text(name * 10)
+    zip_dir(source=Path("src"), dest_zip=Path("direct.zip"))
+    zip_dir(source=Path(".packages"), dest_zip=Path("direct.zip"), mode="a")
+    zip_dir(source=Path("src"), dest_zip=Path("appended.zip"))
+    zip_dir(source=Path(".packages"), dest_zip=Path("layer.zip"))
+
+    append_zip(source_zip=Path("layer.zip"), dest_zip=Path("appended.zip"))
+
+    assert ZipFile("appended.zip").testzip() is None
+    assert Path("appended.zip").read_bytes() == Path("direct.zip").read_bytes()
+
+
+def test_tree_digest_tracks_content_of_zipped_files(temp_dir):
+    Path("src").mkdir()
+    Path("src/app.py").write_text("print(1)")
+    digest = tree_digest(Path("src"))
+
+    Path("src/__pycache__").mkdir()
+    Path("src/__pycache__/app.pyc").write_text("ignored")
+    assert tree_digest(Path("src")) == digest
+
+    Path("src/app.py").write_text("print(2)")
+    assert tree_digest(Path("src")) != digest
@@ -11,7 +11,6 @@ from typing import Generator, List, NamedTuple, Optional, Union
 from unittest import mock
 
 import pytest
-import yaml
 from snowflake.cli.api.project.definition import merge_left
 from snowflake.cli.app.cli_app import app_factory
 from snowflake.connector.cursor import SnowflakeCursor
@@ -249,6 +248,8 @@ def project_directory(temp_dir, test_root_path):
         test_data_file = test_root_path / "test_data" / "projects" / project_name
         shutil.copytree(test_data_file, temp_dir, dirs_exist_ok=True)
         if merge_project_definition:
+            import yaml
+
             project_definition = yaml.load(
                 Path("snowflake.yml").read_text(), Loader=yaml.BaseLoader
             )
@@ -0,0 +1,156 @@
+"""
+Import time profiler of Snowflake CLI commands.
+
+Runs a command in a fresh interpreter with "-X importtime" and parses
+its report. Baselines are stored in tests/test_data/import_time_baseline.json
+and can be refreshed with "python -m tests.testing_utils.import_profiler".
+
+Absolute timings depend on the machine, so baselines hold import time of each
+command relative to startup of a bare interpreter, and the CLI plugins it imports.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Set
+
+BASELINE_PATH = Path(__file__).parent.parent / "test_data" / "import_time_baseline.json"
+SAMPLE_AMOUNT = 10
+
+# command paths benchmarked by default, "--help" is appended to each of them
+# to measure startup without connecting to Snowflake
+BENCHMARKED_COMMANDS: Dict[str, List[str]] = {
+    "sql": ["sql"],
+    "object list": ["object", "list"],
+    "snowpark build": ["snowpark", "build"],
+    "app run": ["app", "run"],
+    "spcs service logs": ["spcs", "service", "logs"],
+}
+
+_RUN_SNOW_SCRIPT = """
+import sys
+from snowflake.cli.app.__main__ import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+"""
+
+
+@dataclass
+class ImportedModule:
+    name: str
+    self_us: int
+    cumulative_us: int
+    level: int
+
+
+@dataclass
+class ImportProfile:
+    modules: Dict[str, ImportedModule] = field(default_factory=dict)
+
+    @property
+    def total_us(self) -> int:
+        return sum(m.cumulative_us for m in self.modules.values() if m.level == 0)
+
+    @property
+    def top_level_packages(self) -> Set[str]:
+        return {name.split(".")[0] for name in self.modules}
+
+    @property
+    def cli_plugins(self) -> Set[str]:
+        return {
+            name.split(".")[3]
+            for name in self.modules
+            if name.startswith("snowflake.cli.plugins.") and name.count(".") >= 3
+        }
+
+    def contains(self, module_name: str) -> bool:
+        return any(
+            name == module_name or name.startswith(module_name + ".")
+            for name in self.modules
+        )
+
+    def slowest(self, amount: int = 10) -> List[ImportedModule]:
+        return sorted(self.modules.values(), key=lambda m: -m.self_us)[:amount]
+
+
+def parse_importtime_report(report: str) -> ImportProfile:
+    """
+    Parses lines in format "import time: <self> | <cumulative> | <indented name>".
+    """
+    profile = ImportProfile()
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # header line
+            continue
+        stripped_name = name.lstrip()
+        level = (len(name) - len(stripped_name) - 1) // 2
+        profile.modules[stripped_name.strip()] = ImportedModule(
+            name=stripped_name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            level=level,
+        )
+    return profile
+
+
+def _profile_script_imports(script: str, args: List[str]) -> ImportProfile:
+    # executed outside of the repository, so its files do not affect imports
+    with tempfile.TemporaryDirectory() as working_directory:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script, *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            cwd=working_directory,
+        )
+    return parse_importtime_report(result.stderr)
+
+
+def profile_command_imports(command: List[str]) -> ImportProfile:
+    return _profile_script_imports(_RUN_SNOW_SCRIPT, command)
+
+
+def relative_import_time(command: List[str], samples: int = SAMPLE_AMOUNT) -> float:
+    """
+    Returns import time of the command relative to import time of a bare
+    interpreter, as in "python -c pass". Samples of both are interleaved and
+    the fastest ones compared, so load of the machine affects both alike.
+    """
+    interpreter_us, command_us = [], []
+    for _ in range(samples):
+        interpreter_us.append(_profile_script_imports("pass", []).total_us)
+        command_us.append(profile_command_imports(command).total_us)
+    return min(command_us) / min(interpreter_us)
+
+
+def load_baseline() -> Dict[str, dict]:
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def update_baseline():
+    baseline = {
+        name: {
+            "relative_import_time": round(
+                relative_import_time(command + ["--help"]), 2
+            ),
+            "cli_plugins": sorted(
+                profile_command_imports(command + ["--help"]).cli_plugins
+            ),
+        }
+        for name, command in BENCHMARKED_COMMANDS.items()
+    }
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    update_baseline()